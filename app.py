@@ -2,10 +2,16 @@
 Streamlit Job Scraper App for German Job Portals
 """
 import streamlit as st
+import numpy as np
 import pandas as pd
-from scrapers import scrape_all_portals
+from job_store import DEFAULT_JOB_STORE
+from search_queue import DEFAULT_SEARCH_QUEUE
+from prewarm import DEFAULT_LOCATION, DEFAULT_MAX_PAGES, DEFAULT_PORTALS, DEFAULT_PREWARMER, QUICK_SEARCHES
 from sample_data import get_sample_jobs
-from datetime import datetime, timedelta
+from job_table import JobTable, result_hash
+from ranking import relevance_scores, top_k
+from datetime import datetime
+import sqlite3
 import time
 
 
@@ -59,9 +65,129 @@ if 'show_debug' not in st.session_state:
     st.session_state.show_debug = False
 if 'selected_quick_search' not in st.session_state:
     st.session_state.selected_quick_search = ""
+if 'search_id' not in st.session_state:
+    st.session_state.search_id = None
+if 'search_keywords' not in st.session_state:
+    st.session_state.search_keywords = ""
+
+# Seconds between refreshes of the page while a search is still running
+LIVE_REFRESH_SECONDS = 1.0
+
+# Job table view: pixel height of a row and of the whole table (it scrolls beyond that)
+TABLE_ROW_HEIGHT = 35
+TABLE_MAX_HEIGHT = 700
+
+# Filter choices mapped to JobTable.mask() arguments
+SALARY_FILTERS = {"All Jobs": None, "With Salary Info Only": True, "Without Salary Info": False}
+POSTING_AGE_FILTERS = {
+    "All Jobs": None,
+    "Last 24 Hours": 1,
+    "Last 3 Days": 3,
+    "Last 7 Days": 7,
+    "Last 14 Days": 14,
+    "Last 30 Days": 30
+}
+# Session state keys of the multiselect filters and the JobTable.mask() argument they fill
+FACET_FILTERS = {
+    'company_filter': 'companies',
+    'location_filter': 'locations',
+    'portal_filter': 'portals',
+    'level_filter': 'levels',
+    'skill_filter': 'skills'
+}
+
+
+def sticky_multiselect(label: str, options, state_key: str, counts=None):
+    """
+    Multiselect whose selection survives its options changing while live results come in
+
+    Args:
+        counts: Number of matching jobs per option, shown next to it
+    """
+    widget_key = f'{state_key}_widget'
+
+    def remember_selection():
+        # Runs before the rerun, so the filters of this run already include the change
+        st.session_state[state_key] = st.session_state[widget_key]
+
+    selected = st.session_state.get(state_key, [])
+    selected = st.multiselect(
+        label,
+        options=sorted(set(options) | set(selected)),
+        default=selected,
+        format_func=(lambda option: f"{option} ({counts.get(option, 0)})") if counts is not None else str,
+        key=widget_key,
+        on_change=remember_selection
+    )
+    st.session_state[state_key] = selected
+    return selected
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def shared_job_table(results: str, _jobs) -> JobTable:
+    """Job table and facet index of a result set, shared by every session showing the same results"""
+    return JobTable(_jobs)
+
+
+def job_table(jobs) -> JobTable:
+    """Job table of the jobs, looked up again only when the job list changes (not on every filter change)"""
+    if st.session_state.get('job_table_jobs') is not jobs:
+        st.session_state.job_table_hash = result_hash(jobs)
+        st.session_state.job_table = shared_job_table(st.session_state.job_table_hash, jobs)
+        st.session_state.job_table_jobs = jobs
+    return st.session_state.job_table
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def text_relevance(text: str, results: str, _table: JobTable) -> np.ndarray:
+    """Full-text relevance of the jobs of a result set to a query, NaN for jobs not matching it"""
+    # Only the jobs shown are searched, not the whole store; jobs the store
+    # does not have are matched in memory
+    try:
+        scores = DEFAULT_JOB_STORE.search_keys(text, keys=_table.keys)
+    except sqlite3.Error:
+        scores = {}
+    return _table.text_relevance(text, scores)
+
+
+def ranking_scores(table: JobTable, keywords: str):
+    """Relevance of the jobs to the search keywords, computed once per job table"""
+    ranking = st.session_state.get('ranking')
+    if ranking is None or ranking[0] is not table or ranking[1] != keywords:
+        ranking = st.session_state.ranking = (table, keywords, relevance_scores(table, keywords))
+    return ranking[2]
+
+
+def current_filters(table: JobTable):
+    """
+    JobTable.mask() arguments of the filter selections in session state
+
+    Returns:
+        Tuple of (mask() arguments, full-text relevance per job or None without a text query)
+    """
+    filters = {argument: st.session_state.get(state_key, []) for state_key, argument in FACET_FILTERS.items()}
+    filters['has_salary'] = SALARY_FILTERS[st.session_state.get('salary_filter', "All Jobs")]
+    filters['posted_within_days'] = POSTING_AGE_FILTERS[st.session_state.get('posting_age_filter', "All Jobs")]
+
+    relevance = None
+    text = st.session_state.get('text_filter', '').strip()
+    if text:
+        relevance = text_relevance(text, st.session_state.job_table_hash, table)
+        filters['within'] = ~np.isnan(relevance)
+    return filters, relevance
+
+
+def announce_results(jobs):
+    if len(jobs) > 0:
+        st.success(f"Found {len(jobs)} jobs!")
+    else:
+        st.warning("No jobs found. Enable 'Show Debug Info' to see details about what happened.")
 
 
 def main():
+    # Keep the Quick Search results fresh in the background (no-op once running)
+    DEFAULT_PREWARMER.start()
+
     # Header
     st.markdown('<h1 class="main-header">🇩🇪 German Job Portal Scanner</h1>', unsafe_allow_html=True)
     st.markdown("**Search StepStone.de and XING Jobs**")
@@ -89,21 +215,10 @@ def main():
 
         # Quick search buttons for common roles
         st.subheader("🎯 Quick Search")
-        quick_searches = {
-            "Electrical Engineer": "Electrical Engineer",
-            "Software Engineer": "Software Engineer",
-            "Software Test Eng.": "Software Test Engineer",
-            "SW Automation": "Software Automation",
-            "Automation Eng.": "Automation Engineer",
-            "Data Analyst": "Data Analyst",
-            "Data Science": "Data Science",
-            "AI": "AI",
-            "ML": "Machine Learning"
-        }
 
         # Create a 3-column layout for buttons
         cols = st.columns(3)
-        for idx, (display_name, search_term) in enumerate(quick_searches.items()):
+        for idx, (display_name, search_term) in enumerate(QUICK_SEARCHES.items()):
             col_idx = idx % 3
             with cols[col_idx]:
                 if st.button(display_name, key=f"quick_{idx}", use_container_width=True):
@@ -122,7 +237,7 @@ def main():
 
         location = st.text_input(
             "Location",
-            value="Berlin",
+            value=DEFAULT_LOCATION,
             placeholder="e.g., Berlin, Munich, Hamburg",
             help="Enter city or region in Germany"
         )
@@ -137,7 +252,7 @@ def main():
             "Maximum Pages per Portal",
             min_value=1,
             max_value=100,
-            value=5,
+            value=DEFAULT_MAX_PAGES,
             help="Number of pages to scrape from each portal. More pages = more jobs but slower search. Max: 100 pages"
         )
 
@@ -145,9 +260,8 @@ def main():
         st.subheader("Job Portals")
 
         # Only StepStone and XING - both checked by default
-        available_portals = ["StepStone.de", "XING Jobs"]
         portals = {}
-        for portal in available_portals:
+        for portal in DEFAULT_PORTALS:
             portals[portal] = st.checkbox(portal, value=True)
 
         selected_portals = [portal for portal, selected in portals.items() if selected]
@@ -171,7 +285,15 @@ def main():
             elif not selected_portals:
                 st.error("Please select at least one job portal!")
             else:
-                with st.spinner("Scanning job portals... This may take a moment."):
+                st.session_state.search_id = None
+                st.session_state.current_page = 1
+                for state_key in FACET_FILTERS:
+                    st.session_state.pop(state_key, None)
+                    st.session_state.pop(f'{state_key}_widget', None)
+                st.session_state.pop('text_filter', None)
+                st.session_state.search_keywords = keywords
+
+                with st.spinner("Starting search..."):
                     try:
                         if test_mode:
                             # Use sample data
@@ -186,25 +308,27 @@ def main():
                                 }
                             }
                             st.info("Test mode: Using sample data instead of scraping real portals")
+                            announce_results(jobs)
                         else:
-                            # Real scraping
+                            # Real scraping by the background search workers; results are shown
+                            # as pages are parsed (identical searches of other sessions are shared
+                            # and repeated searches are served from the result cache)
                             job_type_param = "" if job_type == "Any" else job_type
-                            jobs, debug_info = scrape_all_portals(
+                            st.session_state.search_id = DEFAULT_SEARCH_QUEUE.submit(
                                 keywords=keywords,
                                 location=location,
                                 job_type=job_type_param,
                                 selected_portals=selected_portals,
-                                max_pages=max_pages
+                                max_pages=max_pages,
+                                dedup='near'
                             )
+                            st.session_state.search_portals = selected_portals
+                            st.session_state.search_max_pages = max_pages
+                            jobs, debug_info = [], {}
 
                         st.session_state.jobs = jobs
                         st.session_state.debug_info = debug_info
                         st.session_state.search_performed = True
-
-                        if len(jobs) > 0:
-                            st.success(f"Found {len(jobs)} jobs!")
-                        else:
-                            st.warning("No jobs found. Enable 'Show Debug Info' to see details about what happened.")
                     except Exception as e:
                         st.error(f"Error during search: {str(e)}")
                         import traceback
@@ -212,6 +336,34 @@ def main():
                             st.code(traceback.format_exc())
 
     # Main content area
+    search = DEFAULT_SEARCH_QUEUE.status(st.session_state.search_id) if st.session_state.search_id else None
+    searching = search is not None and search['status'] in ('queued', 'running')
+    if search is not None:
+        # Pick up the jobs parsed since the last rerun
+        jobs, debug_info, progress = search['jobs'], search['debug_info'], search['progress']
+        st.session_state.jobs = jobs
+        st.session_state.debug_info = debug_info
+
+        if search['status'] == 'queued':
+            st.markdown("**Waiting for a free search worker...**")
+        elif searching:
+            portals = st.session_state.search_portals
+            st.markdown(f"**Scanning job portals... {len(jobs)} jobs so far**")
+            progress_cols = st.columns(max(len(portals), 1))
+            for col, portal in zip(progress_cols, portals):
+                info = progress.get(portal, {'pages': 0, 'jobs': 0, 'done': False})
+                with col:
+                    st.progress(1.0 if info['done'] else min(info['pages'] / st.session_state.search_max_pages, 1.0),
+                                text=f"{portal}: {info['jobs']} jobs" + (" ✓" if info['done'] else f", page {info['pages'] + 1}"))
+        else:
+            st.session_state.search_id = None
+            if search['error']:
+                st.error(f"Error during search: {search['error']}")
+            announce_results(jobs)
+    elif st.session_state.search_id:
+        st.session_state.search_id = None
+        st.error("The search is no longer available, please search again.")
+
     if st.session_state.search_performed:
         jobs = st.session_state.jobs
         debug_info = st.session_state.debug_info
@@ -228,6 +380,8 @@ def main():
                         st.write(f"Status Code: {info.get('status_code', 'N/A')}")
                         st.write(f"Jobs Found: {info.get('jobs_found', 0)}")
                         st.write(f"Pages Scraped: {info.get('pages_scraped', 0)}")
+                        if info.get('duplicates_merged'):
+                            st.write(f"Duplicates Merged: {info['duplicates_merged']}")
                     with col2:
                         if info.get('error'):
                             st.error(f"Error: {info.get('error')}")
@@ -236,122 +390,98 @@ def main():
                     st.markdown("---")
             st.markdown("---")
 
-        if len(jobs) > 0:
+        if len(jobs) > 0 or searching:
+            table = job_table(jobs)
+
             # Statistics
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.metric("Total Jobs Found", len(jobs))
             with col2:
-                unique_companies = len(set([job['company'] for job in jobs if job['company'] != 'N/A']))
-                st.metric("Unique Companies", unique_companies)
+                st.metric("Unique Companies", table.count_distinct('company'))
             with col3:
-                portals_used = len(set([job['portal'] for job in jobs]))
-                st.metric("Portals Scanned", portals_used)
+                st.metric("Portals Scanned", table.count_distinct('portal'))
 
             st.markdown("---")
 
-            # Advanced Filters
+            # Advanced Filters, each option with the number of jobs it matches under the other filters
             st.subheader("🔍 Advanced Filters")
+            filters, relevance = current_filters(table)
+
+            st.text_input(
+                "Search in results",
+                key='text_filter',
+                placeholder="e.g., Python Entwickler, Kubernetes",
+                help="Keywords in title, company or description; German word forms and (m/w/d) tags are ignored. "
+                     "Matching jobs are listed best match first."
+            )
 
             filter_col1, filter_col2, filter_col3 = st.columns(3)
 
             with filter_col1:
-                company_filter = st.multiselect(
+                sticky_multiselect(
                     "Company",
-                    options=sorted(list(set([job['company'] for job in jobs if job.get('company') and job['company'] != 'N/A'])))
+                    options=table.options('company'),
+                    state_key='company_filter',
+                    counts=table.facet_counts('company', **filters)
                 )
 
-                location_filter = st.multiselect(
+                sticky_multiselect(
                     "Location",
-                    options=sorted(list(set([job['location'] for job in jobs if job.get('location')])))
+                    options=table.options('location'),
+                    state_key='location_filter',
+                    counts=table.facet_counts('location', **filters)
                 )
 
             with filter_col2:
-                portal_filter = st.multiselect(
+                sticky_multiselect(
                     "Portal",
-                    options=sorted(list(set([job['portal'] for job in jobs])))
+                    options=table.options('portal'),
+                    state_key='portal_filter',
+                    counts=table.facet_counts('portal', **filters)
                 )
 
-                level_filter = st.multiselect(
+                sticky_multiselect(
                     "Job Level",
-                    options=sorted(list(set([job.get('job_level', 'Not Specified') for job in jobs])))
+                    options=table.options('job_level'),
+                    state_key='level_filter',
+                    counts=table.facet_counts('job_level', **filters)
                 )
 
             with filter_col3:
-                # Collect all unique skills
-                all_skills = set()
-                for job in jobs:
-                    if job.get('skills'):
-                        all_skills.update(job['skills'])
-
-                skill_filter = st.multiselect(
+                sticky_multiselect(
                     "Required Skills",
-                    options=sorted(list(all_skills))
+                    options=table.options('skills'),
+                    state_key='skill_filter',
+                    counts=table.facet_counts('skills', **filters)
                 )
 
-                salary_filter = st.selectbox(
+                st.selectbox(
                     "Salary Info",
-                    options=["All Jobs", "With Salary Info Only", "Without Salary Info"]
+                    options=list(SALARY_FILTERS),
+                    key='salary_filter'
                 )
 
             # Job posting age filter (full width below)
             st.markdown("---")
-            posting_age_filter = st.selectbox(
+            st.selectbox(
                 "📅 Job Posting Age",
-                options=["All Jobs", "Last 24 Hours", "Last 3 Days", "Last 7 Days", "Last 14 Days", "Last 30 Days"],
+                options=list(POSTING_AGE_FILTERS),
+                key='posting_age_filter',
                 help="Filter jobs by how recently they were posted"
             )
 
-            # Apply filters
-            filtered_jobs = jobs
-
-            if company_filter:
-                filtered_jobs = [job for job in filtered_jobs if job.get('company') in company_filter]
-
-            if location_filter:
-                filtered_jobs = [job for job in filtered_jobs if job.get('location') in location_filter]
-
-            if portal_filter:
-                filtered_jobs = [job for job in filtered_jobs if job.get('portal') in portal_filter]
-
-            if level_filter:
-                filtered_jobs = [job for job in filtered_jobs if job.get('job_level', 'Not Specified') in level_filter]
-
-            if skill_filter:
-                filtered_jobs = [job for job in filtered_jobs if any(skill in job.get('skills', []) for skill in skill_filter)]
-
-            if salary_filter == "With Salary Info Only":
-                filtered_jobs = [job for job in filtered_jobs if job.get('salary')]
-            elif salary_filter == "Without Salary Info":
-                filtered_jobs = [job for job in filtered_jobs if not job.get('salary')]
-
-            # Apply posting age filter
-            if posting_age_filter != "All Jobs":
-                today = datetime.now().date()
-
-                days_mapping = {
-                    "Last 24 Hours": 1,
-                    "Last 3 Days": 3,
-                    "Last 7 Days": 7,
-                    "Last 14 Days": 14,
-                    "Last 30 Days": 30
-                }
+            # Apply filters; jobs are ranked by their match to the search text if given, else to the search keywords
+            mask = table.mask(**filters)
+            scores = relevance if relevance is not None else ranking_scores(table, st.session_state.search_keywords)
+            filtered_count = int(mask.sum())
 
-                days_ago = days_mapping.get(posting_age_filter, 30)
-                cutoff_date = (today - timedelta(days=days_ago)).strftime('%Y-%m-%d')
-
-                # Filter jobs posted after cutoff date
-                filtered_jobs = [
-                    job for job in filtered_jobs
-                    if job.get('posted_date') and job['posted_date'] >= cutoff_date
-                ]
-
-            st.markdown(f"**Showing {len(filtered_jobs)} of {len(jobs)} jobs**")
+            st.markdown(f"**Showing {filtered_count} of {len(jobs)} jobs**")
             st.markdown("---")
 
             # Export button
-            if filtered_jobs:
-                df = pd.DataFrame(filtered_jobs)
+            if filtered_count:
+                df = pd.DataFrame(table.select(mask, scores))
                 csv = df.to_csv(index=False).encode('utf-8')
                 st.download_button(
                     label="📥 Download Results as CSV",
@@ -362,85 +492,107 @@ def main():
 
             # Display jobs
             st.subheader("Job Listings")
-
-            # Pagination
-            jobs_per_page = 10
-            total_pages = (len(filtered_jobs) - 1) // jobs_per_page + 1 if filtered_jobs else 0
-
-            if 'current_page' not in st.session_state:
-                st.session_state.current_page = 1
-
-            if total_pages > 1:
-                page_col1, page_col2, page_col3 = st.columns([1, 2, 1])
-                with page_col2:
-                    st.session_state.current_page = st.selectbox(
-                        "Page",
-                        options=list(range(1, total_pages + 1)),
-                        index=st.session_state.current_page - 1
-                    )
-
-            # Calculate start and end indices
-            start_idx = (st.session_state.current_page - 1) * jobs_per_page
-            end_idx = min(start_idx + jobs_per_page, len(filtered_jobs))
-
-            # Display jobs for current page
-            for idx, job in enumerate(filtered_jobs[start_idx:end_idx], start=start_idx + 1):
-                with st.container():
-                    col1, col2 = st.columns([3, 1])
-
-                    with col1:
-                        st.markdown(f"### {idx}. {job['title']}")
-
-                        # Display basic info
-                        info_col1, info_col2 = st.columns(2)
-                        with info_col1:
-                            st.markdown(f"**Company:** {job['company']}")
-                            st.markdown(f"**Location:** {job['location']}")
-                        with info_col2:
-                            st.markdown(f"**Portal:** {job['portal']}")
-                            if job.get('job_level'):
-                                st.markdown(f"**Level:** {job['job_level']}")
-
-                        # Display salary if available
-                        if job.get('salary'):
-                            st.markdown(f"💰 **Salary:** {job['salary']}")
-
-                        # Display posted date if available
-                        if job.get('posted_date'):
-                            try:
-                                posted = datetime.strptime(job['posted_date'], '%Y-%m-%d').date()
-                                today = datetime.now().date()
-                                days_ago = (today - posted).days
-                                if days_ago == 0:
-                                    date_display = "📅 **Posted:** Today"
-                                elif days_ago == 1:
-                                    date_display = "📅 **Posted:** Yesterday"
-                                elif days_ago < 7:
-                                    date_display = f"📅 **Posted:** {days_ago} days ago"
-                                elif days_ago < 30:
-                                    weeks_ago = days_ago // 7
-                                    date_display = f"📅 **Posted:** {weeks_ago} week{'s' if weeks_ago > 1 else ''} ago"
-                                else:
-                                    date_display = f"📅 **Posted:** {job['posted_date']}"
-                                st.markdown(date_display)
-                            except:
-                                st.markdown(f"📅 **Posted:** {job['posted_date']}")
-
-                        # Display skills if available
-                        if job.get('skills'):
-                            skills_str = ", ".join(job['skills'][:5])  # Show first 5 skills
-                            st.markdown(f"🔧 **Skills:** {skills_str}")
-
-                        with st.expander("View Description"):
-                            st.write(job['summary'])
-                            if job.get('skills') and len(job['skills']) > 5:
-                                st.write(f"**All Skills:** {', '.join(job['skills'])}")
-
-                    with col2:
-                        if job['url']:
-                            st.link_button("View Job", job['url'], use_container_width=True)
-
-                    st.markdown("---")
+            job_view = st.radio(
+                "View",
+                options=["Table", "Cards"],
+                horizontal=True,
+                key='job_view',
+                help="Table shows every matching job in one scrollable list; Cards shows 10 jobs per page with details"
+            )
+            # Display strings (posting age, skills) are computed once per result set
+            display = table.display()
+
+            if job_view == "Table":
+                # One virtualized grid: only the visible rows are drawn, however many jobs match
+                ranked_rows = top_k(scores, mask, filtered_count)
+                st.dataframe(
+                    display.iloc[ranked_rows],
+                    column_config={
+                        'title': st.column_config.TextColumn("Title", width='large'),
+                        'company': "Company",
+                        'location': "Location",
+                        'portal': "Portal",
+                        'job_level': "Level",
+                        'posted': "Posted",
+                        'salary': "Salary",
+                        'skills': "Skills",
+                        'top_skills': None,
+                        'url': st.column_config.LinkColumn("Link")
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    height=min(TABLE_ROW_HEIGHT * (len(ranked_rows) + 1) + 3, TABLE_MAX_HEIGHT)
+                )
+            else:
+                # Pagination
+                jobs_per_page = 10
+                total_pages = (filtered_count - 1) // jobs_per_page + 1 if filtered_count else 0
+
+                if 'current_page' not in st.session_state:
+                    st.session_state.current_page = 1
+                # Live results can shrink when cross-portal duplicates are merged at the end
+                st.session_state.current_page = min(st.session_state.current_page, max(total_pages, 1))
+
+                if total_pages > 1:
+                    page_col1, page_col2, page_col3 = st.columns([1, 2, 1])
+                    with page_col2:
+                        st.session_state.current_page = st.selectbox(
+                            "Page",
+                            options=list(range(1, total_pages + 1)),
+                            index=st.session_state.current_page - 1
+                        )
+
+                # Calculate start and end indices
+                start_idx = (st.session_state.current_page - 1) * jobs_per_page
+                end_idx = min(start_idx + jobs_per_page, filtered_count)
+
+                # Display the best ranked jobs of the current page (only the top end_idx are ordered)
+                page_rows = top_k(scores, mask, end_idx)[start_idx:]
+                for idx, row in enumerate(page_rows, start=start_idx + 1):
+                    job = table.jobs[row]
+                    labels = display.iloc[row]
+                    with st.container():
+                        col1, col2 = st.columns([3, 1])
+
+                        with col1:
+                            st.markdown(f"### {idx}. {job['title']}")
+
+                            # Display basic info
+                            info_col1, info_col2 = st.columns(2)
+                            with info_col1:
+                                st.markdown(f"**Company:** {job['company']}")
+                                st.markdown(f"**Location:** {job['location']}")
+                            with info_col2:
+                                st.markdown(f"**Portal:** {job['portal']}")
+                                other_sources = [source for source in job.get('sources', []) if source['portal'] != job['portal']]
+                                if other_sources:
+                                    links = ', '.join(f"[{source['portal']}]({source['url']})" for source in other_sources)
+                                    st.markdown(f"**Also on:** {links}")
+                                if job.get('job_level'):
+                                    st.markdown(f"**Level:** {job['job_level']}")
+
+                            # Display salary if available
+                            if job.get('salary'):
+                                st.markdown(f"💰 **Salary:** {job['salary']}")
+
+                            # Display posted date if available
+                            if labels['posted']:
+                                st.markdown(f"📅 **Posted:** {labels['posted']}")
+
+                            # Display skills if available (first 5)
+                            if labels['top_skills']:
+                                st.markdown(f"🔧 **Skills:** {labels['top_skills']}")
+
+                            with st.expander("View Description"):
+                                st.write(job['summary'])
+                                if job.get('skills') and len(job['skills']) > 5:
+                                    st.write(f"**All Skills:** {labels['skills']}")
+
+                        with col2:
+                            if job['url']:
+                                st.link_button("View Job", job['url'], use_container_width=True)
+
+                        st.markdown("---")
         else:
             st.warning("No jobs found matching your criteria.")
             st.info("""
@@ -495,6 +647,11 @@ def main():
         **Note:** Web scraping may occasionally fail if portal structures change. The app implements respectful delays between requests.
         """)
 
+    # Refresh while the search is running; filters and job links stay usable in between
+    if searching:
+        time.sleep(LIVE_REFRESH_SECONDS)
+        st.rerun()
+
 
 if __name__ == "__main__":
     main()
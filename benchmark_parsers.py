@@ -0,0 +1,118 @@
+"""
+Benchmark of the result page parsing backends (BeautifulSoup vs lxml)
+
+Parses result pages with the portal specs that have synthetic pages here, once
+per backend, checks both backends extract the same jobs and prints the timings.
+
+Usage:
+    python benchmark_parsers.py                          # synthetic pages
+    python benchmark_parsers.py Indeed.de page.html ...  # saved result pages of one portal
+"""
+import sys
+import time
+
+from parsing import PARSER_BACKENDS
+from scrapers import IndeedDeScraper, StepStoneScraper, XingJobsScraper
+
+SCRAPERS = {scraper.portal_name: scraper for scraper in (IndeedDeScraper, StepStoneScraper, XingJobsScraper)}
+CARDS_PER_PAGE = 25
+ROUNDS = 20
+
+
+def synthetic_page(portal_name: str, cards: int = CARDS_PER_PAGE) -> bytes:
+    """A result page shaped like the portal's markup, with some noise around the cards"""
+    items = []
+    for i in range(cards):
+        title = f"Senior Python Entwickler {i} (m/w/d)"
+        company = f"Beispiel GmbH {i % 7}"
+        if portal_name == 'Indeed.de':
+            items.append(f'''
+                <div class="cardOutline tapItem"><div class="job_seen_beacon">
+                  <h2 class="jobTitle css-198pbd"><a data-jk="a{i:05d}" href="/rc/clk?jk=a{i:05d}"><span title="{title}">{title}</span></a></h2>
+                  <div class="company_location"><span data-testid="company-name">{company}</span>
+                  <div data-testid="text-location">Berlin</div></div>
+                  <div class="salary-snippet-container"><div data-testid="attribute_snippet_testid">55.000 € - 70.000 € pro Jahr</div></div>
+                  <div class="job-snippet"><ul><li>Python, Django und AWS</li><li>Agiles Team mit Scrum</li></ul></div>
+                  <span class="date" data-testid="myJobsStateDate">Vor {i % 9 + 1} Tagen</span>
+                </div></div>''')
+        elif portal_name == 'StepStone.de':
+            items.append(f'''
+                <article data-at="job-item" class="res-1p8f8en"><div class="res-vurnku">
+                  <h2><a data-at="job-item-title" href="/stellenangebote--{i}.html"><div>{title}</div></a></h2>
+                  <span data-at="job-item-company-name" class="res-btchsq">{company}</span>
+                  <span data-at="job-item-location" class="res-qchjmw">Berlin</span>
+                  <span data-at="job-item-salary">60.000 €</span>
+                  <span class="res-date"><time datetime="2026-01-01">vor {i % 5 + 1} Tagen</time></span>
+                </div></article>''')
+        else:
+            items.append(f'''
+                <div data-xds="JobTeaser" class="job-teaser-list-item"><a href="/jobs/berlin-{i}">
+                  <h3 class="job-teaser-title">{title}</h3></a>
+                  <p><span class="job-teaser-company-name">{company}</span></p>
+                  <span class="job-teaser-salary">50.000 € – 65.000 €</span>
+                  <span class="job-teaser-postTime">{i % 3 + 1} Tagen</span>
+                </div>''')
+    filler = ''.join(f'<div class="nav-item"><a href="/x/{i}">Link {i}</a><span>Text</span></div>' for i in range(200))
+    return (f"<html><head><script>var config = {{}};</script></head><body><nav>{filler}</nav>"
+            f"<main><div class='results'>{''.join(items)}</div></main><footer>{filler}</footer></body></html>").encode('utf-8')
+
+
+def parse_jobs(scraper_class, backend: str, pages, rounds: int):
+    """Parse every page `rounds` times with a backend, return (jobs of the last round, seconds per page)"""
+    scraper = scraper_class()
+    scraper.parser_backend = backend
+    started = time.perf_counter()
+    for _ in range(rounds):
+        scraper._start_run()
+        jobs = []
+        for page, content in enumerate(pages, scraper.first_page):
+            root = scraper.dom.parse(content)
+            scraper._parse_page(root, page, 'Berlin', jobs)
+    elapsed = time.perf_counter() - started
+    return jobs, elapsed / (rounds * len(pages))
+
+
+def benchmark(portal_name: str, pages, rounds: int = ROUNDS):
+    print(f"\n{portal_name} ({len(pages)} page(s), {rounds} rounds)")
+    results = {}
+    for backend in PARSER_BACKENDS:
+        jobs, seconds = parse_jobs(SCRAPERS[portal_name], backend, pages, rounds)
+        results[backend] = (jobs, seconds)
+        print(f"  {backend:5s} {seconds * 1000:8.2f} ms/page  {len(jobs)} jobs")
+
+    (bs4_jobs, bs4_seconds), (lxml_jobs, lxml_seconds) = results['bs4'], results['lxml']
+    print(f"  speedup {bs4_seconds / lxml_seconds:.1f}x")
+    if bs4_jobs != lxml_jobs:
+        print("  ✗ backends extracted different jobs")
+        for bs4_job, lxml_job in zip(bs4_jobs, lxml_jobs):
+            if bs4_job != lxml_job:
+                print(f"    bs4:  {bs4_job}\n    lxml: {lxml_job}")
+                break
+        return False
+    print("  ✓ identical jobs")
+    return True
+
+
+def main():
+    # Keep the logs of every parsed page out of the output
+    import logging
+    logging.disable(logging.INFO)
+
+    if len(sys.argv) > 2:
+        portal_name = sys.argv[1]
+        if portal_name not in SCRAPERS:
+            print(f"Unknown portal '{portal_name}', expected one of {', '.join(SCRAPERS)}")
+            sys.exit(2)
+        pages = []
+        for path in sys.argv[2:]:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+        results = [benchmark(portal_name, pages)]
+    else:
+        results = [benchmark(portal_name, [synthetic_page(portal_name)]) for portal_name in SCRAPERS]
+
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Duplicate detection for scraped jobs
+"""
+import re
+import zlib
+from typing import Callable, Dict, Hashable, List, Tuple
+
+import numpy as np
+
+# Gender / diversity tags German postings append to titles, e.g. "(m/w/d)", "(w/m/x)", "(all genders)"
+GENDER_TAG_RE = re.compile(r'\(\s*(?:[mwdfxi]\s*[/|,]\s*)+[mwdfxi]\s*\)|\(\s*all\s+genders?\s*\)|\b[mwdf]/[mwdf](?:/[mwdfx])?\b', re.IGNORECASE)
+# Legal forms that differ between portals for the same employer
+LEGAL_FORM_RE = re.compile(r'\b(?:gmbh\s*&\s*co\.?\s*kg(?:aa)?|gmbh|mbh|ag|se|kg|kgaa|ug|e\.?\s?v\.?|ltd\.?|inc\.?|llc|plc)\b', re.IGNORECASE)
+NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalize_title(title: str) -> str:
+    """Lower-case title without gender tags, punctuation and extra whitespace"""
+    title = GENDER_TAG_RE.sub(' ', title or '')
+    return ' '.join(NON_WORD_RE.sub(' ', title.lower()).split())
+
+
+def normalize_company(company: str) -> str:
+    """Lower-case company name without legal form, punctuation and extra whitespace"""
+    company = LEGAL_FORM_RE.sub(' ', company or '')
+    return ' '.join(NON_WORD_RE.sub(' ', company.lower()).split())
+
+
+def normalize_location(location: str) -> str:
+    """Lower-case location without punctuation and extra whitespace"""
+    return ' '.join(NON_WORD_RE.sub(' ', (location or '').lower()).split())
+
+
+def exact_key(job: Dict) -> Hashable:
+    """Same title and company"""
+    return job.get('title'), job.get('company')
+
+
+def url_key(job: Dict) -> Hashable:
+    """Same posting URL"""
+    return job.get('url')
+
+
+def fuzzy_key(job: Dict) -> Hashable:
+    """Same title and company after normalization ("(m/w/d)", legal forms, case, punctuation)"""
+    return normalize_title(job.get('title')), normalize_company(job.get('company'))
+
+
+def _portal_key(job: Dict) -> Hashable:
+    return (job.get('portal'),) + exact_key(job)
+
+
+# Deduplication policies for merged results:
+#   portal - duplicates within the same portal only
+#   global - identical title and company across portals
+#   fuzzy  - normalized title and company across portals
+#   near   - near-duplicate clustering across portals (see cluster_near_duplicates)
+DEDUP_POLICIES = ('portal', 'global', 'fuzzy', 'near')
+
+_POLICY_KEYS = {
+    'portal': _portal_key,
+    'global': exact_key,
+    'fuzzy': fuzzy_key,
+}
+
+
+def policy_key(policy: str) -> Callable[[Dict], Hashable]:
+    """Key function of a hash-based policy ('portal', 'global' or 'fuzzy'), usable with Deduplicator"""
+    if policy not in _POLICY_KEYS:
+        raise ValueError(f"Policy '{policy}' has no key function, expected one of {', '.join(_POLICY_KEYS)}")
+    return _POLICY_KEYS[policy]
+
+
+class Deduplicator:
+    """
+    Hash-set based duplicate filter, O(1) per job
+
+    The key function decides what counts as a duplicate; `duplicates` counts
+    how many jobs were rejected.
+    """
+
+    def __init__(self, key: Callable[[Dict], Hashable] = exact_key):
+        self.key = key
+        self.duplicates = 0
+        self._seen = set()
+
+    def add(self, job: Dict) -> bool:
+        """Register job and return True if it has not been seen before"""
+        key = self.key(job)
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(key)
+        return True
+
+
+def deduplicate(jobs: List[Dict], policy: str = 'portal') -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Remove duplicate jobs according to a policy, keeping the first occurrence
+
+    Returns:
+        Tuple of (unique jobs, number of duplicates removed per portal)
+    """
+    if policy not in DEDUP_POLICIES:
+        raise ValueError(f"Unknown dedup policy '{policy}', expected one of {', '.join(DEDUP_POLICIES)}")
+    if policy == 'near':
+        return cluster_near_duplicates(jobs)
+
+    deduplicator = Deduplicator(policy_key(policy))
+    unique = []
+    removed = {}
+    for job in jobs:
+        if deduplicator.add(job):
+            unique.append(job)
+        else:
+            removed[job.get('portal')] = removed.get(job.get('portal'), 0) + 1
+    return unique, removed
+
+
+# MinHash / LSH parameters: 16 bands of 4 rows find pairs with a title+company
+# similarity of roughly 0.5 and above, which are then verified exactly
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+NEAR_DUPLICATE_THRESHOLD = 0.7
+# Two postings that both have a real description must also share this much of it
+SUMMARY_THRESHOLD = 0.3
+# Title+company similarity required when a posting has no real description to compare
+TITLE_ONLY_THRESHOLD = 0.9
+# Candidates compared per job within one LSH bucket
+MAX_BUCKET_COMPARISONS = 32
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(20260112)
+_PERM_A = _rng.randint(1, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS).astype(np.int64)
+_PERM_B = _rng.randint(0, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS).astype(np.int64)
+_BAND_MIX = _rng.randint(1, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS).astype(np.int64) * 2 + 1
+
+# Title words telling apart different vacancies of one employer (level, specialization);
+# two titles differing in one of them are never merged
+DISTINGUISHING_TITLE_WORDS = {
+    'senior', 'sr', 'junior', 'jr', 'lead', 'principal', 'staff', 'head', 'chief', 'director', 'manager',
+    'intern', 'internship', 'praktikant', 'praktikum', 'werkstudent', 'trainee', 'ausbildung', 'azubi',
+    'backend', 'frontend', 'fullstack', 'stack', 'mobile', 'android', 'ios', 'embedded', 'devops', 'data', 'ml',
+}
+
+# Summaries some scrapers fill in when the card has no description
+PLACEHOLDER_SUMMARIES = {'', 'no description available', 'see full details on stepstone', 'full details available on xing'}
+
+
+def _shingles(text: str, size: int = 3) -> set:
+    """Character shingles of a normalized string"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _minhash_signatures(shingle_sets: List[set], chunk_size: int = 50000) -> np.ndarray:
+    """MinHash signatures (one row per shingle set), computed in vectorized chunks"""
+    signatures = np.empty((len(shingle_sets), MINHASH_PERMUTATIONS), dtype=np.int64)
+    start = 0
+    while start < len(shingle_sets):
+        # Grow the chunk until it holds about chunk_size shingles
+        end = start
+        total = 0
+        while end < len(shingle_sets) and (total == 0 or total < chunk_size):
+            total += max(len(shingle_sets[end]), 1)
+            end += 1
+        hashes = []
+        offsets = []
+        for shingles in shingle_sets[start:end]:
+            offsets.append(len(hashes))
+            hashes.extend(zlib.crc32(shingle.encode('utf-8')) for shingle in (shingles or ('',)))
+        hashes = np.array(hashes, dtype=np.int64)
+        values = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME
+        signatures[start:end] = np.minimum.reduceat(values, offsets, axis=1).T
+        start = end
+    return signatures
+
+
+def _summary_words(job: Dict) -> set:
+    summary = (job.get('summary') or '').strip()
+    if summary.lower() in PLACEHOLDER_SUMMARIES:
+        return set()
+    return set(NON_WORD_RE.sub(' ', summary.lower()).split())
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def _same_company(a: set, b: set) -> bool:
+    """Company word sets match when one contains the other ("acme" / "acme deutschland")"""
+    return not a or not b or a <= b or b <= a
+
+
+def _distinct_titles(a: set, b: set) -> bool:
+    """Titles differing in a level or specialization word ("senior" / "junior", "backend" / "frontend")"""
+    return bool((a ^ b) & DISTINGUISHING_TITLE_WORDS)
+
+
+def _canonical(cluster: List[Dict]) -> Dict:
+    """
+    Merge a cluster into its most complete posting, listing every copy in 'sources'
+
+    Missing salary and posted date are taken from the other copies and skills
+    are combined.
+    """
+    best = max(cluster, key=lambda job: sum(1 for field in ('salary', 'posted_date', 'summary') if job.get(field)) +
+               (0 if (job.get('summary') or '').lower() in PLACEHOLDER_SUMMARIES else 1))
+    merged = dict(best)
+    for job in cluster:
+        for field in ('salary', 'posted_date'):
+            if not merged.get(field) and job.get(field):
+                merged[field] = job[field]
+        for skill in job.get('skills') or []:
+            if skill not in merged.get('skills', []):
+                merged['skills'] = list(merged.get('skills') or []) + [skill]
+    merged['sources'] = [{'portal': job.get('portal'), 'url': job.get('url')} for job in cluster]
+    return merged
+
+
+def cluster_near_duplicates(jobs: List[Dict], threshold: float = NEAR_DUPLICATE_THRESHOLD) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Group copies of the same vacancy across portals into one canonical job
+
+    Title and company are normalized ("(m/w/d)", legal forms, punctuation) and
+    MinHashed; locality-sensitive hashing over signature bands, blocked by the
+    first word of the company, proposes candidate pairs, so the cost stays
+    close to linear in the number of jobs.
+    Candidates are accepted when their shingle similarity reaches `threshold`,
+    the company names and locations agree word-wise, the titles do not differ
+    in a level or specialization word and, if both have a real description,
+    their summaries overlap too. Without a description on both sides only
+    the title is evidence, so the similarity must reach TITLE_ONLY_THRESHOLD.
+    Each cluster holds at most one job per portal (the portal scrapers already
+    dedup within a portal); the most similar pairs are merged first.
+
+    Returns:
+        Tuple of (canonical jobs in order of first appearance, number of merged copies per portal)
+    """
+    count = len(jobs)
+    if count < 2:
+        return list(jobs), {}
+
+    titles = [normalize_title(job.get('title')) for job in jobs]
+    companies = [normalize_company(job.get('company')) for job in jobs]
+    company_words = [set(company.split()) for company in companies]
+    title_words = [set(title.split()) for title in titles]
+    location_words = [set(normalize_location(job.get('location')).split()) for job in jobs]
+    # Only jobs whose company starts with the same word can be copies of each other
+    blocks = [company.split(' ', 1)[0] for company in companies]
+    shingle_sets = [_shingles(f"{title} @ {company}") for title, company in zip(titles, companies)]
+    signatures = _minhash_signatures(shingle_sets)
+
+    summaries = {}
+    checked = set()
+    candidates = []
+
+    def consider(first: int, other: int):
+        if jobs[first].get('portal') == jobs[other].get('portal') or (first, other) in checked:
+            return
+        checked.add((first, other))
+        if not _same_company(company_words[first], company_words[other]):
+            return
+        # The same company's vacancy in Berlin and in Walldorf are two vacancies
+        if not _same_company(location_words[first], location_words[other]):
+            return
+        if _distinct_titles(title_words[first], title_words[other]):
+            return
+        similarity = _jaccard(shingle_sets[first], shingle_sets[other])
+        if similarity < threshold:
+            return
+        words_first = summaries.setdefault(first, _summary_words(jobs[first]))
+        words_other = summaries.setdefault(other, _summary_words(jobs[other]))
+        if words_first and words_other:
+            if _jaccard(words_first, words_other) < SUMMARY_THRESHOLD:
+                return
+        elif similarity < max(threshold, TITLE_ONLY_THRESHOLD):
+            return
+        candidates.append((-similarity, first, other))
+
+    rows = MINHASH_PERMUTATIONS // LSH_BANDS
+    for band in range(LSH_BANDS):
+        buckets = {}
+        # Fold the band's rows into one integer (wrapping multiply-add is fine for bucketing)
+        band_hashes = (signatures[:, band * rows:(band + 1) * rows] * _BAND_MIX[:rows]).sum(axis=1).tolist()
+        for i, key in enumerate(zip(blocks, band_hashes)):
+            buckets.setdefault(key, []).append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            # Compare each job with the jobs just before it in the bucket, which
+            # bounds the work on huge buckets of very generic titles
+            for position in range(1, len(members)):
+                for first in members[max(0, position - MAX_BUCKET_COMPARISONS):position]:
+                    consider(first, members[position])
+
+    # Merge the most similar pairs first. A vacancy is listed once per portal,
+    # so two clusters that already share a portal are never joined.
+    parent = list(range(count))
+    portals = [{job.get('portal')} for job in jobs]
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for _, first, other in sorted(candidates):
+        root_first, root_other = find(first), find(other)
+        if root_first == root_other or portals[root_first] & portals[root_other]:
+            continue
+        parent[root_other] = root_first
+        portals[root_first] |= portals[root_other]
+
+    clusters = {}
+    for i in range(count):
+        clusters.setdefault(find(i), []).append(i)
+
+    canonical = []
+    removed = {}
+    for root in sorted(clusters, key=lambda root: clusters[root][0]):
+        members = [jobs[i] for i in clusters[root]]
+        if len(members) == 1:
+            canonical.append(members[0])
+            continue
+        merged = _canonical(members)
+        canonical.append(merged)
+        for job in members:
+            if (job.get('portal'), job.get('url')) != (merged.get('portal'), merged.get('url')):
+                removed[job.get('portal')] = removed.get(job.get('portal'), 0) + 1
+    return canonical, removed
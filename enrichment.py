@@ -0,0 +1,345 @@
+"""
+Enrichment of scraped jobs: skills, job level and posting date
+"""
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dedup import PLACEHOLDER_SUMMARIES
+
+# Skill name -> other spellings that mean the same skill. Matching is
+# case-insensitive and on word boundaries, so "Go" does not match "Google".
+# A spelling ending in '*' is a German adjective stem that also matches its
+# inflected forms ("agil*": agil, agile, agiles, agiler, ...).
+SKILL_SYNONYMS = {
+    'Python': [],
+    'Java': [],
+    'JavaScript': ['JS', 'ECMAScript'],
+    'TypeScript': [],
+    'C++': ['cpp'],
+    'C#': ['csharp', 'C Sharp'],
+    'PHP': [],
+    'Ruby': ['Ruby on Rails', 'Rails'],
+    'Go': ['Golang'],
+    'Rust': [],
+    'Swift': [],
+    'Kotlin': [],
+    'React': ['React.js', 'ReactJS'],
+    'Angular': ['AngularJS'],
+    'Vue': ['Vue.js', 'VueJS'],
+    'Node.js': ['NodeJS', 'Node'],
+    'Django': [],
+    'Flask': [],
+    'Spring': ['Spring Boot'],
+    'Express': ['Express.js'],
+    'SQL': [],
+    'MySQL': [],
+    'PostgreSQL': ['Postgres'],
+    'MongoDB': ['Mongo'],
+    'Redis': [],
+    'Oracle': [],
+    'NoSQL': [],
+    'AWS': ['Amazon Web Services'],
+    'Azure': ['Microsoft Azure'],
+    'GCP': ['Google Cloud', 'Google Cloud Platform'],
+    'Docker': [],
+    'Kubernetes': ['K8s'],
+    'Jenkins': [],
+    'Git': ['GitHub', 'GitLab'],
+    'CI/CD': ['CI / CD', 'Continuous Integration', 'Continuous Delivery', 'Continuous Deployment'],
+    'Machine Learning': ['ML', 'Maschinelles Lernen'],
+    'AI': ['KI', 'Artificial Intelligence', 'Künstliche Intelligenz'],
+    'Data Science': ['Data Scientist'],
+    'Deep Learning': [],
+    'TensorFlow': [],
+    'PyTorch': [],
+    'Agile': ['agil*', 'agile Methoden'],
+    'Scrum': [],
+    'DevOps': [],
+    'REST API': ['REST', 'RESTful', 'REST APIs'],
+    'GraphQL': [],
+    'Microservices': ['Microservice', 'Micro Services'],
+    'HTML': ['HTML5'],
+    'CSS': ['CSS3'],
+    'SASS': ['SCSS'],
+    'Bootstrap': [],
+    'Tailwind': ['Tailwind CSS'],
+    'Linux': [],
+    'Unix': [],
+    'Windows Server': [],
+    'Networking': ['Netzwerktechnik'],
+    'SAP': [],
+    'Salesforce': [],
+    'Excel': ['MS Excel'],
+    'Power BI': ['PowerBI'],
+    'Tableau': [],
+}
+
+# Spellings that are ordinary words in lower case ("go", "ki") and only
+# count as a skill when written exactly like this
+CASE_SENSITIVE_ALIASES = {'Go', 'AI', 'KI', 'ML', 'JS', 'Node', 'Rails', 'REST', 'Spring', 'Express', 'Swift', 'Rust'}
+
+# Most skills kept per job
+MAX_SKILLS = 10
+
+_SEPARATOR_RE = re.compile(r'[\s\-]+')
+
+# Endings of German adjectives, matched after a stem spelling ("agil*")
+GERMAN_ADJECTIVE_ENDINGS = ('em', 'en', 'er', 'es', 'e')
+
+
+def _normalize_alias(alias: str) -> str:
+    return _SEPARATOR_RE.sub(' ', alias.lower()).strip()
+
+
+class SkillExtractor:
+    """
+    Finds skills in free text with one precompiled regular expression
+
+    All spellings of all skills are compiled into a single alternation
+    (longest first) bounded by non-word characters, so each text is scanned
+    once no matter how many skills are known. Skills are returned in the
+    order they first appear in the text.
+    """
+
+    def __init__(self, skills: Optional[Dict[str, List[str]]] = None,
+                 case_sensitive: Optional[Iterable[str]] = None, limit: int = MAX_SKILLS):
+        self.skills = {name: list(aliases) for name, aliases in (SKILL_SYNONYMS if skills is None else skills).items()}
+        self.case_sensitive = set(CASE_SENSITIVE_ALIASES if case_sensitive is None else case_sensitive)
+        self.limit = limit
+        self._compile()
+
+    def _compile(self):
+        self._canonical = {}
+        self._stems = {}
+        endings = '(?:' + '|'.join(GERMAN_ADJECTIVE_ENDINGS) + ')?'
+        alternatives = []
+        for name, aliases in self.skills.items():
+            for alias in [name] + aliases:
+                stem = alias.endswith('*')
+                alias = alias.rstrip('*')
+                (self._stems if stem else self._canonical)[_normalize_alias(alias)] = name
+                pattern = r'[\s\-]+'.join(re.escape(part) for part in alias.split())
+                if stem:
+                    pattern += endings
+                if alias in self.case_sensitive:
+                    pattern = f'(?-i:{pattern})'
+                alternatives.append((len(alias), pattern))
+        alternatives.sort(key=lambda item: -item[0])
+        self._pattern = re.compile(r'(?<!\w)(?:' + '|'.join(pattern for _, pattern in alternatives) + r')(?![\w+#])',
+                                   re.IGNORECASE)
+
+    def add(self, name: str, aliases: Iterable[str] = (), case_sensitive: bool = False):
+        """Add a skill (or more spellings of a known one) and recompile"""
+        self.skills.setdefault(name, [])
+        self.skills[name].extend(alias for alias in aliases if alias not in self.skills[name])
+        if case_sensitive:
+            self.case_sensitive.update([name, *aliases])
+        self._compile()
+
+    def extract(self, text: str) -> List[str]:
+        """Skills mentioned in text, at most `limit`"""
+        if not text:
+            return []
+
+        found = []
+        for match in self._pattern.finditer(text):
+            skill = self._skill(_normalize_alias(match.group(0)))
+            if skill and skill not in found:
+                found.append(skill)
+                if len(found) >= self.limit:
+                    break
+        return found
+
+    def _skill(self, spelling: str) -> Optional[str]:
+        """Skill of a matched spelling, trying it as an inflected stem if it is not a known spelling"""
+        skill = self._canonical.get(spelling)
+        if skill is None:
+            skill = next((self._stems[spelling[:-len(ending)]] for ending in GERMAN_ADJECTIVE_ENDINGS
+                          if spelling.endswith(ending) and spelling[:-len(ending)] in self._stems),
+                         self._stems.get(spelling))
+        return skill
+
+    def extract_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Skills of many texts at once"""
+        extract = self.extract
+        return [extract(text) for text in texts]
+
+
+# Extractor used by the scrapers
+DEFAULT_SKILL_EXTRACTOR = SkillExtractor()
+
+
+def extract_skills(text: str) -> List[str]:
+    """Skills mentioned in text, using DEFAULT_SKILL_EXTRACTOR"""
+    return DEFAULT_SKILL_EXTRACTOR.extract(text)
+
+
+def extract_skills_batch(texts: Iterable[str]) -> List[List[str]]:
+    """Skills of many texts at once, using DEFAULT_SKILL_EXTRACTOR"""
+    return DEFAULT_SKILL_EXTRACTOR.extract_many(texts)
+
+
+# Job levels in order of precedence with the English and German terms that
+# indicate them. Terms match whole words; '*' allows more letters on that
+# side, for German compounds such as "Abteilungsleiter" or "Praktikantin".
+JOB_LEVEL_RULES = [
+    ('Entry Level', ['entry level', 'junior', 'graduate', 'trainee', 'intern', 'internship',
+                     'praktik*', 'werkstudent*', 'berufseinsteiger*', 'einsteiger*', 'absolvent*', 'azubi', 'auszubildende*']),
+    ('Senior Level', ['senior', 'lead', 'principal', 'staff', 'expert', 'experte', 'expertin']),
+    ('Mid Level', ['mid level', 'intermediate', 'experienced', 'professional', 'berufserfahren*']),
+    ('Management', ['director', 'head of', 'chief', 'vp', 'vice president', '*manager', '*managerin',
+                    '*leiter', '*leiterin', 'leitung', 'geschäftsführer*', 'direktor*']),
+]
+DEFAULT_JOB_LEVEL = 'Not Specified'
+
+
+class JobLevelClassifier:
+    """
+    Assigns a job level from title and summary in a single regex pass
+
+    Every term of every level is compiled into one pattern with a named
+    group per level; the level of highest precedence that occurs wins.
+    """
+
+    def __init__(self, rules: Optional[List[Tuple[str, List[str]]]] = None, default: str = DEFAULT_JOB_LEVEL):
+        self.rules = list(JOB_LEVEL_RULES if rules is None else rules)
+        self.default = default
+        groups = []
+        for index, (_, terms) in enumerate(self.rules):
+            patterns = []
+            for term in terms:
+                prefix = r'\w*' if term.startswith('*') else ''
+                suffix = r'\w*' if term.endswith('*') else ''
+                words = term.strip('*').split()
+                patterns.append(prefix + r'[\s\-]+'.join(re.escape(word) for word in words) + suffix)
+            groups.append(f"(?P<level{index}>{'|'.join(patterns)})")
+        self._pattern = re.compile(r'(?<!\w)(?:' + '|'.join(groups) + r')(?!\w)', re.IGNORECASE)
+
+    def classify(self, title: str, summary: str = '') -> str:
+        best = len(self.rules)
+        for text in (title, summary):
+            if not text:
+                continue
+            for match in self._pattern.finditer(text):
+                best = min(best, int(match.lastgroup[5:]))
+                if best == 0:
+                    return self.rules[0][0]
+        return self.rules[best][0] if best < len(self.rules) else self.default
+
+
+# Number words used in relative dates ("vor einem Tag", "a day ago")
+_NUMBER_WORDS = {'a': 1, 'an': 1, 'one': 1, 'ein': 1, 'einem': 1, 'einer': 1, 'eine': 1}
+
+# Units of relative dates, English and German, mapped to timedelta arguments
+DATE_UNITS = {
+    'minutes': ['min', 'mins', 'minute', 'minutes', 'minuten'],
+    'hours': ['h', 'std', 'hr', 'hrs', 'hour', 'hours', 'stunde', 'stunden'],
+    'days': ['d', 'day', 'days', 'tag', 'tage', 'tagen'],
+    'weeks': ['w', 'week', 'weeks', 'woche', 'wochen'],
+    'months': ['mo', 'month', 'months', 'monat', 'monate', 'monaten'],
+}
+TODAY_TERMS = ['heute', 'today', 'just now', 'gerade eben', 'soeben', 'just posted']
+YESTERDAY_TERMS = ['gestern', 'yesterday']
+
+
+class PostedDateParser:
+    """
+    Normalizes posting dates ("vor 3 Tagen", "2h", "yesterday", "12.05.26") to YYYY-MM-DD
+
+    Relative dates are resolved against a reference time; pass the same one
+    for every card of a scrape run so all jobs of a run agree on "today".
+    """
+
+    def __init__(self):
+        unit_names = sorted((name for names in DATE_UNITS.values() for name in names), key=len, reverse=True)
+        numbers = '|'.join(sorted(_NUMBER_WORDS, key=len, reverse=True))
+        self._units = {name: unit for unit, names in DATE_UNITS.items() for name in names}
+        self._pattern = re.compile(
+            r'(?P<iso>(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2}))'
+            r'|(?P<dotted>(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{2,4}))'
+            rf"|(?P<yesterday>{'|'.join(re.escape(term) for term in YESTERDAY_TERMS)})"
+            rf"|(?P<today>{'|'.join(re.escape(term) for term in TODAY_TERMS)})"
+            rf"|(?P<count>\d+|\b(?:{numbers})\b)\+?\s*(?P<unit>{'|'.join(unit_names)})(?![a-zäöü])",
+            re.IGNORECASE
+        )
+
+    def parse(self, date_text: str, now: Optional[datetime] = None) -> Optional[str]:
+        """Date as YYYY-MM-DD, the cleaned-up text if it is not recognised, None for empty input"""
+        if not date_text:
+            return None
+
+        date_text = date_text.lower().strip()
+        match = self._pattern.search(date_text)
+        if match is None:
+            return date_text
+
+        now = now or datetime.now()
+        if match.group('iso'):
+            return f"{match.group('iso_year')}-{match.group('iso_month').zfill(2)}-{match.group('iso_day').zfill(2)}"
+        if match.group('dotted'):
+            year = match.group('year')
+            if len(year) == 2:
+                year = '20' + year
+            return f"{year}-{match.group('month').zfill(2)}-{match.group('day').zfill(2)}"
+        if match.group('today'):
+            return now.strftime('%Y-%m-%d')
+        if match.group('yesterday'):
+            return (now - timedelta(days=1)).strftime('%Y-%m-%d')
+
+        count = match.group('count')
+        value = int(count) if count.isdigit() else _NUMBER_WORDS[count]
+        unit = self._units[match.group('unit')]
+        if unit == 'months':
+            unit, value = 'days', value * 30
+        return (now - timedelta(**{unit: value})).strftime('%Y-%m-%d')
+
+
+DEFAULT_JOB_LEVEL_CLASSIFIER = JobLevelClassifier()
+DEFAULT_DATE_PARSER = PostedDateParser()
+
+
+def extract_job_level(title: str, summary: str = '') -> str:
+    """Job level of a posting, using DEFAULT_JOB_LEVEL_CLASSIFIER"""
+    return DEFAULT_JOB_LEVEL_CLASSIFIER.classify(title, summary)
+
+
+def parse_posted_date(date_text: str, now: Optional[datetime] = None) -> Optional[str]:
+    """Posting date as YYYY-MM-DD, using DEFAULT_DATE_PARSER"""
+    return DEFAULT_DATE_PARSER.parse(date_text, now)
+
+
+def enrich_jobs(jobs: List[Dict], skill_extractor: Optional[SkillExtractor] = None,
+                job_level_classifier: Optional[JobLevelClassifier] = None) -> List[Dict]:
+    """
+    Fill in missing job_level and skills for a list of jobs in place
+
+    Values a scraper already set are kept and posted_date is left alone.
+    Placeholder summaries ("See full details on StepStone") say nothing about
+    the job, so such jobs are classified by their title only. Skills of all
+    jobs are extracted in one batch.
+
+    Args:
+        jobs: Job dictionaries
+        skill_extractor: Defaults to DEFAULT_SKILL_EXTRACTOR
+        job_level_classifier: Defaults to DEFAULT_JOB_LEVEL_CLASSIFIER
+
+    Returns:
+        The same list, for chaining
+    """
+    skill_extractor = skill_extractor or DEFAULT_SKILL_EXTRACTOR
+    job_level_classifier = job_level_classifier or DEFAULT_JOB_LEVEL_CLASSIFIER
+    missing = [job for job in jobs if job.get('skills') is None or job.get('job_level') is None]
+    summaries = [_description(job) for job in missing]
+    for job, summary, skills in zip(missing, summaries, skill_extractor.extract_many(summaries)):
+        if job.get('job_level') is None:
+            job['job_level'] = job_level_classifier.classify(job.get('title') or '', summary)
+        if job.get('skills') is None:
+            job['skills'] = skills
+    return jobs
+
+
+def _description(job: Dict) -> str:
+    """Summary of a job, empty if it is a placeholder"""
+    summary = (job.get('summary') or '').strip()
+    return '' if summary.lower() in PLACEHOLDER_SUMMARIES else summary
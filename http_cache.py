@@ -0,0 +1,209 @@
+"""
+Persistent on-disk cache for job portal result pages
+"""
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Cache location, override with the JOB_SCANNER_CACHE_DIR environment variable
+CACHE_DIR = os.environ.get('JOB_SCANNER_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+
+# Seconds a cached page is served without asking the portal again. After
+# that it is revalidated with If-None-Match / If-Modified-Since when the
+# portal sent an ETag or Last-Modified header, otherwise fetched again.
+PORTAL_CACHE_TTLS = {
+    'default': 15 * 60,
+    'Arbeitsagentur.de': 60 * 60,
+}
+
+# Least recently used pages are evicted once the cache grows beyond this
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+
+
+def normalize_url(url: str, params: Optional[Dict] = None) -> str:
+    """Canonical form of url + params used as cache key (sorted query, lower-case host)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(key), str(value)) for key, value in params.items())
+    query.sort()
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', urlencode(query), ''))
+
+
+class CachedResponse:
+    """Minimal stand-in for a requests/httpx response served from the cache"""
+
+    from_cache = True
+
+    def __init__(self, url: str, status_code: int, content: bytes, headers: Dict[str, str]):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def raise_for_status(self):
+        """Only successful responses are cached, so there is nothing to raise"""
+        pass
+
+
+class ResponseCache:
+    """
+    SQLite-backed HTTP response cache with per-portal TTLs and LRU eviction
+
+    Only 200 responses are stored. Page bodies are zlib-compressed, and the
+    database is opened lazily on first use so importing this module has no
+    side effects.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttls: Optional[Dict[str, int]] = None,
+                 max_bytes: int = MAX_CACHE_BYTES):
+        self.path = path or os.path.join(CACHE_DIR, 'http_cache.sqlite3')
+        self.ttls = dict(PORTAL_CACHE_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+        self._total_bytes = 0  # running size of all stored pages, so inserts need no full scan
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    content BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)')
+            self._total_bytes = self._stored_bytes(conn)
+            self._conn = conn
+        return self._conn
+
+    def ttl(self, portal_name: str) -> int:
+        return self.ttls.get(portal_name, self.ttls.get('default', PORTAL_CACHE_TTLS['default']))
+
+    def lookup(self, portal_name: str, url: str, params: Optional[Dict] = None) -> Tuple[Optional[CachedResponse], Dict[str, str]]:
+        """
+        Look up a page
+
+        Returns:
+            Tuple of (cached response if still fresh, validation headers for a conditional request)
+        """
+        key = normalize_url(url, params)
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    'SELECT url, status_code, content, etag, last_modified, stored_at FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None, {}
+
+                cached_url, status_code, content, etag, last_modified, stored_at = row
+                if time.time() - stored_at < self.ttl(portal_name):
+                    conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+                    conn.commit()
+                    return CachedResponse(cached_url, status_code, zlib.decompress(content), {}), {}
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed: {str(e)}")
+            return None, {}
+
+        validators = {}
+        if etag:
+            validators['If-None-Match'] = etag
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        return None, validators
+
+    def update(self, portal_name: str, url: str, params: Optional[Dict], response):
+        """
+        Store a fetched page and return the response to use
+
+        A 304 Not Modified refreshes the stored entry and returns it; a 200 is
+        stored as-is; anything else passes through untouched.
+        """
+        key = normalize_url(url, params)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                if response.status_code == 304:
+                    row = conn.execute('SELECT url, status_code, content FROM responses WHERE key = ?', (key,)).fetchone()
+                    if row is None:
+                        return response
+                    conn.execute('UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?', (now, now, key))
+                    conn.commit()
+                    return CachedResponse(row[0], row[1], zlib.decompress(row[2]), {})
+
+                if response.status_code != 200:
+                    return response
+
+                content = zlib.compress(response.content, 1)
+                replaced = conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, url, status_code, content, etag, last_modified, stored_at, accessed_at, size) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (key, str(response.url), response.status_code, content,
+                     response.headers.get('ETag'), response.headers.get('Last-Modified'), now, now, len(content))
+                )
+                self._total_bytes += len(content) - (replaced[0] if replaced else 0)
+                self._evict(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache update failed: {str(e)}")
+        return response
+
+    @staticmethod
+    def _stored_bytes(conn: sqlite3.Connection) -> int:
+        return conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used pages until the cache is below 90% of max_bytes"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        # Other processes may share the file: recount before evicting anything
+        total = self._stored_bytes(conn)
+        if total <= self.max_bytes:
+            self._total_bytes = total
+            return
+
+        target = self.max_bytes * 0.9
+        for key, size in conn.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+            if total <= target:
+                break
+            conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+        self._total_bytes = total
+
+    def clear(self):
+        """Remove every cached page"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM responses')
+            conn.commit()
+            self._total_bytes = 0
+
+
+# Cache shared by every scraper in the process
+DEFAULT_RESPONSE_CACHE = ResponseCache()
@@ -0,0 +1,319 @@
+"""
+Persistent SQLite store of scraped jobs
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from text_search import fts_query, index_text
+
+logger = logging.getLogger(__name__)
+
+# Where the job database lives, override with the JOB_SCANNER_DATA_DIR environment variable
+DATA_DIR = os.environ.get('JOB_SCANNER_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.data'))
+
+# Job fields stored as columns, in table order
+JOB_FIELDS = ['portal', 'title', 'company', 'location', 'summary', 'url', 'salary', 'job_level', 'posted_date']
+# Job fields in the full-text index and their BM25 weights
+TEXT_FIELDS = ['title', 'company', 'summary']
+TEXT_WEIGHTS = [3.0, 1.0, 1.0]
+
+
+def job_key(job: Dict) -> str:
+    """
+    Stable identity of a posting: portal + Indeed job id / URL
+
+    Postings without a URL fall back to a hash of title, company and location.
+    """
+    portal = job.get('portal', '')
+    url = job.get('url') or ''
+    if url:
+        parts = urlsplit(url)
+        jk = parse_qs(parts.query).get('jk')
+        if jk:
+            return f"{portal}:jk:{jk[0]}"
+        return f"{portal}:{parts.netloc.lower()}{parts.path}" + (f"?{parts.query}" if parts.query else '')
+    identity = '|'.join((job.get(field) or '').strip().lower() for field in ('title', 'company', 'location'))
+    return f"{portal}:h:{hashlib.sha1(identity.encode('utf-8')).hexdigest()}"
+
+
+def job_fingerprint(job: Dict) -> str:
+    """Hash of a posting's content, used to detect changed postings"""
+    content = json.dumps([job.get(field) for field in JOB_FIELDS] + [sorted(job.get('skills') or [])], ensure_ascii=False)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    """
+    SQLite (WAL) store of every job seen, with bulk upserts and indexed queries
+
+    Skills are kept in a separate job_skills table so they can be indexed.
+    Title, company and summary are kept, stemmed, in the FTS5 table jobs_fts
+    (rowid = jobs rowid) for ranked keyword search. The database is opened
+    lazily on first use.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(DATA_DIR, 'jobs.sqlite3')
+        self._conn = None
+        self._lock = threading.Lock()
+        self._full_text = True
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_key TEXT PRIMARY KEY,
+                    portal TEXT,
+                    title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    summary TEXT,
+                    url TEXT,
+                    salary TEXT,
+                    job_level TEXT,
+                    posted_date TEXT,
+                    skills TEXT,
+                    fingerprint TEXT,
+                    first_seen REAL,
+                    last_seen REAL
+                );
+                CREATE TABLE IF NOT EXISTS job_skills (
+                    job_key TEXT NOT NULL,
+                    skill TEXT NOT NULL,
+                    PRIMARY KEY (job_key, skill)
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+                CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+                CREATE INDEX IF NOT EXISTS idx_jobs_portal ON jobs (portal);
+                CREATE INDEX IF NOT EXISTS idx_jobs_job_level ON jobs (job_level);
+                CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs (posted_date);
+                CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills (skill);
+            ''')
+            try:
+                conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5({', '.join(TEXT_FIELDS)}, "
+                             "tokenize = \"unicode61 tokenchars '+#.'\")")
+                with conn:
+                    self._index_text(conn, 'SELECT rowid, * FROM jobs WHERE rowid NOT IN (SELECT rowid FROM jobs_fts)', [])
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Full-text search unavailable: {str(e)}")
+                self._full_text = False
+            self._conn = conn
+        return self._conn
+
+    def _index_text(self, conn: sqlite3.Connection, select: str, params: List):
+        """(Re-)index the text of the jobs returned by select (which must include their rowid)"""
+        rows = conn.execute(select, params).fetchall()
+        conn.executemany('DELETE FROM jobs_fts WHERE rowid = ?', [(row['rowid'],) for row in rows])
+        conn.executemany(
+            f"INSERT INTO jobs_fts (rowid, {', '.join(TEXT_FIELDS)}) VALUES (?{', ?' * len(TEXT_FIELDS)})",
+            [(row['rowid'], *[index_text(row[field]) for field in TEXT_FIELDS]) for row in rows]
+        )
+
+    def upsert_jobs(self, jobs: Iterable[Dict]) -> Tuple[int, int]:
+        """
+        Insert new jobs and update changed ones in a single transaction
+
+        Returns:
+            Tuple of (number of new jobs, number of updated jobs)
+        """
+        now = time.time()
+        rows = {}
+        for job in jobs:
+            rows[job_key(job)] = job
+        if not rows:
+            return 0, 0
+
+        with self._lock:
+            conn = self._connection()
+            known = self._fingerprints(conn, list(rows))
+            inserted = sum(1 for key in rows if key not in known)
+            changed = [key for key, job in rows.items() if key in known and known[key] != job_fingerprint(job)]
+
+            with conn:
+                conn.executemany(
+                    '''
+                    INSERT INTO jobs (job_key, portal, title, company, location, summary, url, salary, job_level,
+                                      posted_date, skills, fingerprint, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_key) DO UPDATE SET
+                        portal = excluded.portal, title = excluded.title, company = excluded.company,
+                        location = excluded.location, summary = excluded.summary, url = excluded.url,
+                        salary = excluded.salary, job_level = excluded.job_level,
+                        posted_date = COALESCE(excluded.posted_date, jobs.posted_date),
+                        skills = excluded.skills, fingerprint = excluded.fingerprint, last_seen = excluded.last_seen
+                    ''',
+                    [
+                        (key, *[job.get(field) for field in JOB_FIELDS], json.dumps(job.get('skills') or []),
+                         job_fingerprint(job), now, now)
+                        for key, job in rows.items()
+                    ]
+                )
+                changed_keys = [key for key in rows if key not in known] + changed
+                conn.executemany('DELETE FROM job_skills WHERE job_key = ?', [(key,) for key in changed_keys])
+                conn.executemany(
+                    'INSERT OR IGNORE INTO job_skills (job_key, skill) VALUES (?, ?)',
+                    [(key, skill) for key in changed_keys for skill in (rows[key].get('skills') or [])]
+                )
+                if self._full_text:
+                    # Stay below SQLite's host parameter limit
+                    for start in range(0, len(changed_keys), 500):
+                        chunk = changed_keys[start:start + 500]
+                        self._index_text(conn, f"SELECT rowid, * FROM jobs WHERE job_key IN ({','.join('?' * len(chunk))})",
+                                         chunk)
+
+        return inserted, len(changed)
+
+    def _fingerprints(self, conn: sqlite3.Connection, keys: List[str]) -> Dict[str, str]:
+        result = {}
+        # Stay below SQLite's host parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for row in conn.execute(f'SELECT job_key, fingerprint FROM jobs WHERE job_key IN ({placeholders})', chunk):
+                result[row['job_key']] = row['fingerprint']
+        return result
+
+    def fingerprints(self, keys: List[str]) -> Dict[str, str]:
+        """Map of job_key -> content fingerprint for the given keys that are already stored"""
+        with self._lock:
+            return self._fingerprints(self._connection(), keys)
+
+    def touch(self, keys: List[str]) -> int:
+        """
+        Mark stored jobs as seen now without rewriting them, e.g. unchanged jobs skipped by an incremental crawl
+
+        Returns:
+            Number of jobs updated
+        """
+        now = time.time()
+        keys = list(dict.fromkeys(keys))
+        touched = 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                # Stay below SQLite's host parameter limit
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    touched += conn.execute(f"UPDATE jobs SET last_seen = ? WHERE job_key IN ({','.join('?' * len(chunk))})",
+                                            (now, *chunk)).rowcount
+        return touched
+
+    def query(self, companies: Optional[List[str]] = None, locations: Optional[List[str]] = None,
+              portals: Optional[List[str]] = None, job_levels: Optional[List[str]] = None,
+              skills: Optional[List[str]] = None, posted_since: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict]:
+        """
+        Return stored jobs matching every given filter, most recently seen first
+
+        Args:
+            companies, locations, portals, job_levels: Match any of the values
+            skills: Jobs having at least one of these skills
+            posted_since: Only jobs posted on or after this YYYY-MM-DD date
+            limit: Maximum number of jobs to return
+        """
+        clauses = []
+        params = []
+        for column, values in (('company', companies), ('location', locations),
+                               ('portal', portals), ('job_level', job_levels)):
+            if values:
+                clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+        if skills:
+            clauses.append(f"job_key IN (SELECT job_key FROM job_skills WHERE skill IN ({','.join('?' * len(skills))}))")
+            params.extend(skills)
+        if posted_since:
+            clauses.append('posted_date >= ?')
+            params.append(posted_since)
+
+        sql = 'SELECT * FROM jobs'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY last_seen DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def _search(self, columns: str, text: str, limit: Optional[int], keys: Optional[List[str]] = None) -> List[sqlite3.Row]:
+        query = fts_query(text)
+        if not query:
+            return []
+        sql = (f"SELECT {columns}, bm25(jobs_fts, {', '.join(map(str, TEXT_WEIGHTS))}) AS rank "
+               'FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid WHERE jobs_fts MATCH ?')
+        if keys is None:
+            statements = [(sql, [query])]
+        else:
+            # Stay below SQLite's host parameter limit
+            statements = [(f"{sql} AND jobs.job_key IN ({','.join('?' * len(keys[start:start + 500]))})",
+                           [query, *keys[start:start + 500]])
+                          for start in range(0, len(keys), 500)]
+
+        rows = []
+        with self._lock:
+            conn = self._connection()
+            if not self._full_text:
+                return []
+            for statement, params in statements:
+                statement += ' ORDER BY rank'
+                if limit:
+                    statement += ' LIMIT ?'
+                    params.append(limit)
+                rows.extend(conn.execute(statement, params).fetchall())
+        if len(statements) > 1:
+            rows.sort(key=lambda row: row['rank'])
+        return rows[:limit] if limit else rows
+
+    def search_keys(self, text: str, limit: Optional[int] = None, keys: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Full-text search over title, company and summary of the stored jobs
+
+        Query terms are stemmed like the indexed text, so German inflections
+        ("Entwickler", "Entwicklerin", "Entwicklern") and "(m/w/d)" tags do not
+        matter. Jobs matching any term are returned, ranked by BM25 with the
+        title weighted highest.
+
+        Args:
+            text: The query
+            limit: Maximum number of jobs to return
+            keys: Only search the jobs with these job_keys, e.g. the current search results
+
+        Returns:
+            Map of job_key -> relevance (higher is better), best matches first
+        """
+        # bm25() is lower for better matches
+        rows = self._search('jobs.job_key', text, limit, list(dict.fromkeys(keys)) if keys is not None else None)
+        return {row['job_key']: -row['rank'] for row in rows}
+
+    def search(self, text: str, limit: Optional[int] = 50) -> List[Dict]:
+        """Stored jobs best matching a keyword query (see search_keys()), with their 'relevance'"""
+        return [dict(self._row_to_job(row), relevance=-row['rank']) for row in self._search('jobs.*', text, limit)]
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict:
+        job = {field: row[field] for field in JOB_FIELDS}
+        job['skills'] = json.loads(row['skills'] or '[]')
+        return job
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+
+# Store shared by the app and background jobs
+DEFAULT_JOB_STORE = JobStore()
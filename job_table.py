@@ -0,0 +1,234 @@
+"""
+Columnar job table and facet index for filtering search results
+"""
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from job_store import job_key
+from text_search import TermIndex, tokenize
+
+# Job level shown for jobs without one
+UNSPECIFIED_LEVEL = 'Not Specified'
+# Placeholder company of jobs whose company could not be scraped
+UNKNOWN_COMPANY = 'N/A'
+
+# Single-valued facets, stored as categorical columns
+CATEGORICAL_FACETS = ('company', 'location', 'portal', 'job_level')
+# All facets; 'skills' is multi-valued and stored as a bitmap
+FACETS = CATEGORICAL_FACETS + ('skills',)
+# mask() argument of each facet
+FACET_ARGUMENTS = {'companies': 'company', 'locations': 'location', 'portals': 'portal', 'levels': 'job_level',
+                   'skills': 'skills'}
+
+
+def result_hash(jobs: List[Dict]) -> str:
+    """Hash of a result set, equal for equal job lists regardless of the list object"""
+    content = json.dumps(jobs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class JobTable:
+    """
+    Jobs of one search as columns, built once and filtered with boolean masks
+
+    Company, location, portal and job level are categorical columns, the
+    posting date is parsed into a datetime column and the skills are kept as
+    a jobs x skills boolean matrix. Filters are vectorized over all jobs and
+    only the selected rows are turned back into job dictionaries.
+
+    The table doubles as a facet index: the posting bitmap of a categorical
+    value is `codes == value code` (each job has exactly one), the one of a
+    skill is its bitmap column. Options and per-option counts under the
+    current filters are computed from those without touching the jobs.
+    """
+
+    def __init__(self, jobs: List[Dict]):
+        self.jobs = jobs
+        self.keys = [job_key(job) for job in jobs]
+        self.frame = pd.DataFrame({
+            'company': pd.Categorical([job.get('company') or '' for job in jobs]),
+            'location': pd.Categorical([job.get('location') or '' for job in jobs]),
+            'portal': pd.Categorical([job.get('portal') or '' for job in jobs]),
+            'job_level': pd.Categorical([job.get('job_level') or UNSPECIFIED_LEVEL for job in jobs]),
+            'has_salary': np.array([bool(job.get('salary')) for job in jobs], dtype=bool),
+            'posted': pd.to_datetime(pd.Series([job.get('posted_date') for job in jobs], dtype=object),
+                                     format='%Y-%m-%d', errors='coerce'),
+        })
+
+        # Skills bitmap: column i is True for the jobs requiring self.skills[i]
+        self.skills = sorted({skill for job in jobs for skill in job.get('skills') or []})
+        skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.skill_bitmap = np.zeros((len(jobs), len(self.skills)), dtype=bool)
+        for row, job in enumerate(jobs):
+            for skill in job.get('skills') or []:
+                self.skill_bitmap[row, skill_index[skill]] = True
+
+        # Facet index: values of every facet, their positions and the job -> value codes
+        self.values = {facet: list(self.frame[facet].cat.categories) for facet in CATEGORICAL_FACETS}
+        self.values['skills'] = self.skills
+        self.codes = {facet: self.frame[facet].cat.codes.to_numpy() for facet in CATEGORICAL_FACETS}
+        self._positions = {facet: {value: i for i, value in enumerate(values)} for facet, values in self.values.items()}
+        self._options = {}
+        self._term_indexes = {}
+        self._display = None
+        self._display_date = None
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def options(self, facet: str) -> List[str]:
+        """Sorted distinct values of a facet, without empty and unknown ones"""
+        if facet not in self._options:
+            self._options[facet] = sorted(value for value in self.values[facet] if value and value != UNKNOWN_COMPANY)
+        return self._options[facet]
+
+    def count_distinct(self, facet: str) -> int:
+        return len(self.options(facet))
+
+    def facet_mask(self, facet: str, selected: Iterable[str]) -> np.ndarray:
+        """Union of the posting bitmaps of the selected values of a facet"""
+        positions = self._positions[facet]
+        columns = [positions[value] for value in selected if value in positions]
+        if facet == 'skills':
+            return self.skill_bitmap[:, columns].any(axis=1)
+        return np.isin(self.codes[facet], columns)
+
+    def mask(self, companies: Optional[Iterable[str]] = None, locations: Optional[Iterable[str]] = None,
+             portals: Optional[Iterable[str]] = None, levels: Optional[Iterable[str]] = None,
+             skills: Optional[Iterable[str]] = None, has_salary: Optional[bool] = None,
+             posted_within_days: Optional[int] = None, within: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Boolean mask of the jobs passing all given filters
+
+        Args:
+            companies, locations, portals, levels: Keep jobs with one of these values (empty or None: no filter)
+            skills: Keep jobs requiring at least one of these skills
+            has_salary: Keep jobs with (True) or without (False) salary information
+            posted_within_days: Keep jobs posted on or after this many days ago (undated jobs are dropped)
+            within: Keep only jobs already selected by this mask, e.g. full-text matches
+        """
+        mask = np.ones(len(self.jobs), dtype=bool) if within is None else within.copy()
+        for argument, selected in (('companies', companies), ('locations', locations), ('portals', portals),
+                                   ('levels', levels), ('skills', skills)):
+            if selected:
+                mask &= self.facet_mask(FACET_ARGUMENTS[argument], selected)
+
+        if has_salary is not None:
+            mask &= self.frame['has_salary'].to_numpy() == has_salary
+
+        if posted_within_days is not None:
+            cutoff = pd.Timestamp(datetime.now().date() - timedelta(days=posted_within_days))
+            mask &= (self.frame['posted'] >= cutoff).to_numpy()
+
+        return mask
+
+    def facet_counts(self, facet: str, **filters) -> Dict[str, int]:
+        """
+        Number of jobs per value of a facet under the current filters
+
+        The facet's own selection is ignored, so the counts tell how many jobs
+        each value would match if it were selected.
+
+        Args:
+            facet: One of FACETS
+            **filters: Arguments of mask()
+        """
+        mask = self.mask(**{argument: value for argument, value in filters.items()
+                            if FACET_ARGUMENTS.get(argument) != facet})
+        if facet == 'skills':
+            counts = self.skill_bitmap[mask].sum(axis=0)
+        else:
+            counts = np.bincount(self.codes[facet][mask], minlength=len(self.values[facet]))
+        return dict(zip(self.values[facet], counts.tolist()))
+
+    def terms(self, field: str) -> TermIndex:
+        """Term index of a text field (title, summary, ...), built on first use"""
+        if field not in self._term_indexes:
+            self._term_indexes[field] = TermIndex(job.get(field) or '' for job in self.jobs)
+        return self._term_indexes[field]
+
+    def display(self, today: Optional[date] = None) -> pd.DataFrame:
+        """
+        Display strings of every job
+
+        Columns: title, company, location, portal, job_level, posted (e.g.
+        "3 days ago"), salary, skills (all, comma separated), top_skills
+        (first 5) and url. The strings are computed once per table; only the
+        relative posting dates are redone when the day changes, as tables
+        are shared between sessions and outlive a day.
+
+        Args:
+            today: Date the posting ages are relative to (default: today)
+        """
+        today = today or datetime.now().date()
+        if self._display is None:
+            self._display = pd.DataFrame({
+                'title': [job.get('title') or '' for job in self.jobs],
+                'company': [job.get('company') or '' for job in self.jobs],
+                'location': [job.get('location') or '' for job in self.jobs],
+                'portal': [job.get('portal') or '' for job in self.jobs],
+                'job_level': [job.get('job_level') or '' for job in self.jobs],
+                'posted': '',
+                'salary': [job.get('salary') or '' for job in self.jobs],
+                'skills': [', '.join(job.get('skills') or []) for job in self.jobs],
+                'top_skills': [', '.join((job.get('skills') or [])[:5]) for job in self.jobs],
+                'url': [job.get('url') or '' for job in self.jobs],
+            })
+        if self._display_date != today:
+            # Replace rather than assign the column: frames returned for another day stay as they were
+            self._display = self._display.assign(posted=self._posted_labels(today))
+            self._display_date = today
+        return self._display
+
+    def _posted_labels(self, today: date) -> np.ndarray:
+        days = (pd.Timestamp(today) - self.frame['posted']).dt.days
+        whole_days = days.fillna(0).astype(int).astype(str)
+        weeks = days.fillna(0).astype(int) // 7
+        return np.select(
+            [days == 0, days == 1, days < 7, days < 30],
+            ["Today", "Yesterday", whole_days + " days ago",
+             weeks.astype(str) + " week" + np.where(weeks > 1, "s", "") + " ago"],
+            # Older and unparsable dates are shown as scraped
+            default=np.array([job.get('posted_date') or '' for job in self.jobs], dtype=object)
+        )
+
+    def relevance(self, scores: Dict[str, float]) -> np.ndarray:
+        """Per-job scores from a map of job_key -> score (e.g. JobStore.search_keys()), NaN for jobs not in it"""
+        return np.array([scores.get(key, np.nan) for key in self.keys], dtype=float)
+
+    def text_relevance(self, text: str, scores: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Per-job relevance to a text query, NaN for jobs not matching it
+
+        Args:
+            text: The query
+            scores: job_key -> relevance from the job store (JobStore.search_keys()). Jobs it
+                    has no score for - e.g. results that were never stored - are matched
+                    against their title, company and summary here, scored by the number
+                    of query terms found per field divided by the number of query terms
+        """
+        relevance = self.relevance(scores or {})
+        terms = set(tokenize(text))
+        missing = np.isnan(relevance)
+        if terms and missing.any():
+            found = sum(self.terms(field).count_matches(terms) for field in ('title', 'company', 'summary')) / len(terms)
+            fill = missing & (found > 0)
+            relevance[fill] = found[fill]
+        return relevance
+
+    def select(self, mask: np.ndarray, scores: Optional[np.ndarray] = None) -> List[Dict]:
+        """Jobs of the rows selected by mask, best scores first if scores are given, else in their original order"""
+        rows = np.flatnonzero(mask)
+        if scores is not None:
+            rows = rows[np.argsort(-scores[rows], kind='stable')]
+        return self.take(rows)
+
+    def take(self, rows: Iterable[int]) -> List[Dict]:
+        """Jobs of the given rows, in that order"""
+        jobs = self.jobs
+        return [jobs[row] for row in rows]
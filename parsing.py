@@ -0,0 +1,260 @@
+"""
+Selector chains for job cards and the HTML backends that evaluate them
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
+from lxml import etree, html as lxml_html
+
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat('" + "', \"'\", '".join(value.split("'")) + "')"
+
+
+class Sel:
+    """
+    One way of locating an element, the data form of BeautifulSoup's find(tag, attrs)
+
+    Args:
+        tag: Element name, None for any element
+        cls: Class the element must have (one of its class names)
+        attrs: Attribute values the element must have, True = attribute present
+        class_contains: The class attribute must contain one of these substrings (case-insensitive)
+        class_contains_all: The class attribute must contain all of these substrings (case-insensitive)
+        attr_contains: {attribute: substrings} - the attribute must contain one of the substrings (case-insensitive)
+        having: Groups of selectors; the element must contain a match of at least one selector of every group
+        items: Makes this a container selector - the cards are the matches of the first of
+               these selectors that finds anything inside the first matching container
+
+    A selector is compiled once, when it is created, into find() arguments for
+    BeautifulSoup and an XPath expression for lxml.
+    """
+
+    __slots__ = ('tag', 'cls', 'attrs', 'class_contains', 'class_contains_all', 'attr_contains', 'having', 'items',
+                 'soup_attrs', 'predicate', 'xpath_all', 'xpath_first')
+
+    def __init__(self, tag: Optional[str] = None, cls: Optional[str] = None, attrs: Optional[Dict[str, object]] = None,
+                 class_contains: Sequence[str] = (), class_contains_all: Sequence[str] = (),
+                 attr_contains: Optional[Dict[str, Sequence[str]]] = None, having: Sequence[Sequence['Sel']] = (),
+                 items: Sequence['Sel'] = ()):
+        self.tag = tag
+        self.cls = cls
+        self.attrs = dict(attrs or {})
+        self.class_contains = tuple(value.lower() for value in class_contains)
+        self.class_contains_all = tuple(value.lower() for value in class_contains_all)
+        self.attr_contains = {name: tuple(value.lower() for value in values) for name, values in (attr_contains or {}).items()}
+        self.having = tuple(tuple(group) for group in having)
+        self.items = tuple(items)
+
+        soup_attrs = dict(self.attrs)
+        if cls:
+            soup_attrs['class'] = cls
+        if self.class_contains or self.class_contains_all:
+            any_of, all_of = self.class_contains, self.class_contains_all
+            soup_attrs['class'] = lambda x: (bool(x) and (not any_of or any(needle in x.lower() for needle in any_of)) and
+                                             all(needle in x.lower() for needle in all_of))
+        for name, needles in self.attr_contains.items():
+            soup_attrs[name] = lambda x, needles=needles: bool(x) and any(needle in x.lower() for needle in needles)
+        self.soup_attrs = soup_attrs
+
+        conditions = []
+        if cls:
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), {_xpath_literal(f' {cls} ')})")
+        for name, value in self.attrs.items():
+            conditions.append(f"@{name}" if value is True else f"@{name}={_xpath_literal(str(value))}")
+        contains = dict(self.attr_contains)
+        if self.class_contains:
+            contains['class'] = self.class_contains
+        for name, needles in contains.items():
+            lowered = f"translate(@{name}, '{_UPPER}', '{_LOWER}')"
+            conditions.append('(' + ' or '.join(f"contains({lowered}, {_xpath_literal(needle)})" for needle in needles) + ')')
+        for needle in self.class_contains_all:
+            conditions.append(f"contains(translate(@class, '{_UPPER}', '{_LOWER}'), {_xpath_literal(needle)})")
+        for group in self.having:
+            conditions.append('(' + ' or '.join(f".//{sel.predicate}" for sel in group) + ')')
+        self.predicate = (tag or '*') + ''.join(f'[{condition}]' for condition in conditions)
+        self.xpath_all = etree.XPath(f'.//{self.predicate}')
+        self.xpath_first = etree.XPath(f'(.//{self.predicate})[1]')
+
+    def __repr__(self) -> str:
+        parts = [self.tag or '*']
+        if self.cls:
+            parts.append(f'.{self.cls}')
+        for name, value in self.attrs.items():
+            parts.append(f'[{name}]' if value is True else f'[{name}="{value}"]')
+        if self.class_contains:
+            parts.append(f"[class*={'|'.join(self.class_contains)}]")
+        for needle in self.class_contains_all:
+            parts.append(f"[class*={needle}]")
+        for name, needles in self.attr_contains.items():
+            parts.append(f"[{name}*={'|'.join(needles)}]")
+        for group in self.having:
+            parts.append(f":has({', '.join(repr(sel) for sel in group)})")
+        text = ''.join(parts)
+        if self.items:
+            text += f" > ({', '.join(repr(sel) for sel in self.items)})"
+        return text
+
+
+class SoupBackend:
+    """Evaluates selectors with BeautifulSoup (the original parsing path)"""
+
+    name = 'bs4'
+
+    def __init__(self, parser: str = 'html.parser'):
+        self.parser = parser
+
+    def parse(self, content):
+        return BeautifulSoup(content, self.parser)
+
+    def find(self, node, sel: Sel):
+        return node.find(self._name(sel), sel.soup_attrs)
+
+    def find_all(self, node, sel: Sel) -> List:
+        if sel.items:
+            container = self.find(node, sel)
+            if container is None:
+                return []
+            for item in sel.items:
+                found = self.find_all(container, item)
+                if found:
+                    return found
+            return []
+        return node.find_all(self._name(sel), sel.soup_attrs)
+
+    def _name(self, sel: Sel):
+        """Tag name to match, or a function checking the name and the 'having' groups"""
+        if not sel.having:
+            return sel.tag
+        return lambda tag: ((sel.tag is None or tag.name == sel.tag) and
+                            all(any(self.find(tag, inner) is not None for inner in group) for group in sel.having))
+
+    def text(self, node, separator: str = '') -> str:
+        return node.get_text(separator, strip=True)
+
+    def attr(self, node, name: str, default=None):
+        return node.get(name, default)
+
+    def tag(self, node) -> str:
+        return node.name
+
+    def body_html(self, root) -> str:
+        return str(root.body) if root.body else ''
+
+
+class LxmlBackend:
+    """
+    Evaluates selectors with lxml and their precompiled XPath expressions
+
+    Several times faster than BeautifulSoup: parsing and every lookup run in
+    C, and no Python predicate is called per element.
+    """
+
+    name = 'lxml'
+    _text = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+    def parse(self, content):
+        if isinstance(content, bytes):
+            try:
+                content = content.decode('utf-8')
+            except UnicodeDecodeError:
+                content = UnicodeDammit(content, is_html=True).unicode_markup
+        try:
+            return lxml_html.document_fromstring(content)
+        except (etree.ParserError, ValueError):
+            # Empty page, or an XML declaration that lxml refuses in a str
+            try:
+                return lxml_html.document_fromstring(content.encode('utf-8'))
+            except etree.ParserError:
+                return lxml_html.document_fromstring('<html><body></body></html>')
+
+    def find(self, node, sel: Sel):
+        found = sel.xpath_first(node)
+        return found[0] if found else None
+
+    def find_all(self, node, sel: Sel) -> List:
+        if sel.items:
+            container = self.find(node, sel)
+            if container is None:
+                return []
+            for item in sel.items:
+                found = item.xpath_all(container)
+                if found:
+                    return found
+            return []
+        return sel.xpath_all(node)
+
+    def text(self, node, separator: str = '') -> str:
+        return separator.join(filter(None, (text.strip() for text in self._text(node))))
+
+    def attr(self, node, name: str, default=None):
+        return node.get(name, default)
+
+    def tag(self, node) -> str:
+        return node.tag
+
+    def body_html(self, root) -> str:
+        body = root.find('body')
+        return etree.tostring(body, encoding='unicode', method='html', with_tail=False) if body is not None else ''
+
+
+# Names accepted for JobScraper.parser_backend
+PARSER_BACKENDS = ('bs4', 'lxml')
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: str, html_parser: str = 'html.parser'):
+    """Shared backend instance for a JobScraper.parser_backend / html_parser combination"""
+    if name == 'lxml':
+        return LxmlBackend()
+    if name == 'bs4':
+        return SoupBackend(html_parser)
+    raise ValueError(f"Unknown parser backend '{name}', expected one of {', '.join(PARSER_BACKENDS)}")
+
+
+def first(backend, node, chain: Iterable[Sel]):
+    """First element found by the selectors of a fallback chain, tried in order"""
+    for sel in chain:
+        found = backend.find(node, sel)
+        if found is not None:
+            return found
+    return None
+
+
+def first_text(backend, node, chain: Iterable[Sel], default: Optional[str] = None, separator: str = '') -> Optional[str]:
+    """
+    Text of the first element found by a fallback chain, default if none is found
+
+    The stripped text nodes are joined with separator; pass ' ' for running
+    text whose words may sit in different elements ("<li>AWS</li><li>Agile</li>").
+    """
+    found = first(backend, node, chain)
+    return backend.text(found, separator) if found is not None else default
+
+
+def find_cards(backend, root, chain: Iterable[Sel], tried: Optional[List[str]] = None) -> Tuple[List, Optional[Sel]]:
+    """
+    Cards found by the first selector of a chain that finds any
+
+    Args:
+        tried: Optional list the tried selectors are appended to (debug info)
+
+    Returns:
+        Tuple of (cards, selector that found them or None)
+    """
+    for sel in chain:
+        if tried is not None:
+            tried.append(repr(sel))
+        cards = backend.find_all(root, sel)
+        if cards:
+            return cards, sel
+    return [], None
@@ -0,0 +1,303 @@
+"""
+Declarative definitions of the supported job portals
+
+A PortalSpec describes everything portal specific - how to build the URL of
+a result page, where the job cards are and which selectors find each field
+of a card. JobScraper runs every spec through the same fetch and parse loop,
+so supporting a new portal or following a markup change is a matter of
+editing data here.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from parsing import Sel
+
+# Selectors shared by the portal definitions
+LINK = Sel('a')
+LINK_WITH_HREF = Sel('a', attrs={'href': True})
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """
+    How a page number maps to a query parameter
+
+    Args:
+        param: Query parameter carrying the page
+        first_page: Number of the first result page
+        page_limit: Pages are requested up to (excluding) this number
+        step: Parameter value per page (e.g. 10 for a result offset of 10 per page)
+        offset: Added to page * step
+        omit_first: The first page is requested without the parameter
+    """
+    param: str
+    first_page: int = 0
+    page_limit: int = 100
+    step: int = 1
+    offset: int = 0
+    omit_first: bool = False
+
+    def value(self, page: int) -> Optional[int]:
+        """Parameter value for a page, None if the parameter is left out"""
+        if self.omit_first and page == self.first_page:
+            return None
+        return page * self.step + self.offset
+
+
+@dataclass(frozen=True)
+class PortalSpec:
+    """
+    Everything the generic scraper needs to know about a portal
+
+    Args:
+        name: Portal name used for the 'portal' field and in log messages
+        url: Result page URL; {keywords} and {location} are replaced by lower-case, dash separated slugs
+        params: Query parameters; {keywords} and {location} are replaced by the search terms
+        pagination: How pages are requested
+        cards: Fallback chain of selectors for the result cards on the first page
+        fields: {field: fallback chain} for 'title', 'company', 'location', 'summary',
+                'salary', 'date' and 'link' (where the job URL is found when it
+                is not taken from the title, see link_from_title / link_in_title)
+        later_cards: Card selectors for the following pages (default: cards)
+        base_url: Relative job links are resolved against this URL
+        job_type_params: Extra query parameters per job type ("Full-time", "Remote", ...)
+        title_from_link: Take the title from the link inside the title element if there is one
+        link_from_title: The title element is the job link when it is an <a>
+        link_in_title: Otherwise the first <a> inside the title element is the job link, if there is one
+        job_id_attrs: Link attributes holding a job id, tried in order
+        job_id_prefix: Removed from the job id
+        job_url: URL template for jobs with an id, {id} is replaced
+        default_company: Company when a card has none
+        default_summary: Summary when a card has none
+        summary_placeholder: Summary of every job for portals whose cards have no description;
+                             skills and level are then extracted from the placeholder_fields
+        placeholder_fields: Job fields whose text replaces a placeholder summary for enrichment
+        card_limit: Maximum number of cards parsed per page
+        empty_page_error: debug_info error when the first page has no cards
+    """
+    name: str
+    url: str
+    params: Dict[str, str]
+    pagination: Pagination
+    cards: Tuple[Sel, ...]
+    fields: Dict[str, Tuple[Sel, ...]]
+    later_cards: Tuple[Sel, ...] = ()
+    base_url: str = ''
+    job_type_params: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    title_from_link: bool = False
+    link_from_title: bool = True
+    link_in_title: bool = True
+    job_id_attrs: Tuple[str, ...] = ()
+    job_id_prefix: str = ''
+    job_url: str = ''
+    default_company: str = 'Company not specified'
+    default_summary: str = ''
+    summary_placeholder: Optional[str] = None
+    placeholder_fields: Tuple[str, ...] = ('title', 'company', 'location')
+    card_limit: Optional[int] = None
+    empty_page_error: str = ''
+
+    def page_request(self, page: int, keywords: str, location: str, job_type: str = '') -> Tuple[str, Dict]:
+        """Return (url, params) of a result page"""
+        url = self.url.format(keywords=keywords.replace(' ', '-').lower(), location=location.replace(' ', '-').lower())
+        params = {name: value.format(keywords=keywords, location=location) for name, value in self.params.items()}
+        page_value = self.pagination.value(page)
+        if page_value is not None:
+            params[self.pagination.param] = page_value
+        params.update(self.job_type_params.get(job_type, {}))
+        return url, params
+
+
+INDEED = PortalSpec(
+    name='Indeed.de',
+    url='https://de.indeed.com/jobs',
+    params={'q': '{keywords}', 'l': '{location}'},
+    pagination=Pagination('start', step=10),
+    job_type_params={
+        'Full-time': {'jt': 'fulltime'},
+        'Part-time': {'jt': 'parttime'},
+        'Remote': {'remotejob': '032b3046-06a3-4876-8dfd-474eb5e7ed11'},
+    },
+    cards=(
+        Sel('div', cls='job_seen_beacon'),
+        Sel('div', cls='jobsearch-ResultsList',
+            items=[Sel('div', cls='cardOutline'), Sel('li'), Sel('td', cls='resultContent')]),
+        Sel('td', cls='resultContent'),
+        Sel('div', cls='cardOutline'),
+        Sel('a', cls='jcs-JobTitle'),
+    ),
+    later_cards=(
+        Sel('div', cls='job_seen_beacon'),
+        Sel('td', cls='resultContent'),
+    ),
+    fields={
+        'title': (Sel('h2', cls='jobTitle'), Sel('h2'), Sel('a', cls='jcs-JobTitle'), Sel('span', attrs={'title': True})),
+        'company': (Sel('span', attrs={'data-testid': 'company-name'}), Sel('span', cls='companyName'),
+                    Sel('span', cls='company'), Sel('span', cls='css-1h7lukg')),
+        'location': (Sel('div', attrs={'data-testid': 'text-location'}), Sel('div', cls='companyLocation'),
+                     Sel('div', cls='location'), Sel('div', cls='css-1p0sjhy')),
+        'summary': (Sel('div', cls='job-snippet'), Sel('div', cls='summary'), Sel('ul'),
+                    Sel('div', cls='jobCardShelfContainer')),
+        'salary': (Sel('span', cls='salary-snippet'), Sel('div', cls='salary-snippet'),
+                   Sel('div', attrs={'data-testid': 'attribute_snippet_testid'})),
+        'date': (Sel('span', attrs={'data-testid': 'myJobsStateDate'}), Sel('span', class_contains=['date']),
+                 Sel('span', cls='date')),
+    },
+    base_url='https://de.indeed.com',
+    job_id_attrs=('data-jk', 'id'),
+    job_id_prefix='job_',
+    job_url='https://de.indeed.com/viewjob?jk={id}',
+    default_company='Company not listed',
+    default_summary='No description available',
+)
+
+STEPSTONE = PortalSpec(
+    name='StepStone.de',
+    url='https://www.stepstone.de/work/{keywords}-jobs-in-{location}',
+    params={},
+    pagination=Pagination('page', first_page=1, page_limit=41, omit_first=True),
+    cards=(
+        Sel('article', attrs={'data-at': 'job-item'}),
+        Sel('article', cls='res-'),
+        Sel('li', attrs={'data-at': 'job-item'}),
+        Sel('div', cls='job-element'),
+        # Any article that looks like a job card
+        Sel('article', having=[[LINK], [Sel('h2'), Sel('h3')]]),
+    ),
+    later_cards=(
+        Sel('article', attrs={'data-at': 'job-item'}),
+        Sel('article', having=[[LINK], [Sel('h2'), Sel('h3')]]),
+    ),
+    fields={
+        'title': (Sel('h2'), Sel('h3'), Sel('a', attrs={'data-at': 'job-item-title'}), Sel('a', class_contains=['title'])),
+        'company': (Sel('span', attrs={'data-at': 'job-item-company-name'}), Sel('a', attrs={'data-at': 'job-item-company-name'}),
+                    Sel('div', class_contains=['company']), Sel('span', class_contains=['company'])),
+        'location': (Sel('span', attrs={'data-at': 'job-item-location'}), Sel('div', class_contains=['location']),
+                     Sel('span', class_contains=['location'])),
+        'salary': (Sel('span', attrs={'data-at': 'job-item-salary'}), Sel('span', class_contains=['salary'])),
+        'date': (Sel('span', class_contains=['date', 'time']), Sel('time')),
+        'link': (LINK_WITH_HREF,),
+    },
+    base_url='https://www.stepstone.de',
+    title_from_link=True,
+    link_from_title=False,
+    link_in_title=False,
+    default_company='Company not listed',
+    summary_placeholder='See full details on StepStone',
+)
+
+XING = PortalSpec(
+    name='XING Jobs',
+    url='https://www.xing.com/jobs/search',
+    params={'keywords': '{keywords}', 'location': '{location}'},
+    pagination=Pagination('page', first_page=1, page_limit=41),
+    cards=(
+        Sel('div', attrs={'data-xds': 'JobTeaser'}),
+        Sel('article', cls='job'),
+        Sel('div', cls='job-card'),
+        Sel('li', cls='job-posting'),
+        Sel('a', class_contains=['job']),
+        # Any div with a link and a heading
+        Sel('div', having=[[LINK_WITH_HREF], [Sel('h2'), Sel('h3'), Sel('h4')]]),
+    ),
+    later_cards=(
+        Sel('div', attrs={'data-xds': 'JobTeaser'}),
+        Sel('article', cls='job'),
+    ),
+    fields={
+        'title': (Sel('h2'), Sel('h3'), Sel('h4'), Sel('a', class_contains=['title']), LINK_WITH_HREF),
+        'company': (Sel('span', class_contains=['company']), Sel('div', class_contains=['company']),
+                    Sel('a', class_contains=['company'])),
+        'salary': (Sel('span', class_contains=['salary']),),
+        'date': (Sel('span', class_contains=['date', 'time']), Sel('time')),
+        'link': (LINK_WITH_HREF,),
+    },
+    base_url='https://www.xing.com',
+    title_from_link=True,
+    default_company='See on XING',
+    summary_placeholder='Full details available on XING',
+    placeholder_fields=('title', 'company'),
+)
+
+MONSTER = PortalSpec(
+    name='Monster.de',
+    url='https://www.monster.de/jobs/suche',
+    params={'q': '{keywords}', 'where': '{location}'},
+    pagination=Pagination('page', offset=1, omit_first=True),
+    cards=(
+        Sel('div', class_contains=['job-card']),
+        Sel('div', attrs={'data-test-id': 'svx-job-card'}),
+        Sel('article', class_contains=['job']),
+        Sel('div', cls='card'),
+        Sel('section', class_contains=['card']),
+    ),
+    fields={
+        'title': (Sel('h2'), Sel('h3'), Sel('a', attrs={'data-test-id': 'svx-job-title'}), Sel('a', class_contains=['title'])),
+        'company': (Sel('div', attrs={'data-test-id': 'svx-job-company'}), Sel('span', class_contains=['company']),
+                    Sel('div', class_contains=['company'])),
+        'location': (Sel('div', attrs={'data-test-id': 'svx-job-location'}), Sel('span', class_contains=['location']),
+                     Sel('div', class_contains=['location'])),
+        'summary': (Sel('div', class_contains=['description']), Sel('p'), Sel('div', class_contains=['summary'])),
+        'salary': (Sel('span', class_contains=['salary']), Sel('div', class_contains=['salary'])),
+        'date': (Sel('span', class_contains=['date', 'time']), Sel('div', class_contains=['date', 'time']), Sel('time')),
+        'link': (LINK,),
+    },
+    base_url='https://www.monster.de',
+    link_in_title=False,
+    card_limit=50,
+)
+
+ARBEITSAGENTUR = PortalSpec(
+    name='Arbeitsagentur.de',
+    url='https://www.arbeitsagentur.de/jobsuche',
+    params={'was': '{keywords}', 'wo': '{location}'},
+    pagination=Pagination('page', omit_first=True),
+    cards=(
+        Sel('div', class_contains_all=['job', 'card']),
+        Sel('article', class_contains=['job']),
+        Sel('div', attr_contains={'data-test': ['job']}),
+        Sel('li', class_contains=['result']),
+        Sel('div', cls='result-item'),
+    ),
+    fields={
+        'title': (Sel('h3'), Sel('h2'), Sel('a', class_contains=['title']), Sel('span', class_contains=['title'])),
+        'company': (Sel('span', class_contains=['company']), Sel('div', class_contains=['company']),
+                    Sel('p', class_contains=['company'])),
+        'location': (Sel('span', class_contains=['location', 'ort']), Sel('div', class_contains=['location', 'ort'])),
+        'summary': (Sel('div', class_contains=['description']), Sel('p', class_contains=['text', 'beschreibung']), Sel('p')),
+        'salary': (Sel('span', class_contains=['salary', 'gehalt']), Sel('div', class_contains=['salary', 'gehalt'])),
+        'date': (Sel('span', class_contains=['date', 'time']), Sel('div', class_contains=['date', 'time']), Sel('time')),
+        'link': (LINK,),
+    },
+    base_url='https://www.arbeitsagentur.de',
+    link_in_title=False,
+    card_limit=50,
+)
+
+LINKEDIN = PortalSpec(
+    name='LinkedIn',
+    url='https://www.linkedin.com/jobs/search',
+    params={'keywords': '{keywords}', 'location': '{location}'},
+    pagination=Pagination('start', step=25),
+    cards=(
+        Sel('li', class_contains=['job']),
+        Sel('div', class_contains=['job-search-card']),
+        Sel('div', attr_contains={'data-entity-urn': ['job']}),
+        Sel('article', class_contains=['job']),
+    ),
+    fields={
+        'title': (Sel('h3', class_contains=['job']), Sel('h3'), Sel('a', class_contains=['job-title'])),
+        'company': (Sel('h4', class_contains=['company']), Sel('a', class_contains=['company']),
+                    Sel('span', class_contains=['company'])),
+        'location': (Sel('span', class_contains=['location']), Sel('div', class_contains=['location'])),
+        'summary': (Sel('p'), Sel('div', class_contains=['description'])),
+        'salary': (Sel('span', class_contains=['salary']),),
+        'date': (Sel('time'),),
+        'link': (Sel('a', class_contains=['job']), LINK),
+    },
+    base_url='https://www.linkedin.com',
+    link_from_title=False,
+    link_in_title=False,
+    card_limit=50,
+    empty_page_error="LinkedIn may be blocking automated access. Consider using LinkedIn API or reducing request frequency.",
+)
@@ -0,0 +1,118 @@
+"""
+Scheduled pre-warming of the Quick Search searches
+
+The quick searches are re-scraped in the background on a fixed interval, so
+a click on a Quick Search button is answered from the result cache with
+recent data instead of starting a scan.
+"""
+import os
+import threading
+import logging
+from typing import List, Optional
+
+from http_cache import PORTAL_CACHE_TTLS
+from result_cache import RESULT_TTL, SearchResultCache, search_key
+from search_queue import DEFAULT_SEARCH_QUEUE, SearchQueue
+
+logger = logging.getLogger(__name__)
+
+# Quick Search buttons of the app: display name -> search keywords
+QUICK_SEARCHES = {
+    "Electrical Engineer": "Electrical Engineer",
+    "Software Engineer": "Software Engineer",
+    "Software Test Eng.": "Software Test Engineer",
+    "SW Automation": "Software Automation",
+    "Automation Eng.": "Automation Engineer",
+    "Data Analyst": "Data Analyst",
+    "Data Science": "Data Science",
+    "AI": "AI",
+    "ML": "Machine Learning"
+}
+
+# The app's default search settings; pre-warmed searches use them so their
+# result cache keys match what a Quick Search click submits
+DEFAULT_LOCATION = "Berlin"
+DEFAULT_PORTALS = ["StepStone.de", "XING Jobs"]
+DEFAULT_MAX_PAGES = 5
+DEFAULT_DEDUP = 'near'
+
+# Seconds between two refreshes of the same search, 0 disables pre-warming
+# (JOB_SCANNER_PREWARM_INTERVAL). The default is 5 minutes longer than the
+# response cache TTL of the default portals: by the next round the pages
+# fetched by the previous one have expired, so they are re-fetched or
+# revalidated with the portal instead of served from the response cache.
+# As that is longer than RESULT_TTL, pre-warmed searches stay fresh in the
+# result cache for the interval plus RESULT_TTL, until the next round has
+# replaced them.
+PREWARM_INTERVAL = int(os.environ.get(
+    'JOB_SCANNER_PREWARM_INTERVAL',
+    max(PORTAL_CACHE_TTLS.get(portal, PORTAL_CACHE_TTLS['default']) for portal in DEFAULT_PORTALS) + 5 * 60
+))
+
+
+class Prewarmer:
+    """
+    Background thread submitting every search once per interval to the search queue
+
+    Submissions are spaced evenly over the interval (interval / number of
+    searches apart) instead of all at once, so the portal requests are spread
+    out. The scans go through the search queue and the scrapers' rate limiter
+    like any user search, and fill the result cache and the job store. While
+    the scheduler runs, the result cache keeps the searches fresh until the
+    next round instead of for its regular TTL.
+    """
+
+    def __init__(self, searches: List[str], location: str = DEFAULT_LOCATION, portals: Optional[List[str]] = None,
+                 max_pages: int = DEFAULT_MAX_PAGES, interval: float = PREWARM_INTERVAL,
+                 search_queue: Optional[SearchQueue] = None, cache: Optional[SearchResultCache] = None):
+        self.searches = list(searches)
+        self.location = location
+        self.portals = list(portals) if portals is not None else list(DEFAULT_PORTALS)
+        self.max_pages = max_pages
+        self.interval = interval
+        self.search_queue = search_queue or DEFAULT_SEARCH_QUEUE
+        self.cache = cache or self.search_queue.cache
+        self._thread = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Start the scheduler unless it is running or disabled, return True if it runs"""
+        if self.interval <= 0 or not self.searches:
+            return False
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                for key in self.keys():
+                    self.cache.key_ttls[key] = self.interval + RESULT_TTL
+                self._thread = threading.Thread(target=self._loop, name='prewarm', daemon=True)
+                self._thread.start()
+        return True
+
+    def stop(self):
+        self._stopped.set()
+        for key in self.keys():
+            self.cache.key_ttls.pop(key, None)
+
+    def keys(self) -> List[str]:
+        """Result cache keys of the pre-warmed searches"""
+        return [search_key(keywords, self.location, "", self.portals, self.max_pages, DEFAULT_DEDUP)
+                for keywords in self.searches]
+
+    def _loop(self):
+        spacing = self.interval / len(self.searches)
+        index = 0
+        while not self._stopped.is_set():
+            keywords = self.searches[index % len(self.searches)]
+            index += 1
+            try:
+                self.search_queue.submit(keywords, self.location, "", self.portals, self.max_pages,
+                                         dedup=DEFAULT_DEDUP, refresh=True)
+                logger.info(f"Pre-warming search '{keywords}' in {self.location}")
+            except Exception as e:
+                logger.error(f"Pre-warming '{keywords}' failed: {str(e)}")
+            self._stopped.wait(spacing)
+
+
+# Scheduler of the app, started once per process
+DEFAULT_PREWARMER = Prewarmer(list(QUICK_SEARCHES.values()))
@@ -0,0 +1,76 @@
+"""
+Relevance ranking of search results
+"""
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from enrichment import DEFAULT_SKILL_EXTRACTOR
+from job_table import JobTable
+from text_search import tokenize
+
+# Weight of each signal in the relevance score; every signal is scaled to 0..1
+RANK_WEIGHTS = {
+    'title': 3.0,     # share of the query terms in the title
+    'summary': 1.0,   # share of the query terms in the summary
+    'skills': 1.5,    # share of the skills named in the query that the job requires
+    'recency': 1.0,   # halves every RECENCY_HALF_LIFE days since posting, 0 if undated
+    'salary': 0.5     # salary information given
+}
+# Days after which the recency signal of a posting has halved
+RECENCY_HALF_LIFE = 7.0
+
+
+def relevance_scores(table: JobTable, keywords: str, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Relevance of every job of a table to the search keywords, higher is better
+
+    Query terms are stemmed like the full-text index, and query skills are
+    found with the scrapers' skill extractor. All signals are computed as
+    arrays over the whole table.
+
+    Args:
+        table: Jobs to score
+        keywords: The search keywords
+        weights: Signal weights overriding those of RANK_WEIGHTS, e.g. {'recency': 0}
+    """
+    weights = {**RANK_WEIGHTS, **(weights or {})}
+    scores = np.zeros(len(table), dtype=float)
+    if not len(table):
+        return scores
+
+    terms = set(tokenize(keywords))
+    if terms:
+        for field in ('title', 'summary'):
+            scores += weights[field] * table.terms(field).count_matches(terms) / len(terms)
+
+    query_skills = [skill for skill in DEFAULT_SKILL_EXTRACTOR.extract(keywords) if skill in table.skills]
+    if query_skills:
+        columns = [table.skills.index(skill) for skill in query_skills]
+        scores += weights['skills'] * table.skill_bitmap[:, columns].sum(axis=1) / len(columns)
+
+    days = (pd.Timestamp(datetime.now().date()) - table.frame['posted']).dt.days.to_numpy(dtype=float, na_value=np.nan)
+    scores += weights['recency'] * np.nan_to_num(0.5 ** (np.clip(days, 0, None) / RECENCY_HALF_LIFE))
+    scores += weights['salary'] * table.frame['has_salary'].to_numpy()
+    return scores
+
+
+def top_k(scores: np.ndarray, mask: np.ndarray, k: int) -> np.ndarray:
+    """
+    Rows of the k best scored jobs selected by mask, best first
+
+    Uses a partial partition instead of sorting every selected job; ties are
+    broken by row, so consecutive pages (k = 10, 20, ...) never overlap.
+    """
+    rows = np.flatnonzero(mask)
+    if k <= 0:
+        return rows[:0]
+    if k < len(rows):
+        selected = scores[rows]
+        kth = np.partition(selected, len(rows) - k)[len(rows) - k]
+        better = rows[selected > kth]
+        tied = rows[selected == kth][:k - len(better)]
+        rows = np.sort(np.concatenate([better, tied]))
+    return rows[np.argsort(-scores[rows], kind='stable')]
@@ -0,0 +1,113 @@
+"""
+Process-wide per-host rate limiting for the job scrapers
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Requests per second and burst size per portal name. Portals without an
+# entry use 'default'. The defaults match the old 1.5-2.5s (2.5-4s for
+# LinkedIn) pause between pages, but allow a short burst up front.
+PORTAL_RATE_LIMITS = {
+    'default': (0.5, 3),
+    'LinkedIn': (0.3, 1),
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers
+    reserve a token and are told how long to wait for it, so concurrent
+    callers queue up fairly instead of all waking at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def release(self):
+        """Give back a reserved token that was not used"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class RateLimiter:
+    """
+    Registry of token buckets, one per host
+
+    Rates are configured per portal name (see PORTAL_RATE_LIMITS) and applied
+    to the host of each request URL, so all scrapers and threads in the
+    process share the same budget for a portal.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.limits = dict(PORTAL_RATE_LIMITS if limits is None else limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, portal_name: str, rate: float, burst: int = 1):
+        """Set the rate (requests/second) and burst for a portal, e.g. configure('Indeed.de', 1.0, 5)"""
+        with self._lock:
+            self.limits[portal_name] = (rate, burst)
+            # Drop existing buckets so the new rate applies immediately
+            self._buckets = {key: bucket for key, bucket in self._buckets.items() if key[0] != portal_name}
+
+    def _bucket(self, portal_name: str, url: str) -> TokenBucket:
+        key = (portal_name, urlsplit(url).netloc)
+        with self._lock:
+            if key not in self._buckets:
+                rate, burst = self.limits.get(portal_name, self.limits.get('default', PORTAL_RATE_LIMITS['default']))
+                self._buckets[key] = TokenBucket(rate, burst)
+            return self._buckets[key]
+
+    def acquire(self, portal_name: str, url: str, cancel: Optional[threading.Event] = None) -> bool:
+        """
+        Block until a request to url is allowed
+
+        Args:
+            cancel: Event set when the request is no longer wanted. If it is set
+                    before or while waiting, the token is given back and False is returned
+
+        Returns:
+            True if the request may be sent
+        """
+        if cancel is not None and cancel.is_set():
+            return False
+        bucket = self._bucket(portal_name, url)
+        delay = bucket.reserve()
+        if delay > 0:
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                bucket.release()
+                return False
+        return True
+
+    async def aacquire(self, portal_name: str, url: str):
+        """Wait on the event loop until a request to url is allowed"""
+        delay = self._bucket(portal_name, url).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Limiter shared by every scraper in the process
+DEFAULT_RATE_LIMITER = RateLimiter()
@@ -0,0 +1,342 @@
+"""
+Memoization of complete searches (scrape_all_portals results) and live searches
+whose results can be read while the portals are still being scraped
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from http_cache import CACHE_DIR
+from scrapers import normalize_query, scrape_all_portals, stream_all_portals
+from singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# A cached search is fresh for RESULT_TTL seconds. For another
+# RESULT_STALE_TTL seconds it is still returned immediately while a refresh
+# runs in the background (stale-while-revalidate).
+RESULT_TTL = 10 * 60
+RESULT_STALE_TTL = 50 * 60
+MAX_CACHED_SEARCHES = 200
+
+
+def search_key(keywords: str, location: str, job_type: str = "", selected_portals: Optional[List[str]] = None,
+               max_pages: int = 100, dedup: str = 'portal') -> str:
+    """Cache key for a search, insensitive to case and extra whitespace in the text inputs"""
+    portals = '|'.join(selected_portals) if selected_portals is not None else '*'
+    return '\x1f'.join([normalize_query(keywords), normalize_query(location), job_type or '', portals, str(max_pages), dedup])
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of (jobs, debug_summary) results with stale-while-revalidate
+
+    Entries live in memory; pass a path to also persist them in SQLite so they
+    survive restarts of the app.
+    """
+
+    def __init__(self, ttl: int = RESULT_TTL, stale_ttl: int = RESULT_STALE_TTL,
+                 max_entries: int = MAX_CACHED_SEARCHES, path: Optional[str] = None):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.path = path
+        # key -> freshness TTL of searches that are refreshed on a schedule
+        self.key_ttls = {}
+        self._entries = OrderedDict()  # key -> (stored_at, jobs, debug_summary)
+        self._refreshing = set()
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        if self._conn is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS search_results (
+                    key TEXT PRIMARY KEY,
+                    jobs TEXT NOT NULL,
+                    debug_summary TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_search_results_stored ON search_results (stored_at)')
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[float, List[Dict], Dict]]:
+        """Return (stored_at, jobs, debug_summary) for key, or None if unknown or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            else:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, entry)
+
+        if entry is None or time.time() - entry[0] >= self.ttl_for(key) + self.stale_ttl:
+            return None
+        return entry
+
+    def ttl_for(self, key: str) -> float:
+        """Seconds an entry for key stays fresh"""
+        return self.key_ttls.get(key, self.ttl)
+
+    def set(self, key: str, jobs: List[Dict], debug_summary: Dict):
+        entry = (time.time(), jobs, debug_summary)
+        with self._lock:
+            self._remember(key, entry)
+            self._save(key, entry)
+
+    def _remember(self, key: str, entry: Tuple[float, List[Dict], Dict]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Tuple[float, List[Dict], Dict]]:
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute('SELECT stored_at, jobs, debug_summary FROM search_results WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Search result cache lookup failed: {str(e)}")
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), json.loads(row[2])
+
+    def _save(self, key: str, entry: Tuple[float, List[Dict], Dict]):
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            stored_at, jobs, debug_summary = entry
+            conn.execute(
+                'INSERT OR REPLACE INTO search_results (key, jobs, debug_summary, stored_at) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(jobs, ensure_ascii=False), json.dumps(debug_summary, ensure_ascii=False, default=str), stored_at)
+            )
+            # Keep the disk backend bounded as well
+            conn.execute(
+                'DELETE FROM search_results WHERE key NOT IN (SELECT key FROM search_results ORDER BY stored_at DESC LIMIT ?)',
+                (self.max_entries,)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Search result cache update failed: {str(e)}")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Tuple[List[Dict], Dict]]) -> Tuple[List[Dict], Dict]:
+        """
+        Return the cached result for key, computing it on a miss
+
+        Fresh entries are returned as-is. Stale entries are returned immediately
+        while compute() refreshes them in a background thread. Concurrent misses
+        for the same key wait for a single compute().
+        """
+        entry = self.get(key)
+        if entry is None:
+            (jobs, debug_summary), shared = self._flights.do(key, compute)
+            if not shared and _worth_caching(debug_summary):
+                self.set(key, jobs, debug_summary)
+            return list(jobs), dict(debug_summary)
+
+        stored_at, jobs, debug_summary = entry
+        if time.time() - stored_at >= self.ttl_for(key):
+            self._refresh_in_background(key, compute)
+        return list(jobs), dict(debug_summary)
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Tuple[List[Dict], Dict]]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                jobs, debug_summary = compute()
+                if _worth_caching(debug_summary):
+                    self.set(key, jobs, debug_summary)
+            except Exception as e:
+                logger.error(f"Background refresh of cached search failed: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name='search-refresh', daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            conn = self._connection()
+            if conn is not None:
+                conn.execute('DELETE FROM search_results')
+                conn.commit()
+
+
+def _worth_caching(debug_summary: Dict) -> bool:
+    """Don't cache searches where every portal failed"""
+    return any(not info.get('error') for info in debug_summary.values())
+
+
+# Cache shared by every session of the app. Set JOB_SCANNER_RESULT_CACHE=disk
+# to also keep results on disk across restarts.
+DEFAULT_RESULT_CACHE = SearchResultCache(
+    path=os.path.join(CACHE_DIR, 'search_results.sqlite3') if os.environ.get('JOB_SCANNER_RESULT_CACHE') == 'disk' else None
+)
+
+
+def cached_scrape_all_portals(keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None,
+                              max_pages: int = 100, cache: Optional[SearchResultCache] = None,
+                              **scrape_kwargs) -> Tuple[List[Dict], Dict]:
+    """
+    scrape_all_portals with memoization of the final job list and debug summary
+
+    Args:
+        cache: SearchResultCache to use (default: the process-wide DEFAULT_RESULT_CACHE)
+        scrape_kwargs: Extra arguments passed through to scrape_all_portals
+
+    Returns:
+        Tuple of (List of job dictionaries, Debug information dictionary)
+    """
+    cache = cache or DEFAULT_RESULT_CACHE
+    key = search_key(keywords, location, job_type, selected_portals, max_pages, scrape_kwargs.get('dedup', 'portal'))
+    return cache.get_or_compute(
+        key,
+        lambda: scrape_all_portals(keywords, location, job_type, selected_portals, max_pages, **scrape_kwargs)
+    )
+
+
+class LiveSearch:
+    """
+    A search running in a background thread whose partial results can be read at any time
+
+    Jobs are collected from scrapers.stream_all_portals page by page, so a UI
+    polling snapshot() shows the first results after the first parsed page.
+    Searches in the result cache complete immediately (stale ones are
+    refreshed in the background) unless refresh is set; finished searches
+    are added to the cache.
+    """
+
+    def __init__(self, keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None,
+                 max_pages: int = 100, cache: Optional[SearchResultCache] = None, refresh: bool = False,
+                 **scrape_kwargs):
+        self.keywords = keywords
+        self.location = location
+        self.job_type = job_type
+        self.selected_portals = selected_portals
+        self.max_pages = max_pages
+        self.cache = cache or DEFAULT_RESULT_CACHE
+        self.refresh = refresh
+        self.scrape_kwargs = scrape_kwargs
+        self.key = search_key(keywords, location, job_type, selected_portals, max_pages, scrape_kwargs.get('dedup', 'portal'))
+        self.error = ''
+        self._jobs = []
+        self._debug_summary = {}
+        self._progress = {}
+        self._finished = threading.Event()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return not self._finished.is_set()
+
+    def start(self) -> 'LiveSearch':
+        """Serve the search from the cache or start scraping in the background"""
+        if not self.refresh and self.cache.get(self.key) is not None:
+            self.run()
+        else:
+            threading.Thread(target=self.run, name='live-search', daemon=True).start()
+        return self
+
+    def run(self):
+        """
+        Run the search in the calling thread, serving it from the cache when possible
+
+        The search is always marked finished on return, with any error in
+        self.error, so threads blocked in wait() are released.
+        """
+        try:
+            if not self.refresh and self.cache.get(self.key) is not None:
+                jobs, debug_summary = self.cache.get_or_compute(self.key, self._scrape)
+                self._finish(jobs, debug_summary)
+            else:
+                self._stream()
+        except Exception as e:
+            logger.error(f"Live search failed: {str(e)}")
+            self.error = str(e)
+        finally:
+            self._finished.set()
+
+    def cancel(self):
+        """Stop scraping after the pages currently in progress"""
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the search has finished, return False on timeout"""
+        return self._finished.wait(timeout)
+
+    def snapshot(self) -> Tuple[List[Dict], Dict, Dict]:
+        """
+        Current state of the search
+
+        Returns:
+            Tuple of (jobs found so far, debug summary of the finished portals,
+            {portal: {'pages', 'jobs', 'done'}} progress of every portal)
+        """
+        with self._lock:
+            return list(self._jobs), dict(self._debug_summary), {portal: dict(info) for portal, info in self._progress.items()}
+
+    def _scrape(self) -> Tuple[List[Dict], Dict]:
+        return scrape_all_portals(self.keywords, self.location, self.job_type, self.selected_portals, self.max_pages,
+                                  **self.scrape_kwargs)
+
+    def _stream(self):
+        events = stream_all_portals(self.keywords, self.location, self.job_type, self.selected_portals, self.max_pages,
+                                    **self.scrape_kwargs)
+        try:
+            for event in events:
+                if self._cancelled.is_set():
+                    break
+                with self._lock:
+                    if event['event'] == 'page':
+                        self._jobs.extend(event['jobs'])
+                        progress = self._progress.setdefault(event['portal'], {'pages': 0, 'jobs': 0, 'done': False})
+                        progress['pages'] += 1
+                        progress['jobs'] = event['total']
+                    elif event['event'] == 'portal':
+                        self._debug_summary[event['portal']] = event['debug_info']
+                        progress = self._progress.setdefault(event['portal'], {'pages': 0, 'jobs': 0, 'done': False})
+                        progress['done'] = True
+
+                if event['event'] == 'done':
+                    jobs = event['jobs'] if event['jobs'] is not None else self.snapshot()[0]
+                    if _worth_caching(event['debug_info']):
+                        self.cache.set(self.key, jobs, event['debug_info'])
+                    self._finish(jobs, event['debug_info'])
+        except Exception as e:
+            logger.error(f"Live search failed: {str(e)}")
+            self.error = str(e)
+        finally:
+            events.close()
+            self._finished.set()
+
+    def _finish(self, jobs: List[Dict], debug_summary: Dict):
+        with self._lock:
+            self._jobs = list(jobs)
+            self._debug_summary = dict(debug_summary)
+            for portal, info in debug_summary.items():
+                self._progress[portal] = {'pages': info.get('pages_scraped', 0), 'jobs': info.get('jobs_found', 0), 'done': True}
+        self._finished.set()
@@ -2,28 +2,160 @@
 Job scraper module for German job portals
 """
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Tuple, Optional
-import time
-import random
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from rate_limit import DEFAULT_RATE_LIMITER
+from http_cache import DEFAULT_RESPONSE_CACHE
+from job_store import job_key, job_fingerprint
+from dedup import Deduplicator, DEDUP_POLICIES, deduplicate, exact_key, policy_key, url_key
+from enrichment import DEFAULT_DATE_PARSER, DEFAULT_JOB_LEVEL_CLASSIFIER, DEFAULT_SKILL_EXTRACTOR, enrich_jobs
+from parsing import find_cards, first, first_text, get_backend
+from singleflight import SingleFlight, StreamFlight
+from portals import ARBEITSAGENTUR, INDEED, LINK, LINKEDIN, MONSTER, STEPSTONE, XING, PortalSpec
+from typing import AsyncIterator, Iterator, List, Dict, Tuple, Optional
 import logging
-from datetime import datetime, timedelta
-import re
+from datetime import datetime
+import asyncio
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for the async engine
+    httpx = None
+
+try:
+    import brotli  # noqa: F401 - lets urllib3/httpx decode 'br' responses
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection pooling for the shared HTTP session
+POOL_CONNECTIONS = 10  # number of per-host connection pools to keep
+POOL_MAXSIZE = 10  # keep-alive connections per host
+MAX_RETRIES = 3  # retries for connection errors and 429/5xx responses
+
+
+def create_session(pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                   max_retries: int = MAX_RETRIES) -> requests.Session:
+    """
+    Create a requests session with per-host keep-alive pools and a retry adapter
+
+    Retries back off exponentially and honour Retry-After. When retries are
+    exhausted the last response is returned so callers still see the status.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Maximum number of concurrent requests per host for the async engine
+ASYNC_HOST_LIMIT = 4
+
+
+class HostLimiter:
+    """Bounds the number of concurrent async requests per host"""
+
+    def __init__(self, limit: int = ASYNC_HOST_LIMIT):
+        self.limit = limit
+        self._semaphores = {}
+
+    def slot(self, url: str) -> asyncio.Semaphore:
+        """Semaphore guarding requests to the host of url, use with 'async with'"""
+        host = urlsplit(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.limit)
+        return self._semaphores[host]
+
+
+def new_async_client(**kwargs):
+    """Create an httpx.AsyncClient suitable for sharing between ascrape() calls"""
+    if httpx is None:
+        raise ImportError("The async scraping engine requires httpx (pip install httpx)")
+    kwargs.setdefault('follow_redirects', True)
+    kwargs.setdefault('limits', httpx.Limits(max_connections=100, max_keepalive_connections=20))
+    return httpx.AsyncClient(**kwargs)
+
 
 class JobScraper:
-    """Base class for job scraping"""
+    """
+    Base class for job scraping
+
+    A portal is described by a portals.PortalSpec (result page URLs, card and
+    field selectors); subclasses set `spec` and the generic _page_request and
+    _parse_page below do the rest. Portals needing more can still override
+    _page_request, _parse_page or _extract_job. The shared pagination loop is
+    driven either synchronously by scrape() or on an asyncio event loop by
+    ascrape().
+    """
+
+    # Declarative description of the portal, see portals module
+    spec: Optional[PortalSpec] = None
+    # Name used for the 'portal' field and in log messages (taken from spec)
+    portal_name = ''
+    # Pages are numbered from first_page up to (excluding) page_limit (taken from spec.pagination)
+    first_page = 0
+    page_limit = 100
+    # How result pages are parsed: 'lxml' (precompiled XPath selectors, see
+    # parsing module) or 'bs4' (BeautifulSoup with html_parser)
+    parser_backend = 'lxml'
+    # BeautifulSoup parser for result pages
+    html_parser = 'lxml'
+    # Shared per-host rate limiter consulted before every request. Anything
+    # with acquire(portal_name, url, cancel) -> bool / aacquire(portal_name, url)
+    # can be plugged in (see rate_limit.RateLimiter)
+    rate_limiter = DEFAULT_RATE_LIMITER
+    # On-disk cache for result pages, set to None to always hit the portal
+    response_cache = DEFAULT_RESPONSE_CACHE
+    # What makes two postings of this portal duplicates (see dedup module)
+    dedup_key = staticmethod(exact_key)
+    # Enrichment of job cards (see enrichment module)
+    skill_extractor = DEFAULT_SKILL_EXTRACTOR
+    job_level_classifier = DEFAULT_JOB_LEVEL_CLASSIFIER
+    date_parser = DEFAULT_DATE_PARSER
+    # Politeness budget for prefetching: maximum pages of this portal in flight
+    max_prefetch = 3
+    # Record url/status_code of every page instead of only the first one
+    track_every_page = False
+    # Request timeout in seconds
+    timeout = 15
+
+    # Process-wide pooled session shared by all scrapers, see get_session()
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        spec = cls.__dict__.get('spec')
+        if spec is not None:
+            cls.portal_name = spec.name
+            cls.first_page = spec.pagination.first_page
+            cls.page_limit = spec.pagination.page_limit
 
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
@@ -34,109 +166,199 @@ class JobScraper:
             'jobs_found': 0,
             'selectors_tried': []
         }
+        # Reference time for relative posting dates, fixed per scrape run
+        self._run_started = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Return the shared pooled session, creating it on first use"""
+        with JobScraper._session_lock:
+            if JobScraper._session is None:
+                JobScraper._session = create_session()
+            return JobScraper._session
+
+    @classmethod
+    def configure_session(cls, **kwargs):
+        """Replace the shared session, e.g. configure_session(pool_maxsize=20, max_retries=5)"""
+        with JobScraper._session_lock:
+            old_session = JobScraper._session
+            JobScraper._session = create_session(**kwargs)
+        if old_session is not None:
+            old_session.close()
+
+    def _fetch(self, url: str, params: Optional[Dict] = None, stop: Optional[threading.Event] = None):
+        """
+        GET a page through the response cache and shared session, respecting the rate limiter
+
+        Args:
+            stop: Event set when the page is no longer wanted; if it is set before
+                the rate limiter lets the request through, None is returned without
+                using a rate limit token or requesting the page
+        """
+        validators = {}
+        if self.response_cache is not None:
+            cached, validators = self.response_cache.lookup(self.portal_name, url, params)
+            if cached is not None:
+                return cached
+
+        if not self.rate_limiter.acquire(self.portal_name, url, stop) or (stop is not None and stop.is_set()):
+            return None
+        response = self.get_session().get(url, params=params, headers={**self.headers, **validators}, timeout=self.timeout)
+
+        if self.response_cache is not None:
+            response = self.response_cache.update(self.portal_name, url, params, response)
+        return response
+
+    async def _afetch(self, client, host_limiter: 'HostLimiter', url: str, params: Optional[Dict] = None):
+        """
+        Async counterpart of _fetch using the shared async client
+
+        The response cache is SQLite with zlib, so its lookups and stores run
+        in a worker thread instead of blocking the event loop.
+        """
+        validators = {}
+        if self.response_cache is not None:
+            cached, validators = await asyncio.to_thread(self.response_cache.lookup, self.portal_name, url, params)
+            if cached is not None:
+                return cached
+
+        await self.rate_limiter.aacquire(self.portal_name, url)
+        async with host_limiter.slot(url):
+            response = await client.get(url, params=params, headers={**self.headers, **validators}, timeout=self.timeout)
+
+        if self.response_cache is not None:
+            response = await asyncio.to_thread(self.response_cache.update, self.portal_name, url, params, response)
+        return response
+
+    def _page_request(self, page: int, keywords: str, location: str, job_type: str) -> Tuple[str, Optional[Dict]]:
+        """Return (url, params) for a result page"""
+        return self.spec.page_request(page, keywords, location, job_type)
+
+    def _parse_page(self, root, page: int, location: str, jobs: List[Dict]) -> int:
+        """
+        Append the jobs found on a result page and return how many were added
+
+        root is the document parsed by self.dom - a BeautifulSoup object with the 'bs4' backend.
+        """
+        dom = self.dom
+        job_cards = self._find_cards(root, page)
+        if self.spec.card_limit:
+            job_cards = job_cards[:self.spec.card_limit]
+
+        # Store HTML sample for debugging (first page only)
+        if page == self.first_page:
+            self.debug_info['html_sample'] = dom.body_html(root)[:500]
+
+        logger.info(f"{self.portal_name} page {page - self.first_page + 1}: Found {len(job_cards)} job cards")
+
+        # If no jobs found on this page, stop pagination
+        if not job_cards:
+            if page == self.first_page and self.spec.empty_page_error:
+                self.debug_info['error'] = self.spec.empty_page_error
+            return 0
+
+        page_jobs = []
+        for card in job_cards:
+            try:
+                job = self._extract_job(dom, card, location)
+            except Exception as e:
+                logger.debug(f"Error parsing {self.portal_name} job card: {str(e)}")
+                continue
 
-    def scrape(self, keywords: str, location: str, job_type: str = "") -> Tuple[List[Dict], Dict]:
-        """Override this method in subclasses"""
-        raise NotImplementedError
+            # Only add job if we have at least a title and not duplicate
+            if job is not None and self._dedup.add(job):
+                page_jobs.append(job)
 
-    def _extract_job_level(self, title: str, summary: str) -> str:
-        """Extract job level from title or summary"""
-        text = f"{title} {summary}".lower()
-
-        if any(word in text for word in ['entry level', 'junior', 'graduate', 'trainee', 'intern', 'praktikum']):
-            return 'Entry Level'
-        elif any(word in text for word in ['senior', 'lead', 'principal', 'staff', 'expert']):
-            return 'Senior Level'
-        elif any(word in text for word in ['mid-level', 'intermediate', 'experienced']):
-            return 'Mid Level'
-        elif any(word in text for word in ['director', 'head of', 'chief', 'vp', 'vice president', 'manager', 'leiter']):
-            return 'Management'
-        else:
-            return 'Not Specified'
+        # Skills and job level are matched against the whole summary, then it is cut
+        enrich_jobs(page_jobs, self.skill_extractor, self.job_level_classifier)
+        for job in page_jobs:
+            job['summary'] = job['summary'][:300]  # Limit summary length
+        jobs.extend(page_jobs)
 
-    def _extract_skills(self, summary: str) -> list:
-        """Extract common technical skills from job summary"""
-        if not summary:
-            return []
-
-        text = summary.lower()
-        skills_found = []
-
-        # Common technical skills
-        skill_keywords = {
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin',
-            'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Spring', 'Express',
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'NoSQL',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'CI/CD',
-            'Machine Learning', 'AI', 'Data Science', 'Deep Learning', 'TensorFlow', 'PyTorch',
-            'Agile', 'Scrum', 'DevOps', 'REST API', 'GraphQL', 'Microservices',
-            'HTML', 'CSS', 'SASS', 'Bootstrap', 'Tailwind',
-            'Linux', 'Unix', 'Windows Server', 'Networking',
-            'SAP', 'Salesforce', 'Excel', 'Power BI', 'Tableau'
-        }
+        self.debug_info['pages_scraped'] = page - self.first_page + 1
 
-        for skill in skill_keywords:
-            if skill.lower() in text:
-                skills_found.append(skill)
+        return len(page_jobs)
 
-        return skills_found[:10]  # Limit to top 10 skills
+    def _extract_job(self, dom, card, location: str) -> Optional[Dict]:
+        """
+        Build the job dictionary of a result card from the spec's field selectors, None if it has no title
 
-    def _extract_posted_date(self, date_text: str) -> Optional[str]:
-        """Extract and normalize posting date from text"""
-        if not date_text:
-            return None
+        job_level and skills may be left None; _parse_page fills them in with enrich_jobs.
+        """
+        spec = self.spec
+        fields = spec.fields
 
-        date_text = date_text.lower().strip()
-        today = datetime.now()
-
-        # Common patterns
-        if 'heute' in date_text or 'today' in date_text:
-            return today.strftime('%Y-%m-%d')
-        elif 'gestern' in date_text or 'yesterday' in date_text:
-            return (today - timedelta(days=1)).strftime('%Y-%m-%d')
-
-        # X days/hours/minutes ago patterns
-        time_patterns = [
-            (r'vor (\d+) tag', 'days'),
-            (r'(\d+) tag', 'days'),
-            (r'vor (\d+) stunde', 'hours'),
-            (r'(\d+) stunde', 'hours'),
-            (r'vor (\d+) minute', 'minutes'),
-            (r'(\d+) minute', 'minutes'),
-            (r'(\d+)\s*d', 'days'),  # "5d ago"
-            (r'(\d+)\s*h', 'hours'),  # "2h ago"
-        ]
-
-        for pattern, unit in time_patterns:
-            match = re.search(pattern, date_text)
-            if match:
-                value = int(match.group(1))
-                if unit == 'days':
-                    return (today - timedelta(days=value)).strftime('%Y-%m-%d')
-                elif unit == 'hours':
-                    return (today - timedelta(hours=value)).strftime('%Y-%m-%d')
-                elif unit == 'minutes':
-                    return today.strftime('%Y-%m-%d')
-
-        # Specific date patterns (dd.mm.yyyy or dd.mm.yy)
-        date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})', date_text)
-        if date_match:
-            day, month, year = date_match.groups()
-            if len(year) == 2:
-                year = '20' + year
-            try:
-                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-            except:
-                pass
+        title_elem = first(dom, card, fields.get('title', ()))
+        if title_elem is None:
+            return None
+        title_is_link = dom.tag(title_elem) == 'a'
+        title_link = title_elem if title_is_link else dom.find(title_elem, LINK)
+        title = dom.text(title_link if spec.title_from_link and title_link is not None else title_elem)
+        if not title:
+            return None
 
-        return date_text  # Return original if no pattern matched
+        # Job URL: an id based URL, else the link of the title or the first link found in the card
+        job_url = ''
+        if title_is_link and spec.link_from_title:
+            link_elem = title_elem
+        elif not title_is_link and spec.link_in_title and title_link is not None:
+            link_elem = title_link
+        else:
+            link_elem = first(dom, card, fields.get('link', ()))
+        if link_elem is not None:
+            job_id = next((dom.attr(link_elem, name) for name in spec.job_id_attrs if dom.attr(link_elem, name)), '')
+            if spec.job_id_prefix:
+                job_id = job_id.replace(spec.job_id_prefix, '')
+            href = dom.attr(link_elem, 'href', '')
+            if job_id and spec.job_url:
+                job_url = spec.job_url.format(id=job_id)
+            elif href:
+                job_url = href if href.startswith('http') else urljoin(spec.base_url, href)
+
+        company = first_text(dom, card, fields.get('company', ()), spec.default_company)
+        loc = first_text(dom, card, fields.get('location', ()), location)
+        # Without a description, cards are enriched from the spec's placeholder_fields
+        job_level = skills = None
+        if spec.summary_placeholder is None:
+            summary = first_text(dom, card, fields.get('summary', ()), spec.default_summary, separator=' ')
+        else:
+            summary = spec.summary_placeholder
+            values = {'title': title, 'company': company, 'location': loc}
+            text = ' '.join(str(values[name]) for name in spec.placeholder_fields)
+            job_level, skills = self._extract_job_level(title, text), self._extract_skills(text)
+
+        # Extract posted date
+        date_text = first_text(dom, card, fields.get('date', ()))
+        posted_date = self._extract_posted_date(date_text) if date_text else None
+
+        return {
+            'title': title,
+            'company': company,
+            'location': loc,
+            'summary': summary,
+            'url': job_url,
+            'portal': self.portal_name,
+            'salary': first_text(dom, card, fields.get('salary', ())),
+            'job_level': job_level,
+            'skills': skills,
+            'posted_date': posted_date
+        }
 
+    @property
+    def dom(self):
+        """Parsing backend selected by parser_backend"""
+        return get_backend(self.parser_backend, self.html_parser)
 
-class IndeedDeScraper(JobScraper):
-    """Scraper for Indeed.de"""
+    def _find_cards(self, root, page: int) -> List:
+        """Result cards of a page, found with the spec's cards on the first page and later_cards after"""
+        if page == self.first_page:
+            cards, _ = find_cards(self.dom, root, self.spec.cards, self.debug_info['selectors_tried'])
+        else:
+            cards, _ = find_cards(self.dom, root, self.spec.later_cards or self.spec.cards)
+        return cards
 
-    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40) -> Tuple[List[Dict], Dict]:
-        jobs = []
+    def _start_run(self, known_jobs=None):
+        """Reset per-run state before a scrape"""
         self.debug_info = {
             'url': '',
             'status_code': 0,
@@ -146,1053 +368,783 @@ class IndeedDeScraper(JobScraper):
             'html_sample': '',
             'pages_scraped': 0
         }
+        self._dedup = Deduplicator(self.dedup_key)
+        self._known_jobs = known_jobs
+        self._run_started = datetime.now()
+        self.debug_info['duplicates_merged'] = 0
+        if known_jobs is not None:
+            self.debug_info['jobs_skipped'] = 0
+
+    def _pages(self, max_pages: int) -> range:
+        """Page numbers to request for max_pages"""
+        return range(self.first_page, min(self.first_page + max_pages, self.page_limit))
+
+    def _handle_response(self, response, page: int, location: str) -> List[Dict]:
+        """Record debug info for a fetched page, parse it and return the jobs it adds"""
+        if self.track_every_page or page == self.first_page:
+            self.debug_info['url'] = str(response.url)
+            self.debug_info['status_code'] = response.status_code
+
+        response.raise_for_status()
+
+        page_jobs = []
+        root = self.dom.parse(response.content)
+        added = self._parse_page(root, page, location, page_jobs)
+        if self._known_jobs is not None and added:
+            self._drop_known_jobs(page_jobs, added)
+        return page_jobs
+
+    def _drop_known_jobs(self, jobs: List[Dict], added: int) -> int:
+        """
+        Incremental mode: remove the last `added` jobs if they are already stored unchanged
+
+        The removed jobs are marked as seen in the store, as they will not
+        reach it with the results. Returns the number of new or changed jobs
+        kept, so a page made up entirely of known jobs ends the crawl like an
+        empty page.
+        """
+        page_jobs = jobs[-added:]
+        keys = [job_key(job) for job in page_jobs]
+        known = self._known_jobs.fingerprints(keys)
+        unchanged = [known.get(key) == job_fingerprint(job) for job, key in zip(page_jobs, keys)]
+        fresh = [job for job, skip in zip(page_jobs, unchanged) if not skip]
+        if len(fresh) < added:
+            self._known_jobs.touch([key for key, skip in zip(keys, unchanged) if skip])
+
+        del jobs[-added:]
+        jobs.extend(fresh)
+        self.debug_info['jobs_skipped'] += added - len(fresh)
+        return len(fresh)
+
+    def _iter_serial(self, keywords: str, location: str, job_type: str, max_pages: int) -> Iterator[Tuple[int, List[Dict]]]:
+        """Fetch and parse one page at a time, yielding (page, new jobs)"""
+        for page in self._pages(max_pages):
+            url, params = self._page_request(page, keywords, location, job_type)
+            response = self._fetch(url, params)
+            page_jobs = self._handle_response(response, page, location)
+
+            # Stop if we didn't add any new jobs from this page
+            if not page_jobs:
+                break
+            yield page, page_jobs
+
+    async def _aiter_serial(self, client, host_limiter: 'HostLimiter', keywords: str, location: str, job_type: str,
+                            max_pages: int) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """Async counterpart of _iter_serial"""
+        for page in self._pages(max_pages):
+            url, params = self._page_request(page, keywords, location, job_type)
+            response = await self._afetch(client, host_limiter, url, params)
+            page_jobs = self._handle_response(response, page, location)
+
+            # Stop if we didn't add any new jobs from this page
+            if not page_jobs:
+                break
+            yield page, page_jobs
+
+    def _iter_prefetched(self, keywords: str, location: str, job_type: str, max_pages: int,
+                         prefetch: int) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Fetch a sliding window of pages in parallel while parsing them in page order
+
+        Pages are parsed strictly in order so the usual stop conditions apply;
+        once a page adds no jobs, fetches for the pages behind it are cancelled,
+        including those already waiting for the rate limiter.
+        """
+        window = max(1, min(prefetch, self.max_prefetch))
+        pages = iter(self._pages(max_pages))
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix='prefetch')
+        stop = threading.Event()
+
+        def fetch_next_page():
+            page = next(pages, None)
+            if page is not None:
+                url, params = self._page_request(page, keywords, location, job_type)
+                pending.append((page, executor.submit(self._fetch, url, params, stop)))
 
         try:
-            # Scrape multiple pages
-            for page in range(min(max_pages, 100)):  # Limit to 40 pages max
-                # Build URL
-                base_url = "https://de.indeed.com/jobs"
-                params = {
-                    'q': keywords,
-                    'l': location,
-                    'start': page * 10  # Indeed uses start parameter for pagination
-                }
-
-                # Add job type filter if specified
-                if job_type:
-                    if job_type == "Full-time":
-                        params['jt'] = 'fulltime'
-                    elif job_type == "Part-time":
-                        params['jt'] = 'parttime'
-                    elif job_type == "Remote":
-                        params['remotejob'] = '032b3046-06a3-4876-8dfd-474eb5e7ed11'
-
-                response = requests.get(base_url, params=params, headers=self.headers, timeout=15)
-
-                if page == 0:  # Store info from first page
-                    self.debug_info['url'] = response.url
-                    self.debug_info['status_code'] = response.status_code
-
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Try multiple selectors for job cards (only log on first page)
-                if page == 0:
-                    selectors = [
-                        ('div', 'job_seen_beacon'),
-                        ('div', 'jobsearch-ResultsList'),
-                        ('td', 'resultContent'),
-                        ('div', 'cardOutline'),
-                        ('a', 'jcs-JobTitle')
-                    ]
-                else:
-                    selectors = [
-                        ('div', 'job_seen_beacon'),
-                        ('td', 'resultContent'),
-                    ]
-
-                job_cards = []
-                for tag, class_name in selectors:
-                    if page == 0:
-                        self.debug_info['selectors_tried'].append(f"{tag}.{class_name}")
-
-                    if tag == 'div' and class_name == 'jobsearch-ResultsList':
-                        container = soup.find(tag, class_=class_name)
-                        if container:
-                            job_cards = container.find_all('div', class_='cardOutline')
-                            if not job_cards:
-                                job_cards = container.find_all('li')
-                            if not job_cards:
-                                job_cards = container.find_all('td', class_='resultContent')
-                            if job_cards:
-                                break
-                    else:
-                        job_cards = soup.find_all(tag, class_=class_name)
-                        if job_cards:
-                            break
-
-                # Store HTML sample for debugging (first page only)
-                if page == 0 and soup.body:
-                    self.debug_info['html_sample'] = str(soup.body)[:500]
-
-                logger.info(f"Indeed.de page {page + 1}: Found {len(job_cards)} job cards")
-
-                # If no jobs found on this page, stop pagination
-                if len(job_cards) == 0:
+            for _ in range(window):
+                fetch_next_page()
+
+            while pending:
+                page, future = pending.popleft()
+                page_jobs = self._handle_response(future.result(), page, location)
+
+                # Stop if we didn't add any new jobs from this page
+                if not page_jobs:
                     break
 
-                page_jobs_added = 0
-                for card in job_cards:
-                    try:
-                        # Try multiple selectors for title
-                        title_elem = (card.find('h2', class_='jobTitle') or
-                                     card.find('h2') or
-                                     card.find('a', class_='jcs-JobTitle') or
-                                     card.find('span', {'title': True}))
-
-                        # Try multiple selectors for company
-                        company_elem = (card.find('span', {'data-testid': 'company-name'}) or
-                                       card.find('span', class_='companyName') or
-                                       card.find('span', class_='company') or
-                                       card.find('span', {'class': 'css-1h7lukg'}))
-
-                        # Try multiple selectors for location
-                        location_elem = (card.find('div', {'data-testid': 'text-location'}) or
-                                        card.find('div', class_='companyLocation') or
-                                        card.find('div', class_='location') or
-                                        card.find('div', {'class': 'css-1p0sjhy'}))
-
-                        # Try multiple selectors for summary
-                        summary_elem = (card.find('div', class_='job-snippet') or
-                                       card.find('div', class_='summary') or
-                                       card.find('ul') or
-                                       card.find('div', {'class': 'jobCardShelfContainer'}))
-
-                        # Extract salary/pay information
-                        salary_elem = (card.find('span', class_='salary-snippet') or
-                                      card.find('div', class_='salary-snippet') or
-                                      card.find('div', {'data-testid': 'attribute_snippet_testid'}))
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        # Extract job URL - try multiple methods
-                        job_link = ""
-                        if title_elem:
-                            link_elem = title_elem.find('a') if title_elem.name != 'a' else title_elem
-                            if link_elem:
-                                job_id = link_elem.get('data-jk', '') or link_elem.get('id', '').replace('job_', '')
-                                if job_id:
-                                    job_link = f"https://de.indeed.com/viewjob?jk={job_id}"
-                                elif link_elem.get('href'):
-                                    href = link_elem.get('href')
-                                    if href.startswith('http'):
-                                        job_link = href
-                                    elif href.startswith('/'):
-                                        job_link = f"https://de.indeed.com{href}"
-
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        company = company_elem.get_text(strip=True) if company_elem else 'Company not listed'
-                        loc = location_elem.get_text(strip=True) if location_elem else location
-                        summary = summary_elem.get_text(strip=True) if summary_elem else 'No description available'
-
-                        # Extract job level from title or summary
-                        job_level = self._extract_job_level(title, summary)
-
-                        # Extract skills from summary
-                        skills = self._extract_skills(summary)
-
-                        # Extract posted date
-                        date_elem = (card.find('span', {'data-testid': 'myJobsStateDate'}) or
-                                   card.find('span', {'class': lambda x: x and 'date' in x.lower() if x else False}) or
-                                   card.find('span', {'class': 'date'}))
-                        date_text = date_elem.get_text(strip=True) if date_elem else None
-                        posted_date = self._extract_posted_date(date_text) if date_text else None
-
-                        # Only add job if we have at least a title and not duplicate
-                        if title and not any(j['title'] == title and j['company'] == company for j in jobs):
-                            job = {
-                                'title': title,
-                                'company': company,
-                                'location': loc,
-                                'summary': summary[:300],  # Limit summary length
-                                'url': job_link,
-                                'portal': 'Indeed.de',
-                                'salary': salary,
-                                'job_level': job_level,
-                                'skills': skills,
-                                'posted_date': posted_date
-                            }
-                            jobs.append(job)
-                            page_jobs_added += 1
-                    except Exception as e:
-                        logger.debug(f"Error parsing job card: {str(e)}")
-                        continue
-
-                self.debug_info['pages_scraped'] = page + 1
+                fetch_next_page()
+                yield page, page_jobs
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _aiter_prefetched(self, client, host_limiter: 'HostLimiter', keywords: str, location: str, job_type: str,
+                                max_pages: int, prefetch: int) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """Async counterpart of _iter_prefetched"""
+        window = max(1, min(prefetch, self.max_prefetch))
+        pages = iter(self._pages(max_pages))
+        pending = deque()
+
+        def fetch_next_page():
+            page = next(pages, None)
+            if page is not None:
+                url, params = self._page_request(page, keywords, location, job_type)
+                task = asyncio.ensure_future(self._afetch(client, host_limiter, url, params))
+                pending.append((page, task))
+
+        try:
+            for _ in range(window):
+                fetch_next_page()
+
+            while pending:
+                page, task = pending.popleft()
+                page_jobs = self._handle_response(await task, page, location)
 
                 # Stop if we didn't add any new jobs from this page
-                if page_jobs_added == 0:
+                if not page_jobs:
                     break
 
-                # Respectful delay between pages
-                time.sleep(random.uniform(1.5, 2.5))
+                fetch_next_page()
+                yield page, page_jobs
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    def scrape_pages(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40,
+                     prefetch: int = 0, known_jobs=None) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Streaming version of scrape(): yield (page, new jobs) as soon as each result page is parsed
+
+        Takes the same arguments as scrape(). Errors end the stream and are
+        reported in self.debug_info, which is complete once the generator is
+        exhausted. Closing the generator early cancels pending prefetches.
+        """
+        self._start_run(known_jobs)
+        if prefetch > 0:
+            pages = self._iter_prefetched(keywords, location, job_type, max_pages, prefetch)
+        else:
+            pages = self._iter_serial(keywords, location, job_type, max_pages)
+
+        jobs_found = 0
+        try:
+            for page, page_jobs in pages:
+                jobs_found += len(page_jobs)
+                yield page, page_jobs
 
-            self.debug_info['jobs_found'] = len(jobs)
+            self.debug_info['jobs_found'] = jobs_found
+            self.debug_info['duplicates_merged'] = self._dedup.duplicates
 
         except requests.exceptions.RequestException as e:
             self.debug_info['error'] = f"Network error: {str(e)}"
-            logger.error(f"Error scraping Indeed.de: {str(e)}")
+            logger.error(f"Error scraping {self.portal_name}: {str(e)}")
         except Exception as e:
             self.debug_info['error'] = f"Parsing error: {str(e)}"
-            logger.error(f"Error scraping Indeed.de: {str(e)}")
-
+            logger.error(f"Error scraping {self.portal_name}: {str(e)}")
+        finally:
+            pages.close()
+
+    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40,
+               prefetch: int = 0, known_jobs=None) -> Tuple[List[Dict], Dict]:
+        """
+        Scrape up to max_pages result pages, stopping at the first page without new jobs
+
+        Args:
+            prefetch: Number of pages to fetch ahead in parallel (0 = strictly serial,
+                      capped by the portal's max_prefetch)
+            known_jobs: Incremental mode - a job_store.JobStore of already seen jobs. Only new
+                        or changed postings are returned (debug_info['jobs_skipped'] counts the
+                        rest) and the crawl stops at the first page of only known jobs.
+
+        Returns:
+            Tuple of (List of job dictionaries, Debug information dictionary)
+        """
+        jobs = []
+        for _, page_jobs in self.scrape_pages(keywords, location, job_type, max_pages, prefetch, known_jobs):
+            jobs.extend(page_jobs)
         return jobs, self.debug_info
 
+    async def ascrape_pages(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40,
+                            prefetch: int = 0, known_jobs=None, client=None,
+                            host_limiter: Optional['HostLimiter'] = None) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """Async counterpart of scrape_pages(), takes the same arguments as ascrape()"""
+        if httpx is None:
+            raise ImportError("The async scraping engine requires httpx (pip install httpx)")
+
+        self._start_run(known_jobs)
+        owns_client = client is None
+        if owns_client:
+            client = new_async_client()
+        if host_limiter is None:
+            host_limiter = HostLimiter()
+        if prefetch > 0:
+            pages = self._aiter_prefetched(client, host_limiter, keywords, location, job_type, max_pages, prefetch)
+        else:
+            pages = self._aiter_serial(client, host_limiter, keywords, location, job_type, max_pages)
 
-class StepStoneScraper(JobScraper):
-    """Scraper for StepStone.de"""
-
-    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40) -> Tuple[List[Dict], Dict]:
-        jobs = []
-        self.debug_info = {
-            'url': '',
-            'status_code': 0,
-            'error': '',
-            'jobs_found': 0,
-            'selectors_tried': [],
-            'html_sample': '',
-            'pages_scraped': 0
-        }
-
+        jobs_found = 0
         try:
-            # Scrape multiple pages
-            for page in range(1, min(max_pages + 1, 41)):  # StepStone pages start at 1
-                # Try different URL patterns
-                base_url = "https://www.stepstone.de/work"
-
-                # Build search query - StepStone uses a different URL structure
-                search_terms = keywords.replace(' ', '-').lower()
-                location_term = location.replace(' ', '-').lower()
-
-                url = f"{base_url}/{search_terms}-jobs-in-{location_term}"
-
-                params = {'page': page} if page > 1 else {}
-
-                response = requests.get(url, params=params, headers=self.headers, timeout=15)
-
-                if page == 1:  # Store info from first page
-                    self.debug_info['url'] = response.url
-                    self.debug_info['status_code'] = response.status_code
-
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Try multiple selectors for job listings
-                if page == 1:
-                    selectors = [
-                        ('article', {'data-at': 'job-item'}),
-                        ('article', {'class': 'res-'}),
-                        ('li', {'data-at': 'job-item'}),
-                        ('div', {'class': 'job-element'}),
-                        ('article', None),  # Try all article tags
-                    ]
-                else:
-                    selectors = [
-                        ('article', {'data-at': 'job-item'}),
-                        ('article', None),
-                    ]
-
-                job_cards = []
-                for tag, attrs in selectors:
-                    if page == 1:
-                        self.debug_info['selectors_tried'].append(f"{tag} with {attrs}")
-
-                    if attrs:
-                        job_cards = soup.find_all(tag, attrs)
-                    else:
-                        # Find all articles, then filter those that look like job cards
-                        all_tags = soup.find_all(tag)
-                        job_cards = [t for t in all_tags if t.find('a') and (t.find('h2') or t.find('h3'))]
-
-                    if job_cards:
-                        break
-
-                # Store HTML sample for debugging (first page only)
-                if page == 1 and soup.body:
-                    self.debug_info['html_sample'] = str(soup.body)[:500]
-
-                logger.info(f"StepStone.de page {page}: Found {len(job_cards)} job cards")
-
-                # If no jobs found on this page, stop pagination
-                if len(job_cards) == 0:
-                    break
+            async for page, page_jobs in pages:
+                jobs_found += len(page_jobs)
+                yield page, page_jobs
 
-                page_jobs_added = 0
-                for card in job_cards:
-                    try:
-                        # Try multiple selectors for title
-                        title_elem = (card.find('h2') or
-                                     card.find('h3') or
-                                     card.find('a', {'data-at': 'job-item-title'}) or
-                                     card.find('a', class_=lambda x: x and 'title' in x.lower() if x else False))
-
-                        # Try multiple selectors for company
-                        company_elem = (card.find('span', {'data-at': 'job-item-company-name'}) or
-                                       card.find('a', {'data-at': 'job-item-company-name'}) or
-                                       card.find('div', class_=lambda x: x and 'company' in x.lower() if x else False) or
-                                       card.find('span', class_=lambda x: x and 'company' in x.lower() if x else False))
-
-                        # Try multiple selectors for location
-                        location_elem = (card.find('span', {'data-at': 'job-item-location'}) or
-                                        card.find('div', class_=lambda x: x and 'location' in x.lower() if x else False) or
-                                        card.find('span', class_=lambda x: x and 'location' in x.lower() if x else False))
-
-                        # Extract title
-                        if title_elem and title_elem.find('a'):
-                            title_link = title_elem.find('a')
-                            title = title_link.get_text(strip=True)
-                        elif title_elem:
-                            title = title_elem.get_text(strip=True)
-                        else:
-                            title = None
-
-                        company = company_elem.get_text(strip=True) if company_elem else 'Company not listed'
-                        loc = location_elem.get_text(strip=True) if location_elem else location
-
-                        # Try to extract salary
-                        salary_elem = card.find('span', {'data-at': 'job-item-salary'}) or card.find('span', class_=lambda x: x and 'salary' in x.lower() if x else False)
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        # Extract URL - try to find any link in the card
-                        job_url = ""
-                        link_elem = card.find('a', href=True)
-                        if link_elem:
-                            job_url = link_elem.get('href')
-                            if job_url and not job_url.startswith('http'):
-                                job_url = f"https://www.stepstone.de{job_url}"
-
-                        # Extract job level and skills
-                        summary = f"{title} {company} {loc}"
-                        job_level = self._extract_job_level(title, summary)
-                        skills = self._extract_skills(summary)
-
-                        # Extract posted date
-                        date_elem = (card.find('span', {'class': lambda x: x and 'date' in x.lower() or x and 'time' in x.lower() if x else False}) or
-                                   card.find('time'))
-                        date_text = date_elem.get_text(strip=True) if date_elem else None
-                        posted_date = self._extract_posted_date(date_text) if date_text else None
-
-                        # Only add job if we have at least a title and not duplicate
-                        if title and not any(j['title'] == title and j['company'] == company for j in jobs):
-                            job = {
-                                'title': title,
-                                'company': company,
-                                'location': loc,
-                                'summary': 'See full details on StepStone',
-                                'url': job_url,
-                                'portal': 'StepStone.de',
-                                'salary': salary,
-                                'job_level': job_level,
-                                'skills': skills,
-                                'posted_date': posted_date
-                            }
-                            jobs.append(job)
-                            page_jobs_added += 1
-                    except Exception as e:
-                        logger.debug(f"Error parsing job card: {str(e)}")
-                        continue
-
-                self.debug_info['pages_scraped'] = page
+            self.debug_info['jobs_found'] = jobs_found
+            self.debug_info['duplicates_merged'] = self._dedup.duplicates
 
-                # Stop if we didn't add any new jobs from this page
-                if page_jobs_added == 0:
-                    break
-
-                # Respectful delay between pages
-                time.sleep(random.uniform(1.5, 2.5))
-
-            self.debug_info['jobs_found'] = len(jobs)
-
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             self.debug_info['error'] = f"Network error: {str(e)}"
-            logger.error(f"Error scraping StepStone.de: {str(e)}")
+            logger.error(f"Error scraping {self.portal_name}: {str(e)}")
         except Exception as e:
             self.debug_info['error'] = f"Parsing error: {str(e)}"
-            logger.error(f"Error scraping StepStone.de: {str(e)}")
-
+            logger.error(f"Error scraping {self.portal_name}: {str(e)}")
+        finally:
+            await pages.aclose()
+            if owns_client:
+                await client.aclose()
+
+    async def ascrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40, prefetch: int = 0,
+                      known_jobs=None, client=None, host_limiter: Optional['HostLimiter'] = None) -> Tuple[List[Dict], Dict]:
+        """
+        Async version of scrape() using an httpx.AsyncClient
+
+        Args:
+            prefetch: Number of pages to fetch ahead concurrently (0 = strictly serial)
+            known_jobs: Incremental mode, see scrape()
+            client: Shared httpx.AsyncClient (a private one is created if omitted)
+            host_limiter: Shared HostLimiter bounding concurrent requests per host
+
+        Returns:
+            Tuple of (List of job dictionaries, Debug information dictionary)
+        """
+        jobs = []
+        async for _, page_jobs in self.ascrape_pages(keywords, location, job_type, max_pages, prefetch, known_jobs,
+                                                     client, host_limiter):
+            jobs.extend(page_jobs)
         return jobs, self.debug_info
 
+    def _extract_job_level(self, title: str, summary: str) -> str:
+        """Extract job level from title or summary"""
+        return self.job_level_classifier.classify(title, summary)
 
-class XingJobsScraper(JobScraper):
-    """Scraper for XING Jobs"""
+    def _extract_skills(self, summary: str) -> list:
+        """Extract common technical skills from job summary"""
+        return self.skill_extractor.extract(summary)
 
-    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 40) -> Tuple[List[Dict], Dict]:
-        jobs = []
-        self.debug_info = {
-            'url': '',
-            'status_code': 0,
-            'error': '',
-            'jobs_found': 0,
-            'selectors_tried': [],
-            'html_sample': '',
-            'pages_scraped': 0
-        }
+    def _extract_posted_date(self, date_text: str) -> Optional[str]:
+        """Extract and normalize posting date from text, relative to the start of the run"""
+        return self.date_parser.parse(date_text, self._run_started)
 
-        try:
-            # Scrape multiple pages
-            for page in range(1, min(max_pages + 1, 41)):  # XING pages start at 1
-                base_url = "https://www.xing.com/jobs/search"
-                params = {
-                    'keywords': keywords,
-                    'location': location,
-                    'page': page
-                }
-
-                response = requests.get(base_url, params=params, headers=self.headers, timeout=15)
-
-                if page == 1:  # Store info from first page
-                    self.debug_info['url'] = response.url
-                    self.debug_info['status_code'] = response.status_code
-
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Try multiple selectors for XING jobs
-                if page == 1:
-                    selectors = [
-                        ('div', {'data-xds': 'JobTeaser'}),
-                        ('article', {'class': 'job'}),
-                        ('div', {'class': 'job-card'}),
-                        ('li', {'class': 'job-posting'}),
-                        ('a', {'class': lambda x: x and 'job' in x.lower() if x else False}),
-                        ('div', None),  # Try generic divs with links
-                    ]
-                else:
-                    selectors = [
-                        ('div', {'data-xds': 'JobTeaser'}),
-                        ('article', {'class': 'job'}),
-                    ]
-
-                job_cards = []
-                for tag, attrs in selectors:
-                    if page == 1:
-                        self.debug_info['selectors_tried'].append(f"{tag} with {attrs}")
-
-                    if attrs:
-                        if isinstance(attrs, dict):
-                            job_cards = soup.find_all(tag, attrs)
-                        else:
-                            job_cards = soup.find_all(tag, class_=attrs)
-                    else:
-                        # Find divs/articles that contain job-like content
-                        all_tags = soup.find_all(tag)
-                        job_cards = [t for t in all_tags if t.find('a', href=True) and (t.find('h2') or t.find('h3') or t.find('h4'))]
-
-                    if job_cards:
-                        break
-
-                # Store HTML sample for debugging (first page only)
-                if page == 1 and soup.body:
-                    self.debug_info['html_sample'] = str(soup.body)[:500]
-
-                logger.info(f"XING Jobs page {page}: Found {len(job_cards)} job cards")
-
-                # If no jobs found on this page, stop pagination
-                if len(job_cards) == 0:
-                    break
 
-                page_jobs_added = 0
-                for card in job_cards:
-                    try:
-                        # Extract title and link
-                        title = None
-                        url = ""
-                        company = 'See on XING'
-
-                        # Try to find title in various places
-                        title_elem = (card.find('h2') or
-                                     card.find('h3') or
-                                     card.find('h4') or
-                                     card.find('a', {'class': lambda x: x and 'title' in x.lower() if x else False}) or
-                                     card.find('a', href=True))
-
-                        if title_elem:
-                            if title_elem.name == 'a':
-                                title = title_elem.get_text(strip=True)
-                                url = title_elem.get('href', '')
-                            else:
-                                link_in_title = title_elem.find('a')
-                                if link_in_title:
-                                    title = link_in_title.get_text(strip=True)
-                                    url = link_in_title.get('href', '')
-                                else:
-                                    title = title_elem.get_text(strip=True)
-                                    # Try to find a link elsewhere in card
-                                    link_elem = card.find('a', href=True)
-                                    url = link_elem.get('href', '') if link_elem else ''
-
-                        # Try to extract company if available
-                        company_elem = (card.find('span', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                       card.find('div', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                       card.find('a', {'class': lambda x: x and 'company' in x.lower() if x else False}))
-
-                        if company_elem:
-                            company = company_elem.get_text(strip=True)
-
-                        # Try to extract salary
-                        salary_elem = card.find('span', class_=lambda x: x and 'salary' in x.lower() if x else False)
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        # Make URL absolute
-                        if url and not url.startswith('http'):
-                            url = f"https://www.xing.com{url}"
-
-                        # Extract job level and skills
-                        summary = f"{title} {company}"
-                        job_level = self._extract_job_level(title, summary)
-                        skills = self._extract_skills(summary)
-
-                        # Extract posted date
-                        date_elem = (card.find('span', {'class': lambda x: x and 'date' in x.lower() or x and 'time' in x.lower() if x else False}) or
-                                   card.find('time'))
-                        date_text = date_elem.get_text(strip=True) if date_elem else None
-                        posted_date = self._extract_posted_date(date_text) if date_text else None
-
-                        # Only add job if we have at least a title and not duplicate
-                        if title and not any(j['title'] == title and j['company'] == company for j in jobs):
-                            job = {
-                                'title': title,
-                                'company': company,
-                                'location': location,
-                                'summary': 'Full details available on XING',
-                                'url': url,
-                                'portal': 'XING Jobs',
-                                'salary': salary,
-                                'job_level': job_level,
-                                'skills': skills,
-                                'posted_date': posted_date
-                            }
-                            jobs.append(job)
-                            page_jobs_added += 1
-                    except Exception as e:
-                        logger.debug(f"Error parsing job card: {str(e)}")
-                        continue
-
-                self.debug_info['pages_scraped'] = page
+class IndeedDeScraper(JobScraper):
+    """Scraper for Indeed.de"""
 
-                # Stop if we didn't add any new jobs from this page
-                if page_jobs_added == 0:
-                    break
+    spec = INDEED
+    html_parser = 'html.parser'
 
-                # Respectful delay between pages
-                time.sleep(random.uniform(1.5, 2.5))
 
-            self.debug_info['jobs_found'] = len(jobs)
+class StepStoneScraper(JobScraper):
+    """Scraper for StepStone.de"""
 
-        except requests.exceptions.RequestException as e:
-            self.debug_info['error'] = f"Network error: {str(e)}"
-            logger.error(f"Error scraping XING Jobs: {str(e)}")
-        except Exception as e:
-            self.debug_info['error'] = f"Parsing error: {str(e)}"
-            logger.error(f"Error scraping XING Jobs: {str(e)}")
+    spec = STEPSTONE
+    html_parser = 'html.parser'
 
-        return jobs, self.debug_info
+
+class XingJobsScraper(JobScraper):
+    """Scraper for XING Jobs"""
+
+    spec = XING
+    html_parser = 'html.parser'
 
 
 class MonsterDeScraper(JobScraper):
     """Scraper for Monster.de"""
 
-    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 100) -> Tuple[List[Dict], Dict]:
-        jobs = []
-        self.debug_info = {
-            'url': '',
-            'status_code': 0,
-            'error': '',
-            'jobs_found': 0,
-            'selectors_tried': [],
-            'html_sample': '',
-            'pages_scraped': 0
-        }
+    spec = MONSTER
+    track_every_page = True
+    dedup_key = staticmethod(url_key)
 
-        try:
-            seen_urls = set()
-
-            # Scrape multiple pages
-            for page in range(min(max_pages, 100)):
-                # Monster.de uses page parameter
-                params = {
-                    'q': keywords,
-                    'where': location,
-                    'page': page + 1
-                }
-
-                base_url = "https://www.monster.de/jobs/suche"
-
-                # First page has different URL structure
-                if page == 0:
-                    url = f"{base_url}?q={keywords.replace(' ', '+')}&where={location.replace(' ', '+')}"
-                else:
-                    url = f"{base_url}?q={keywords.replace(' ', '+')}&where={location.replace(' ', '+')}&page={page + 1}"
-
-                self.debug_info['url'] = url
-
-                response = requests.get(url, headers=self.headers, timeout=15)
-                self.debug_info['status_code'] = response.status_code
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'lxml')
-
-                # Multiple selector strategies for Monster.de
-                job_cards_selectors = [
-                    ('div', {'class': lambda x: x and 'job-card' in x.lower() if x else False}),
-                    ('div', {'data-test-id': 'svx-job-card'}),
-                    ('article', {'class': lambda x: x and 'job' in x.lower() if x else False}),
-                    ('div', {'class': 'card'}),
-                    ('section', {'class': lambda x: x and 'card' in x.lower() if x else False}),
-                ]
-
-                job_cards = []
-                for tag, attrs in job_cards_selectors:
-                    self.debug_info['selectors_tried'].append(f"{tag} with {attrs}")
-                    job_cards = soup.find_all(tag, attrs, limit=50)
-                    if job_cards:
-                        break
-
-                if not job_cards:
-                    if page == 0:
-                        self.debug_info['html_sample'] = str(soup)[:1000]
-                    break
 
-                self.debug_info['pages_scraped'] = page + 1
-                page_jobs_count = 0
-
-                for card in job_cards:
-                    try:
-                        # Extract title with multiple fallbacks
-                        title_elem = (card.find('h2') or
-                                    card.find('h3') or
-                                    card.find('a', {'data-test-id': 'svx-job-title'}) or
-                                    card.find('a', {'class': lambda x: x and 'title' in x.lower() if x else False}))
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get_text(strip=True)
-
-                        # Extract company
-                        company_elem = (card.find('div', {'data-test-id': 'svx-job-company'}) or
-                                      card.find('span', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                      card.find('div', {'class': lambda x: x and 'company' in x.lower() if x else False}))
-                        company = company_elem.get_text(strip=True) if company_elem else "Company not specified"
-
-                        # Extract location
-                        location_elem = (card.find('div', {'data-test-id': 'svx-job-location'}) or
-                                       card.find('span', {'class': lambda x: x and 'location' in x.lower() if x else False}) or
-                                       card.find('div', {'class': lambda x: x and 'location' in x.lower() if x else False}))
-                        loc = location_elem.get_text(strip=True) if location_elem else location
-
-                        # Extract summary
-                        summary_elem = (card.find('div', {'class': lambda x: x and 'description' in x.lower() if x else False}) or
-                                      card.find('p') or
-                                      card.find('div', {'class': lambda x: x and 'summary' in x.lower() if x else False}))
-                        summary = summary_elem.get_text(strip=True)[:300] if summary_elem else ""
-
-                        # Extract URL
-                        link_elem = title_elem if title_elem.name == 'a' else card.find('a')
-                        job_link = link_elem.get('href', '') if link_elem else ''
-                        if job_link and not job_link.startswith('http'):
-                            job_link = f"https://www.monster.de{job_link}"
-
-                        # Skip duplicates
-                        if job_link in seen_urls:
-                            continue
-                        seen_urls.add(job_link)
-
-                        # Extract salary
-                        salary_elem = (card.find('span', {'class': lambda x: x and 'salary' in x.lower() if x else False}) or
-                                     card.find('div', {'class': lambda x: x and 'salary' in x.lower() if x else False}))
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        # Extract job level and skills
-                        job_level = self._extract_job_level(title, summary)
-                        skills = self._extract_skills(summary)
-
-                        # Extract posted date
-                        date_elem = (card.find('span', {'class': lambda x: x and 'date' in x.lower() or x and 'time' in x.lower() if x else False}) or
-                                   card.find('div', {'class': lambda x: x and 'date' in x.lower() or x and 'time' in x.lower() if x else False}) or
-                                   card.find('time'))
-                        date_text = date_elem.get_text(strip=True) if date_elem else None
-                        posted_date = self._extract_posted_date(date_text) if date_text else None
-
-                        job = {
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'summary': summary,
-                            'url': job_link,
-                            'portal': 'Monster.de',
-                            'salary': salary,
-                            'job_level': job_level,
-                            'skills': skills,
-                            'posted_date': posted_date
-                        }
-
-                        jobs.append(job)
-                        page_jobs_count += 1
-
-                    except Exception as e:
-                        logger.debug(f"Error parsing Monster.de job card: {str(e)}")
-                        continue
-
-                if page_jobs_count == 0:
-                    break
+class ArbeitsagenturScraper(JobScraper):
+    """Scraper for Arbeitsagentur.de (German Federal Employment Agency)"""
 
-                # Respectful delay between pages
-                time.sleep(random.uniform(1.5, 2.5))
+    spec = ARBEITSAGENTUR
+    track_every_page = True
+    dedup_key = staticmethod(url_key)
 
-            self.debug_info['jobs_found'] = len(jobs)
 
-        except requests.exceptions.RequestException as e:
-            self.debug_info['error'] = f"Network error: {str(e)}"
-            logger.error(f"Error scraping Monster.de: {str(e)}")
-        except Exception as e:
-            self.debug_info['error'] = f"Parsing error: {str(e)}"
-            logger.error(f"Error scraping Monster.de: {str(e)}")
+class LinkedInScraper(JobScraper):
+    """Scraper for LinkedIn (Note: LinkedIn has strict anti-scraping measures)"""
 
-        return jobs, self.debug_info
+    spec = LINKEDIN
+    track_every_page = True
+    dedup_key = staticmethod(url_key)
+    # No parallel prefetch for LinkedIn due to anti-scraping measures (its lower
+    # request rate is configured in rate_limit.PORTAL_RATE_LIMITS)
+    max_prefetch = 1
+
+
+# Portal name -> scraper class used by scrape_all_portals
+PORTAL_SCRAPERS = {
+    'Indeed.de': IndeedDeScraper,
+    'StepStone.de': StepStoneScraper,
+    'XING Jobs': XingJobsScraper,
+    'Monster.de': MonsterDeScraper,
+    'Arbeitsagentur.de': ArbeitsagenturScraper,
+}
+
+# Upper bound on portals scraped at the same time when max_workers is not given
+MAX_PORTAL_WORKERS = 5
+
+
+def _portal_error(portal_name: str, e: Exception) -> Dict:
+    """Debug info of a portal whose scraper failed unexpectedly"""
+    logger.error(f"Error with {portal_name}: {str(e)}")
+    return {
+        'error': f"Unexpected error: {str(e)}",
+        'jobs_found': 0,
+        'pages_scraped': 0
+    }
 
 
-class ArbeitsagenturScraper(JobScraper):
-    """Scraper for Arbeitsagentur.de (German Federal Employment Agency)"""
+def normalize_query(text: str) -> str:
+    """Search input in the form identical searches share: lower case, single spaces"""
+    return ' '.join((text or '').lower().split())
 
-    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 100) -> Tuple[List[Dict], Dict]:
-        jobs = []
-        self.debug_info = {
-            'url': '',
-            'status_code': 0,
-            'error': '',
-            'jobs_found': 0,
-            'selectors_tried': [],
-            'html_sample': '',
-            'pages_scraped': 0
-        }
 
-        try:
-            seen_urls = set()
-
-            # Scrape multiple pages
-            for page in range(min(max_pages, 100)):
-                # Arbeitsagentur uses page parameter
-                params = {
-                    'was': keywords,
-                    'wo': location,
-                    'page': page
-                }
-
-                base_url = "https://www.arbeitsagentur.de/jobsuche"
-
-                if page == 0:
-                    url = f"{base_url}?was={keywords.replace(' ', '+')}&wo={location.replace(' ', '+')}"
-                else:
-                    url = f"{base_url}?was={keywords.replace(' ', '+')}&wo={location.replace(' ', '+')}&page={page}"
-
-                self.debug_info['url'] = url
-
-                response = requests.get(url, headers=self.headers, timeout=15)
-                self.debug_info['status_code'] = response.status_code
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'lxml')
-
-                # Multiple selector strategies for Arbeitsagentur
-                job_cards_selectors = [
-                    ('div', {'class': lambda x: x and 'job' in x.lower() and 'card' in x.lower() if x else False}),
-                    ('article', {'class': lambda x: x and 'job' in x.lower() if x else False}),
-                    ('div', {'data-test': lambda x: x and 'job' in x.lower() if x else False}),
-                    ('li', {'class': lambda x: x and 'result' in x.lower() if x else False}),
-                    ('div', {'class': 'result-item'}),
-                ]
-
-                job_cards = []
-                for tag, attrs in job_cards_selectors:
-                    self.debug_info['selectors_tried'].append(f"{tag} with {attrs}")
-                    job_cards = soup.find_all(tag, attrs, limit=50)
-                    if job_cards:
-                        break
-
-                if not job_cards:
-                    if page == 0:
-                        self.debug_info['html_sample'] = str(soup)[:1000]
-                    break
+# Identical portal scrapes running at the same time (e.g. several users
+# pressing the same Quick Search) share one execution; PORTAL_STREAMS does
+# the same for the page by page scrapes of stream_all_portals
+PORTAL_FLIGHTS = SingleFlight()
+PORTAL_STREAMS = StreamFlight()
 
-                self.debug_info['pages_scraped'] = page + 1
-                page_jobs_count = 0
-
-                for card in job_cards:
-                    try:
-                        # Extract title with multiple fallbacks
-                        title_elem = (card.find('h3') or
-                                    card.find('h2') or
-                                    card.find('a', {'class': lambda x: x and 'title' in x.lower() if x else False}) or
-                                    card.find('span', {'class': lambda x: x and 'title' in x.lower() if x else False}))
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get_text(strip=True)
-
-                        # Extract company
-                        company_elem = (card.find('span', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                      card.find('div', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                      card.find('p', {'class': lambda x: x and 'company' in x.lower() if x else False}))
-                        company = company_elem.get_text(strip=True) if company_elem else "Company not specified"
-
-                        # Extract location
-                        location_elem = (card.find('span', {'class': lambda x: x and 'location' in x.lower() or x and 'ort' in x.lower() if x else False}) or
-                                       card.find('div', {'class': lambda x: x and 'location' in x.lower() or x and 'ort' in x.lower() if x else False}))
-                        loc = location_elem.get_text(strip=True) if location_elem else location
-
-                        # Extract summary
-                        summary_elem = (card.find('div', {'class': lambda x: x and 'description' in x.lower() if x else False}) or
-                                      card.find('p', {'class': lambda x: x and 'text' in x.lower() or x and 'beschreibung' in x.lower() if x else False}) or
-                                      card.find('p'))
-                        summary = summary_elem.get_text(strip=True)[:300] if summary_elem else ""
-
-                        # Extract URL
-                        link_elem = title_elem if title_elem.name == 'a' else card.find('a')
-                        job_link = link_elem.get('href', '') if link_elem else ''
-                        if job_link and not job_link.startswith('http'):
-                            job_link = f"https://www.arbeitsagentur.de{job_link}"
-
-                        # Skip duplicates
-                        if job_link in seen_urls:
-                            continue
-                        seen_urls.add(job_link)
-
-                        # Extract salary
-                        salary_elem = (card.find('span', {'class': lambda x: x and 'salary' in x.lower() or x and 'gehalt' in x.lower() if x else False}) or
-                                     card.find('div', {'class': lambda x: x and 'salary' in x.lower() or x and 'gehalt' in x.lower() if x else False}))
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        # Extract posted date
-                        date_elem = (card.find('span', {'class': lambda x: x and 'date' in x.lower() or x and 'time' in x.lower() if x else False}) or
-                                   card.find('div', {'class': lambda x: x and 'date' in x.lower() or x and 'time' in x.lower() if x else False}) or
-                                   card.find('time'))
-                        date_text = date_elem.get_text(strip=True) if date_elem else None
-                        posted_date = self._extract_posted_date(date_text) if date_text else None
-
-                        # Extract job level and skills
-                        job_level = self._extract_job_level(title, summary)
-                        skills = self._extract_skills(summary)
-
-                        job = {
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'summary': summary,
-                            'url': job_link,
-                            'portal': 'Arbeitsagentur.de',
-                            'salary': salary,
-                            'job_level': job_level,
-                            'skills': skills,
-                            'posted_date': posted_date
-                        }
-
-                        jobs.append(job)
-                        page_jobs_count += 1
-
-                    except Exception as e:
-                        logger.debug(f"Error parsing Arbeitsagentur job card: {str(e)}")
-                        continue
-
-                if page_jobs_count == 0:
-                    break
 
-                # Respectful delay between pages
-                time.sleep(random.uniform(1.5, 2.5))
+def _flight_key(portal_name: str, keywords: str, location: str, job_type: str, max_pages: int, known_jobs=None,
+                client=None) -> Tuple:
+    """
+    What makes two portal scrapes identical
 
-            self.debug_info['jobs_found'] = len(jobs)
+    Incremental scrapes only match for the same store, and async scrapes only
+    for the same client, as a private client is closed when its search ends.
+    """
+    return (portal_name, normalize_query(keywords), normalize_query(location), job_type or '', max_pages,
+            id(known_jobs) if known_jobs is not None else None, id(client) if client is not None else None)
 
-        except requests.exceptions.RequestException as e:
-            self.debug_info['error'] = f"Network error: {str(e)}"
-            logger.error(f"Error scraping Arbeitsagentur.de: {str(e)}")
+
+def _shared_result(result: Tuple[List[Dict], Dict], shared: bool, portal_name: str) -> Tuple[List[Dict], Dict]:
+    """Give every caller of a coalesced scrape its own job list and debug info to modify"""
+    jobs, debug_info = result
+    if shared:
+        logger.info(f"{portal_name}: Joined an identical scrape already in progress")
+    return list(jobs), dict(debug_info)
+
+
+def _scrape_portal(portal_name: str, keywords: str, location: str, job_type: str, max_pages: int,
+                   **scrape_kwargs) -> Tuple[List[Dict], Dict]:
+    """Run a single portal scraper, turning unexpected failures into debug info"""
+    def scrape():
+        try:
+            scraper = PORTAL_SCRAPERS[portal_name]()
+            jobs, debug_info = scraper.scrape(keywords, location, job_type, max_pages, **scrape_kwargs)
+            logger.info(f"{portal_name}: Retrieved {len(jobs)} jobs from {debug_info.get('pages_scraped', 0)} pages")
+            return jobs, debug_info
         except Exception as e:
-            self.debug_info['error'] = f"Parsing error: {str(e)}"
-            logger.error(f"Error scraping Arbeitsagentur.de: {str(e)}")
+            return [], _portal_error(portal_name, e)
 
-        return jobs, self.debug_info
+    key = _flight_key(portal_name, keywords, location, job_type, max_pages, scrape_kwargs.get('known_jobs'))
+    return _shared_result(*PORTAL_FLIGHTS.do(key, scrape), portal_name)
 
 
-class LinkedInScraper(JobScraper):
-    """Scraper for LinkedIn (Note: LinkedIn has strict anti-scraping measures)"""
+def _store_jobs(store, jobs: List[Dict]):
+    """Upsert search results into a job store without failing the search"""
+    try:
+        inserted, updated = store.upsert_jobs(jobs)
+        logger.info(f"Job store: {inserted} new, {updated} updated jobs")
+    except Exception as e:
+        logger.error(f"Error saving jobs to the job store: {str(e)}")
 
-    def scrape(self, keywords: str, location: str, job_type: str = "", max_pages: int = 100) -> Tuple[List[Dict], Dict]:
-        jobs = []
-        self.debug_info = {
-            'url': '',
-            'status_code': 0,
-            'error': '',
-            'jobs_found': 0,
-            'selectors_tried': [],
-            'html_sample': '',
-            'pages_scraped': 0
-        }
 
-        try:
-            seen_urls = set()
-
-            # Scrape multiple pages
-            for page in range(min(max_pages, 100)):
-                # LinkedIn uses start parameter (25 jobs per page)
-                start = page * 25
-
-                # LinkedIn public jobs search URL
-                params = {
-                    'keywords': keywords,
-                    'location': location,
-                    'start': start
-                }
-
-                url = f"https://www.linkedin.com/jobs/search?keywords={keywords.replace(' ', '%20')}&location={location.replace(' ', '%20')}&start={start}"
-                self.debug_info['url'] = url
-
-                response = requests.get(url, headers=self.headers, timeout=15)
-                self.debug_info['status_code'] = response.status_code
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'lxml')
-
-                # Multiple selector strategies for LinkedIn
-                job_cards_selectors = [
-                    ('li', {'class': lambda x: x and 'job' in x.lower() if x else False}),
-                    ('div', {'class': lambda x: x and 'job-search-card' in x.lower() if x else False}),
-                    ('div', {'data-entity-urn': lambda x: x and 'job' in x.lower() if x else False}),
-                    ('article', {'class': lambda x: x and 'job' in x.lower() if x else False}),
-                ]
-
-                job_cards = []
-                for tag, attrs in job_cards_selectors:
-                    self.debug_info['selectors_tried'].append(f"{tag} with {attrs}")
-                    job_cards = soup.find_all(tag, attrs, limit=50)
-                    if job_cards:
-                        break
-
-                if not job_cards:
-                    if page == 0:
-                        self.debug_info['html_sample'] = str(soup)[:1000]
-                        self.debug_info['error'] = "LinkedIn may be blocking automated access. Consider using LinkedIn API or reducing request frequency."
-                    break
+def _merge_results(portals: List[str], results: List[Tuple[List[Dict], Dict]], dedup: str, store) -> Tuple[List[Dict], Dict]:
+    """Concatenate per-portal results in portal order, apply the dedup policy and store the jobs"""
+    all_jobs = []
+    debug_summary = {}
 
-                self.debug_info['pages_scraped'] = page + 1
-                page_jobs_count = 0
-
-                for card in job_cards:
-                    try:
-                        # Extract title
-                        title_elem = (card.find('h3', {'class': lambda x: x and 'job' in x.lower() if x else False}) or
-                                    card.find('h3') or
-                                    card.find('a', {'class': lambda x: x and 'job-title' in x.lower() if x else False}))
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get_text(strip=True)
-
-                        # Extract company
-                        company_elem = (card.find('h4', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                      card.find('a', {'class': lambda x: x and 'company' in x.lower() if x else False}) or
-                                      card.find('span', {'class': lambda x: x and 'company' in x.lower() if x else False}))
-                        company = company_elem.get_text(strip=True) if company_elem else "Company not specified"
-
-                        # Extract location
-                        location_elem = (card.find('span', {'class': lambda x: x and 'location' in x.lower() if x else False}) or
-                                       card.find('div', {'class': lambda x: x and 'location' in x.lower() if x else False}))
-                        loc = location_elem.get_text(strip=True) if location_elem else location
-
-                        # Extract summary
-                        summary_elem = card.find('p') or card.find('div', {'class': lambda x: x and 'description' in x.lower() if x else False})
-                        summary = summary_elem.get_text(strip=True)[:300] if summary_elem else ""
-
-                        # Extract URL
-                        link_elem = card.find('a', {'class': lambda x: x and 'job' in x.lower() if x else False}) or card.find('a')
-                        job_link = link_elem.get('href', '') if link_elem else ''
-                        if job_link and not job_link.startswith('http'):
-                            job_link = f"https://www.linkedin.com{job_link}"
-
-                        # Skip duplicates
-                        if job_link in seen_urls:
-                            continue
-                        seen_urls.add(job_link)
-
-                        # Extract salary
-                        salary_elem = card.find('span', {'class': lambda x: x and 'salary' in x.lower() if x else False})
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        # Extract job level and skills
-                        job_level = self._extract_job_level(title, summary)
-                        skills = self._extract_skills(summary)
-
-                        job = {
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'summary': summary,
-                            'url': job_link,
-                            'portal': 'LinkedIn',
-                            'salary': salary,
-                            'job_level': job_level,
-                            'skills': skills
-                        }
-
-                        jobs.append(job)
-                        page_jobs_count += 1
-
-                    except Exception as e:
-                        logger.debug(f"Error parsing LinkedIn job card: {str(e)}")
-                        continue
-
-                if page_jobs_count == 0:
-                    break
+    for portal_name, (jobs, debug_info) in zip(portals, results):
+        all_jobs.extend(jobs)
+        debug_summary[portal_name] = debug_info
 
-                # Longer delay for LinkedIn due to anti-scraping measures
-                time.sleep(random.uniform(2.5, 4.0))
+    # Jobs of scrapers that do not enrich their cards get skills and job level here
+    enrich_jobs(all_jobs)
 
-            self.debug_info['jobs_found'] = len(jobs)
+    # Store every portal's copy so incremental crawls of each portal know it
+    if store is not None:
+        _store_jobs(store, all_jobs)
 
-        except requests.exceptions.RequestException as e:
-            self.debug_info['error'] = f"Network error: {str(e)}"
-            logger.error(f"Error scraping LinkedIn: {str(e)}")
-        except Exception as e:
-            self.debug_info['error'] = f"Parsing error: {str(e)}"
-            logger.error(f"Error scraping LinkedIn: {str(e)}")
+    # Each scraper already removes duplicates within its own portal
+    if dedup != 'portal':
+        all_jobs, removed = deduplicate(all_jobs, dedup)
+        for portal_name, count in removed.items():
+            debug_info = debug_summary.get(portal_name)
+            if debug_info is not None:
+                debug_info['duplicates_merged'] = debug_info.get('duplicates_merged', 0) + count
 
-        return jobs, self.debug_info
+    return all_jobs, debug_summary
 
 
-def scrape_all_portals(keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None, max_pages: int = 100) -> Tuple[List[Dict], Dict]:
+def scrape_all_portals(keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None, max_pages: int = 100,
+                       max_workers: Optional[int] = None, prefetch: int = 0, store=None,
+                       incremental: bool = False, dedup: str = 'portal') -> Tuple[List[Dict], Dict]:
     """
     Scrape all selected job portals
 
+    Each portal runs in its own worker thread, so the total search time is
+    roughly that of the slowest portal. Results are merged in the order of
+    selected_portals, exactly as a sequential run would produce them.
+
     Args:
         keywords: Job search keywords
         location: Location to search
         job_type: Type of job (Full-time, Part-time, Remote, etc.)
         selected_portals: List of portal names to scrape
         max_pages: Maximum number of pages to scrape per portal (default: 40)
+        max_workers: Maximum number of portals scraped concurrently
+                     (default: one per portal, up to MAX_PORTAL_WORKERS; 1 = sequential)
+        prefetch: Pages fetched ahead in parallel within each portal (0 = serial pagination)
+        store: Optional job_store.JobStore the jobs of every portal are upserted into
+        incremental: Only return postings that are new or changed compared to store, stopping
+                     each portal at the first page of known jobs (needs store)
+        dedup: Duplicate policy for the merged list, see dedup.DEDUP_POLICIES ('portal' = only
+               within each portal, 'global' = same title and company across portals,
+               'fuzzy' = normalized title and company, 'near' = cluster cross-portal copies
+               into one job listing every copy under 'sources'). Removed jobs are counted
+               in each portal's 'duplicates_merged'.
 
     Returns:
         Tuple of (List of job dictionaries, Debug information dictionary)
     """
-    all_jobs = []
-    debug_summary = {}
+    if dedup not in DEDUP_POLICIES:
+        raise ValueError(f"Unknown dedup policy '{dedup}', expected one of {', '.join(DEDUP_POLICIES)}")
+
+    if selected_portals is None:
+        selected_portals = list(PORTAL_SCRAPERS.keys())
 
-    scrapers = {
-        'Indeed.de': IndeedDeScraper(),
-        'StepStone.de': StepStoneScraper(),
-        'XING Jobs': XingJobsScraper(),
-        'Monster.de': MonsterDeScraper(),
-        'Arbeitsagentur.de': ArbeitsagenturScraper(),
+    portals = [portal_name for portal_name in selected_portals if portal_name in PORTAL_SCRAPERS]
+    if not portals:
+        return [], {}
+
+    if max_workers is None:
+        max_workers = min(len(portals), MAX_PORTAL_WORKERS)
+
+    scrape_kwargs = {
+        'prefetch': prefetch,
+        'known_jobs': store if incremental else None,
     }
 
+    if max_workers <= 1:
+        results = [_scrape_portal(portal_name, keywords, location, job_type, max_pages, **scrape_kwargs) for portal_name in portals]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='portal') as executor:
+            results = list(executor.map(
+                lambda portal_name: _scrape_portal(portal_name, keywords, location, job_type, max_pages, **scrape_kwargs),
+                portals
+            ))
+
+    return _merge_results(portals, results, dedup, store)
+
+
+async def _ascrape_portal(portal_name: str, keywords: str, location: str, job_type: str, max_pages: int,
+                          **scrape_kwargs) -> Tuple[List[Dict], Dict]:
+    """Async counterpart of _scrape_portal"""
+    async def scrape():
+        try:
+            scraper = PORTAL_SCRAPERS[portal_name]()
+            jobs, debug_info = await scraper.ascrape(keywords, location, job_type, max_pages, **scrape_kwargs)
+            logger.info(f"{portal_name}: Retrieved {len(jobs)} jobs from {debug_info.get('pages_scraped', 0)} pages")
+            return jobs, debug_info
+        except Exception as e:
+            return [], _portal_error(portal_name, e)
+
+    key = _flight_key(portal_name, keywords, location, job_type, max_pages, scrape_kwargs.get('known_jobs'),
+                      scrape_kwargs.get('client'))
+    return _shared_result(*(await PORTAL_FLIGHTS.ado(key, scrape)), portal_name)
+
+
+async def ascrape_all_portals(keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None, max_pages: int = 100,
+                              prefetch: int = 0, client=None, host_limiter: Optional[HostLimiter] = None,
+                              store=None, incremental: bool = False, dedup: str = 'portal') -> Tuple[List[Dict], Dict]:
+    """
+    Async version of scrape_all_portals running every portal on the current event loop
+
+    Pass a shared client and host_limiter to run many searches in one process
+    while keeping the number of concurrent requests per host bounded.
+
+    Args:
+        keywords: Job search keywords
+        location: Location to search
+        job_type: Type of job (Full-time, Part-time, Remote, etc.)
+        selected_portals: List of portal names to scrape
+        max_pages: Maximum number of pages to scrape per portal
+        prefetch: Pages fetched ahead concurrently within each portal (0 = serial pagination)
+        client: Shared httpx.AsyncClient (a private one is created if omitted)
+        host_limiter: Shared HostLimiter (a private one is created if omitted)
+        store: Optional job_store.JobStore the jobs of every portal are upserted into
+        incremental: Only return postings that are new or changed compared to store, stopping
+                     each portal at the first page of known jobs (needs store)
+        dedup: Duplicate policy for the merged list, see dedup.DEDUP_POLICIES ('portal' = only
+               within each portal, 'global' = same title and company across portals,
+               'fuzzy' = normalized title and company, 'near' = cluster cross-portal copies
+               into one job listing every copy under 'sources'). Removed jobs are counted
+               in each portal's 'duplicates_merged'.
+
+    Returns:
+        Tuple of (List of job dictionaries, Debug information dictionary)
+    """
+    if dedup not in DEDUP_POLICIES:
+        raise ValueError(f"Unknown dedup policy '{dedup}', expected one of {', '.join(DEDUP_POLICIES)}")
+
     if selected_portals is None:
-        selected_portals = list(scrapers.keys())
+        selected_portals = list(PORTAL_SCRAPERS.keys())
 
-    for portal_name in selected_portals:
-        if portal_name in scrapers:
-            try:
-                scraper = scrapers[portal_name]
-                jobs, debug_info = scraper.scrape(keywords, location, job_type, max_pages)
-                all_jobs.extend(jobs)
-                debug_summary[portal_name] = debug_info
-                logger.info(f"{portal_name}: Retrieved {len(jobs)} jobs from {debug_info.get('pages_scraped', 0)} pages")
-            except Exception as e:
-                debug_summary[portal_name] = {
-                    'error': f"Unexpected error: {str(e)}",
-                    'jobs_found': 0,
-                    'pages_scraped': 0
-                }
-                logger.error(f"Error with {portal_name}: {str(e)}")
+    portals = [portal_name for portal_name in selected_portals if portal_name in PORTAL_SCRAPERS]
+    if not portals:
+        return [], {}
 
-    return all_jobs, debug_summary
+    owns_client = client is None
+    if owns_client:
+        client = new_async_client()
+    if host_limiter is None:
+        host_limiter = HostLimiter()
+
+    try:
+        results = await asyncio.gather(*[
+            _ascrape_portal(portal_name, keywords, location, job_type, max_pages, prefetch=prefetch,
+                            known_jobs=store if incremental else None, client=client, host_limiter=host_limiter)
+            for portal_name in portals
+        ])
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    return _merge_results(portals, results, dedup, store)
+
+
+# Events yielded by stream_all_portals / astream_all_portals, as dicts with an 'event' key:
+#   page   - 'portal', 'page', 'jobs' (new jobs of one parsed result page), 'total' (jobs of the portal so far)
+#   portal - 'portal', 'debug_info': a portal finished, debug_info as returned by scrape()
+#   done   - 'debug_info' (per-portal summary, like scrape_all_portals) and 'jobs': every portal finished.
+#            'jobs' is the clustered result for dedup='near' and None otherwise, as the page
+#            events already carried the final jobs.
+
+
+class _PortalStream:
+    """
+    Turns the page batches of concurrently running portals into stream events
+
+    Page batches are stored and deduplicated as they arrive. The hash-based
+    policies drop a job when an equal one arrived earlier from any portal;
+    'near' clustering needs every job, so it runs once all portals are done.
+    """
+
+    def __init__(self, portals: List[str], dedup: str, store):
+        if dedup not in DEDUP_POLICIES:
+            raise ValueError(f"Unknown dedup policy '{dedup}', expected one of {', '.join(DEDUP_POLICIES)}")
+        self.portals = portals
+        self.dedup = dedup
+        self.store = store
+        self.remaining = len(portals)
+        self.totals = {portal_name: 0 for portal_name in portals}
+        self.removed = {portal_name: 0 for portal_name in portals}
+        self.debug_summary = {}
+        # Each scraper already removes duplicates within its own portal
+        self._dedup = Deduplicator(policy_key(dedup)) if dedup in ('global', 'fuzzy') else None
+        self._collected = {portal_name: [] for portal_name in portals} if dedup == 'near' else None
+
+    def page(self, portal_name: str, page: int, page_jobs: List[Dict]) -> Dict:
+        # Store every portal's copy so incremental crawls of each portal know it
+        if self.store is not None:
+            _store_jobs(self.store, page_jobs)
+        if self._collected is not None:
+            self._collected[portal_name].extend(page_jobs)
+        if self._dedup is not None:
+            unique = [job for job in page_jobs if self._dedup.add(job)]
+            self.removed[portal_name] += len(page_jobs) - len(unique)
+            page_jobs = unique
+
+        self.totals[portal_name] += len(page_jobs)
+        return {'event': 'page', 'portal': portal_name, 'page': page, 'jobs': page_jobs, 'total': self.totals[portal_name]}
+
+    def portal(self, portal_name: str, debug_info: Dict) -> Dict:
+        self.remaining -= 1
+        if self.removed[portal_name]:
+            debug_info['duplicates_merged'] = debug_info.get('duplicates_merged', 0) + self.removed[portal_name]
+        self.debug_summary[portal_name] = debug_info
+        logger.info(f"{portal_name}: Retrieved {debug_info.get('jobs_found', 0)} jobs from {debug_info.get('pages_scraped', 0)} pages")
+        return {'event': 'portal', 'portal': portal_name, 'debug_info': debug_info}
+
+    def done(self) -> Dict:
+        debug_summary = {portal_name: self.debug_summary[portal_name] for portal_name in self.portals}
+        jobs = None
+        if self._collected is not None:
+            # Cluster in portal order, exactly like scrape_all_portals
+            jobs, removed = deduplicate([job for portal_name in self.portals for job in self._collected[portal_name]], 'near')
+            for portal_name, count in removed.items():
+                debug_info = debug_summary.get(portal_name)
+                if debug_info is not None:
+                    debug_info['duplicates_merged'] = debug_info.get('duplicates_merged', 0) + count
+        return {'event': 'done', 'debug_info': debug_summary, 'jobs': jobs}
+
+
+def _portal_events(portal_name: str, keywords: str, location: str, job_type: str, max_pages: int,
+                   **scrape_kwargs) -> Iterator[Tuple]:
+    """('page', portal, page, jobs) per parsed page and a final ('portal', portal, debug_info) of one portal scrape"""
+    try:
+        scraper = PORTAL_SCRAPERS[portal_name]()
+        pages = scraper.scrape_pages(keywords, location, job_type, max_pages, **scrape_kwargs)
+        try:
+            for page, page_jobs in pages:
+                yield 'page', portal_name, page, page_jobs
+        finally:
+            pages.close()
+        debug_info = scraper.debug_info
+    except Exception as e:
+        debug_info = _portal_error(portal_name, e)
+    yield 'portal', portal_name, debug_info
+
+
+async def _aportal_events(portal_name: str, keywords: str, location: str, job_type: str, max_pages: int,
+                          **scrape_kwargs) -> AsyncIterator[Tuple]:
+    """Async counterpart of _portal_events"""
+    try:
+        scraper = PORTAL_SCRAPERS[portal_name]()
+        pages = scraper.ascrape_pages(keywords, location, job_type, max_pages, **scrape_kwargs)
+        try:
+            async for page, page_jobs in pages:
+                yield 'page', portal_name, page, page_jobs
+        finally:
+            await pages.aclose()
+        debug_info = scraper.debug_info
+    except Exception as e:
+        debug_info = _portal_error(portal_name, e)
+    yield 'portal', portal_name, debug_info
+
+
+def _own_event(event: Tuple) -> Tuple:
+    """Copy of a shared portal event the stream may modify (it adds 'duplicates_merged' to debug_info)"""
+    if event[0] == 'portal':
+        return event[0], event[1], dict(event[2])
+    return event
+
+
+def stream_all_portals(keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None, max_pages: int = 100,
+                       max_workers: Optional[int] = None, prefetch: int = 0, store=None,
+                       incremental: bool = False, dedup: str = 'portal') -> Iterator[Dict]:
+    """
+    Streaming version of scrape_all_portals yielding events as result pages are parsed
+
+    Portals run in worker threads like in scrape_all_portals; the caller gets a
+    'page' event with the new jobs of every parsed page, a 'portal' event when
+    a portal finishes and a final 'done' event (fields listed above
+    _PortalStream). Jobs arrive in the order pages finish, not in portal order.
+    Closing the generator early stops the portals after their current page.
+    Identical portal scrapes of concurrent streams share one execution
+    (PORTAL_STREAMS): a stream joining late first gets the pages parsed so far.
+
+    Takes the same arguments as scrape_all_portals.
+    """
+    if selected_portals is None:
+        selected_portals = list(PORTAL_SCRAPERS.keys())
+
+    portals = [portal_name for portal_name in selected_portals if portal_name in PORTAL_SCRAPERS]
+    stream = _PortalStream(portals, dedup, store)
+    if not portals:
+        yield stream.done()
+        return
+
+    if max_workers is None:
+        max_workers = min(len(portals), MAX_PORTAL_WORKERS)
+
+    events = queue.Queue()
+    stopped = threading.Event()
+
+    def run_portal(portal_name: str):
+        known_jobs = store if incremental else None
+        portal_events = PORTAL_STREAMS.iterate(
+            _flight_key(portal_name, keywords, location, job_type, max_pages, known_jobs),
+            lambda: _portal_events(portal_name, keywords, location, job_type, max_pages, prefetch=prefetch,
+                                   known_jobs=known_jobs)
+        )
+        try:
+            for event in portal_events:
+                events.put(_own_event(event))
+                if stopped.is_set():
+                    break
+        finally:
+            portal_events.close()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='portal')
+    try:
+        for portal_name in portals:
+            executor.submit(run_portal, portal_name)
+
+        while stream.remaining:
+            kind, portal_name, *payload = events.get()
+            yield stream.page(portal_name, *payload) if kind == 'page' else stream.portal(portal_name, *payload)
+
+        yield stream.done()
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def astream_all_portals(keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None,
+                              max_pages: int = 100, prefetch: int = 0, client=None, host_limiter: Optional[HostLimiter] = None,
+                              store=None, incremental: bool = False, dedup: str = 'portal') -> AsyncIterator[Dict]:
+    """
+    Async version of stream_all_portals running every portal on the current event loop
+
+    Takes the same arguments as ascrape_all_portals and yields the same events
+    as stream_all_portals. Portal scrapes are shared like in stream_all_portals,
+    between streams on the same event loop using the same client.
+    """
+    if selected_portals is None:
+        selected_portals = list(PORTAL_SCRAPERS.keys())
+
+    portals = [portal_name for portal_name in selected_portals if portal_name in PORTAL_SCRAPERS]
+    stream = _PortalStream(portals, dedup, store)
+    if not portals:
+        yield stream.done()
+        return
+
+    owns_client = client is None
+    if owns_client:
+        client = new_async_client()
+    if host_limiter is None:
+        host_limiter = HostLimiter()
+    events = asyncio.Queue()
+
+    async def run_portal(portal_name: str):
+        known_jobs = store if incremental else None
+        portal_events = PORTAL_STREAMS.aiterate(
+            _flight_key(portal_name, keywords, location, job_type, max_pages, known_jobs, client),
+            lambda: _aportal_events(portal_name, keywords, location, job_type, max_pages, prefetch=prefetch,
+                                    known_jobs=known_jobs, client=client, host_limiter=host_limiter)
+        )
+        try:
+            async for event in portal_events:
+                await events.put(_own_event(event))
+        finally:
+            await portal_events.aclose()
+
+    tasks = [asyncio.ensure_future(run_portal(portal_name)) for portal_name in portals]
+    try:
+        while stream.remaining:
+            kind, portal_name, *payload = await events.get()
+            yield stream.page(portal_name, *payload) if kind == 'page' else stream.portal(portal_name, *payload)
+
+        yield stream.done()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if owns_client:
+            await client.aclose()
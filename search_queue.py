@@ -0,0 +1,231 @@
+"""
+Persistent queue of background searches served by a local worker pool
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import logging
+from typing import Dict, List, Optional
+
+from job_store import DATA_DIR, DEFAULT_JOB_STORE
+from result_cache import DEFAULT_RESULT_CACHE, LiveSearch, SearchResultCache, search_key
+
+logger = logging.getLogger(__name__)
+
+# Searches run at the same time (each one already scrapes its portals in parallel)
+SEARCH_WORKERS = 2
+# Seconds between progress updates (and heartbeats) of a running search
+PROGRESS_INTERVAL = 2.0
+# A running search without a heartbeat for this long is assumed dead and queued again
+STALE_AFTER = 5 * 60
+# Finished searches are kept this long so their submitters can still fetch the results
+KEEP_FINISHED = 24 * 60 * 60
+
+# Search states: queued -> running -> done | failed
+ACTIVE_STATES = ('queued', 'running')
+
+
+class SearchQueue:
+    """
+    SQLite backed queue of search requests, executed by a pool of worker threads
+
+    Identical searches (same search_key) submitted while one is queued or
+    running share that search instead of scraping again. Results are kept in
+    the database and the result cache, so every submitter - in any session -
+    can poll them with status(). Searches interrupted by a restart are picked
+    up again once their heartbeat is stale.
+    """
+
+    def __init__(self, path: Optional[str] = None, workers: int = SEARCH_WORKERS, store=DEFAULT_JOB_STORE,
+                 cache: Optional[SearchResultCache] = None):
+        self.path = path or os.path.join(DATA_DIR, 'search_queue.sqlite3')
+        self.workers = workers
+        self.store = store
+        self.cache = cache or DEFAULT_RESULT_CACHE
+        self._conn = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+        self._running = {}  # search id -> LiveSearch of searches running in this process
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS searches (
+                    id TEXT PRIMARY KEY,
+                    key TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT,
+                    jobs TEXT,
+                    debug_summary TEXT,
+                    error TEXT,
+                    submitted_at REAL NOT NULL,
+                    started_at REAL,
+                    heartbeat_at REAL,
+                    finished_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_searches_key_status ON searches (key, status);
+                CREATE INDEX IF NOT EXISTS idx_searches_status_submitted ON searches (status, submitted_at);
+            ''')
+            self._conn = conn
+        return self._conn
+
+    def submit(self, keywords: str, location: str, job_type: str = "", selected_portals: List[str] = None,
+               max_pages: int = 100, dedup: str = 'portal', refresh: bool = False) -> str:
+        """
+        Queue a search and return its id
+
+        If the same search is already queued or running, the id of that
+        search is returned instead.
+
+        Args:
+            refresh: Scrape again even if the result cache has the search
+        """
+        key = search_key(keywords, location, job_type, selected_portals, max_pages, dedup)
+        params = {'keywords': keywords, 'location': location, 'job_type': job_type,
+                  'selected_portals': selected_portals, 'max_pages': max_pages, 'dedup': dedup, 'refresh': refresh}
+        now = time.time()
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(
+                    f"SELECT id FROM searches WHERE key = ? AND status IN ({','.join('?' * len(ACTIVE_STATES))}) "
+                    'ORDER BY submitted_at LIMIT 1',
+                    (key, *ACTIVE_STATES)
+                ).fetchone()
+                if row is not None:
+                    search_id = row['id']
+                else:
+                    search_id = uuid.uuid4().hex
+                    conn.execute('INSERT INTO searches (id, key, params, status, submitted_at) VALUES (?, ?, ?, ?, ?)',
+                                 (search_id, key, json.dumps(params, ensure_ascii=False), 'queued', now))
+                conn.execute("DELETE FROM searches WHERE status NOT IN ('queued', 'running') AND finished_at < ?",
+                             (now - KEEP_FINISHED,))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+        self._start_workers()
+        self._wakeup.set()
+        return search_id
+
+    def status(self, search_id: str) -> Optional[Dict]:
+        """
+        Current state of a search, None if it is unknown (or finished long ago)
+
+        Returns:
+            Dictionary with 'status' (queued, running, done or failed), 'jobs'
+            (found so far while running), 'debug_info', 'progress' and 'error'
+        """
+        live_search = self._running.get(search_id)
+        if live_search is not None:
+            jobs, debug_summary, progress = live_search.snapshot()
+            return {'status': 'running', 'jobs': jobs, 'debug_info': debug_summary, 'progress': progress, 'error': ''}
+
+        with self._lock:
+            row = self._connection().execute('SELECT * FROM searches WHERE id = ?', (search_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'status': row['status'],
+            'jobs': json.loads(row['jobs']) if row['jobs'] else [],
+            'debug_info': json.loads(row['debug_summary']) if row['debug_summary'] else {},
+            'progress': json.loads(row['progress']) if row['progress'] else {},
+            'error': row['error'] or ''
+        }
+
+    def _start_workers(self):
+        with self._lock:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f'search-worker-{len(self._threads)}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self):
+        """Let the workers exit after their current search"""
+        self._stopping.set()
+        self._wakeup.set()
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Mark the oldest queued (or abandoned running) search as running and return it"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(
+                    "SELECT id, params FROM searches WHERE status = 'queued' OR (status = 'running' AND heartbeat_at < ?) "
+                    'ORDER BY submitted_at LIMIT 1',
+                    (now - STALE_AFTER,)
+                ).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE searches SET status = 'running', started_at = ?, heartbeat_at = ? WHERE id = ?",
+                                 (now, now, row['id']))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return row
+
+    def _update(self, search_id: str, **columns):
+        assignments = ', '.join(f'{column} = ?' for column in columns)
+        with self._lock:
+            self._connection().execute(f'UPDATE searches SET {assignments} WHERE id = ?', (*columns.values(), search_id))
+
+    def _work(self):
+        while not self._stopping.is_set():
+            try:
+                row = self._claim()
+            except sqlite3.Error as e:
+                logger.error(f"Search queue unavailable: {str(e)}")
+                row = None
+            if row is None:
+                self._wakeup.wait(PROGRESS_INTERVAL)
+                self._wakeup.clear()
+                continue
+            self._run(row['id'], json.loads(row['params']))
+
+    def _run(self, search_id: str, params: Dict):
+        live_search = LiveSearch(cache=self.cache, store=self.store, **params)
+        self._running[search_id] = live_search
+        try:
+            threading.Thread(target=live_search.run, name='search-run', daemon=True).start()
+            # Record progress while waiting, which doubles as the heartbeat
+            while not live_search.wait(PROGRESS_INTERVAL):
+                self._update(search_id, progress=json.dumps(live_search.snapshot()[2]), heartbeat_at=time.time())
+
+            jobs, debug_summary, progress = live_search.snapshot()
+            self._update(
+                search_id,
+                status='failed' if live_search.error else 'done',
+                jobs=json.dumps(jobs, ensure_ascii=False),
+                debug_summary=json.dumps(debug_summary, ensure_ascii=False, default=str),
+                progress=json.dumps(progress),
+                error=live_search.error,
+                finished_at=time.time()
+            )
+            logger.info(f"Search {search_id} finished with {len(jobs)} jobs")
+        except Exception as e:
+            logger.error(f"Search {search_id} failed: {str(e)}")
+            self._update(search_id, status='failed', error=str(e), finished_at=time.time())
+        finally:
+            self._running.pop(search_id, None)
+
+
+# Queue shared by every session of the app; workers start with the first search
+DEFAULT_SEARCH_QUEUE = SearchQueue()
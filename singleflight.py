@@ -0,0 +1,243 @@
+"""
+Coalescing of identical concurrent calls (single-flight)
+"""
+import asyncio
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Hashable, Iterator, Tuple
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs a function once for every group of concurrent calls with the same key
+
+    The first caller of a key executes the function; callers arriving while it
+    runs wait for it and receive the same result (or exception). Once the
+    call has finished the key is forgotten, so later calls run again - this is
+    not a cache.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], object]) -> Tuple[object, bool]:
+        """
+        Call fn() unless an identical call is in flight, then wait for that one
+
+        Returns:
+            Tuple of (result, True if the result came from another caller's execution)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable]) -> Tuple[object, bool]:
+        """
+        Async counterpart of do(); calls are coalesced per event loop
+
+        fn() runs as a task of its own that every caller awaits shielded, so
+        cancelling a caller - the first one included - does not cancel the
+        call for the others.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        task = self._futures.get(key)
+        shared = task is not None
+        if not shared:
+            task = self._futures[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._futures.get(key) is task:
+            del self._futures[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled
+            task.exception()
+
+
+class _Stream:
+    """Items produced so far by a shared iterator and the state of its source"""
+
+    def __init__(self, fn: Callable):
+        self.fn = fn
+        self.source = None
+        self.items = []
+        self.readers = 0
+        self.done = False
+        self.error = None
+        self.driving = False  # sync: a reader is advancing the source
+        self.step = None      # async: task advancing the source
+
+
+class StreamFlight:
+    """
+    Single-flight for iterators: identical concurrent iterations share one source
+
+    The first caller of a key creates the iterator with fn(); callers arriving
+    while it is being consumed first receive every item produced so far, then
+    follow the new ones. Whichever reader needs the next item first advances
+    the source, so a reader stopping early - the first one included - does not
+    stop the others. The source is closed once its last reader leaves, and the
+    key is forgotten once the source is exhausted or closed.
+    """
+
+    def __init__(self):
+        self._streams = {}
+        self._changed = threading.Condition()
+
+    def iterate(self, key: Hashable, fn: Callable[[], Iterator]) -> Iterator:
+        """
+        Iterate fn() unless an identical iteration is in progress, then follow that one
+
+        A caller joins when it starts iterating, i.e. on its first next().
+        """
+        with self._changed:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._streams[key] = _Stream(fn)
+            stream.readers += 1
+
+        index = 0
+        try:
+            while True:
+                with self._changed:
+                    while index >= len(stream.items) and not stream.done and stream.driving:
+                        self._changed.wait()
+                    drive = False
+                    if index < len(stream.items):
+                        item = stream.items[index]
+                        index += 1
+                    elif stream.done:
+                        if stream.error is not None:
+                            raise stream.error
+                        return
+                    else:
+                        stream.driving = drive = True
+
+                if not drive:
+                    yield item
+                    continue
+
+                try:
+                    if stream.source is None:
+                        stream.source = iter(stream.fn())
+                    produced = next(stream.source)
+                except StopIteration:
+                    self._finish(key, stream)
+                except BaseException as e:
+                    self._finish(key, stream, e)
+                else:
+                    with self._changed:
+                        stream.items.append(produced)
+                finally:
+                    with self._changed:
+                        stream.driving = False
+                        self._changed.notify_all()
+        finally:
+            with self._changed:
+                stream.readers -= 1
+                abandoned = not stream.readers and not stream.done
+                if abandoned:
+                    self._finish_locked(key, stream)
+            if abandoned and hasattr(stream.source, 'close'):
+                stream.source.close()
+
+    async def aiterate(self, key: Hashable, fn: Callable[[], AsyncIterator]) -> AsyncIterator:
+        """Async counterpart of iterate(); iterations are coalesced per event loop"""
+        key = (id(asyncio.get_running_loop()), key)
+        with self._changed:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._streams[key] = _Stream(fn)
+            stream.readers += 1
+
+        index = 0
+        try:
+            while True:
+                if index < len(stream.items):
+                    index += 1
+                    yield stream.items[index - 1]
+                    continue
+                if stream.done:
+                    if stream.error is not None:
+                        raise stream.error
+                    return
+
+                if stream.step is None:
+                    if stream.source is None:
+                        stream.source = stream.fn().__aiter__()
+                    stream.step = asyncio.ensure_future(_anext(stream.source))
+                step = stream.step
+                # shield: a cancelled reader must not cancel the step for the others
+                try:
+                    exhausted, produced = await asyncio.shield(step)
+                    error = None
+                except asyncio.CancelledError:
+                    if not step.cancelled():
+                        raise
+                    exhausted, produced, error = True, None, asyncio.CancelledError()
+                except Exception as e:
+                    exhausted, produced, error = True, None, e
+                # The first reader to see the step's outcome records it
+                if stream.step is step:
+                    stream.step = None
+                    if exhausted:
+                        self._finish(key, stream, error)
+                    else:
+                        stream.items.append(produced)
+        finally:
+            stream.readers -= 1
+            if not stream.readers and not stream.done:
+                self._finish(key, stream)
+                if stream.step is not None:
+                    stream.step.cancel()
+                elif hasattr(stream.source, 'aclose'):
+                    await stream.source.aclose()
+
+    def _finish(self, key: Hashable, stream: _Stream, error: BaseException = None):
+        with self._changed:
+            self._finish_locked(key, stream, error)
+
+    def _finish_locked(self, key: Hashable, stream: _Stream, error: BaseException = None):
+        stream.done = True
+        stream.error = error
+        if self._streams.get(key) is stream:
+            del self._streams[key]
+
+
+async def _anext(source: AsyncIterator) -> Tuple[bool, object]:
+    """Next item of an async iterator as (exhausted, item); StopAsyncIteration cannot be set on a future"""
+    try:
+        return False, await source.__anext__()
+    except StopAsyncIteration:
+        return True, None
@@ -0,0 +1,75 @@
+"""
+Tests for the httpx based async scraping engine
+"""
+import asyncio
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+from scrapers import PORTAL_SCRAPERS, HostLimiter, JobScraper, StepStoneScraper, ascrape_all_portals, scrape_all_portals
+from test_scrape_all import FixtureSession
+
+
+class AsyncNoLimiter:
+    def acquire(self, portal_name, url, cancel=None):
+        return True
+
+    async def aacquire(self, portal_name, url):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_limits(monkeypatch):
+    monkeypatch.setattr(JobScraper, 'rate_limiter', AsyncNoLimiter())
+    monkeypatch.setattr(JobScraper, 'response_cache', None)
+
+
+def fixture_client(session):
+    """AsyncClient answering from a FixtureSession"""
+    def handler(request):
+        response = session.get(str(request.url))
+        return httpx.Response(response.status_code, content=response.content)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_engine_returns_the_jobs_of_the_threaded_engine(monkeypatch):
+    portals = list(PORTAL_SCRAPERS)
+    monkeypatch.setattr(JobScraper, '_session', FixtureSession())
+    expected = scrape_all_portals('developer', 'Berlin', selected_portals=portals, max_pages=3)
+
+    async def main():
+        async with fixture_client(FixtureSession()) as client:
+            return await ascrape_all_portals('developer', 'Berlin', selected_portals=portals, max_pages=3, client=client)
+
+    jobs, debug_summary = asyncio.run(main())
+    assert jobs == expected[0]
+    assert list(debug_summary) == portals
+    assert all(not info['error'] and info['status_code'] == 200 for info in debug_summary.values())
+
+
+def test_async_prefetch_respects_the_host_limit():
+    in_flight = {'now': 0, 'max': 0}
+    requested = []
+
+    async def handler(request):
+        page = int(request.url.params.get('page', '1'))
+        requested.append(page)
+        in_flight['now'] += 1
+        in_flight['max'] = max(in_flight['max'], in_flight['now'])
+        await asyncio.sleep(0.01)
+        in_flight['now'] -= 1
+        cards = (f'<article data-at="job-item"><h2><a href="/job-{page}">Developer {page}</a></h2>'
+                 f'<span data-at="job-item-company-name">ACME</span></article>') if page <= 3 else ''
+        return httpx.Response(200, content=f'<html><body>{cards}</body></html>'.encode())
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await StepStoneScraper().ascrape('developer', 'Berlin', max_pages=10, prefetch=3, client=client,
+                                                    host_limiter=HostLimiter(1))
+
+    jobs, debug_info = asyncio.run(main())
+    assert [job['title'] for job in jobs] == ['Developer 1', 'Developer 2', 'Developer 3']
+    assert urlsplit(jobs[0]['url']).netloc == 'www.stepstone.de'
+    assert in_flight['max'] == 1
+    assert requested[:4] == [1, 2, 3, 4]
@@ -0,0 +1,76 @@
+"""
+Tests for duplicate detection and near-duplicate clustering
+"""
+from dedup import cluster_near_duplicates, deduplicate, fuzzy_key
+
+
+def job(portal, title, company, location='Berlin', summary='', url=None, **fields):
+    return dict(portal=portal, title=title, company=company, location=location, summary=summary,
+                url=url or f'https://{portal}/{title}/{location}'.replace(' ', '-'), **fields)
+
+
+def test_fuzzy_key_ignores_gender_tags_and_legal_forms():
+    assert fuzzy_key(job('a', 'Java Developer (m/w/d)', 'SAP SE')) == fuzzy_key(job('b', 'Java Developer', 'SAP'))
+
+
+def test_deduplicate_portal_policy_keeps_first_per_portal():
+    jobs = [job('a', 'Dev', 'X', url='1'), job('a', 'Dev', 'X', url='2'), job('b', 'Dev', 'X', url='3')]
+    unique, removed = deduplicate(jobs, 'portal')
+    assert [j['url'] for j in unique] == ['1', '3']
+    assert removed == {'a': 1}
+
+
+def test_same_vacancy_on_two_portals_is_merged():
+    jobs = [
+        job('StepStone.de', 'Java Developer (m/w/d)', 'SAP SE', salary='60k'),
+        job('XING Jobs', 'Java Developer', 'SAP', posted_date='2026-10-01'),
+    ]
+    merged, removed = cluster_near_duplicates(jobs)
+    assert len(merged) == 1
+    assert merged[0]['salary'] == '60k' and merged[0]['posted_date'] == '2026-10-01'
+    assert {source['portal'] for source in merged[0]['sources']} == {'StepStone.de', 'XING Jobs'}
+    assert sum(removed.values()) == 1
+
+
+def test_different_levels_are_not_merged():
+    jobs = [job('StepStone.de', 'Senior Java Developer', 'SAP'), job('XING Jobs', 'Junior Java Developer', 'SAP')]
+    assert len(cluster_near_duplicates(jobs)[0]) == 2
+
+
+def test_different_specializations_are_not_merged():
+    jobs = [job('StepStone.de', 'Backend Developer Python', 'Zalando SE'),
+            job('XING Jobs', 'Frontend Developer Python', 'Zalando')]
+    assert len(cluster_near_duplicates(jobs)[0]) == 2
+
+
+def test_different_locations_are_not_merged():
+    jobs = [job('StepStone.de', 'Java Developer', 'SAP', location='Berlin'),
+            job('XING Jobs', 'Java Developer', 'SAP', location='Walldorf')]
+    assert len(cluster_near_duplicates(jobs)[0]) == 2
+
+
+def test_title_only_evidence_needs_high_similarity():
+    # 0.93 shingle similarity: merged on the title alone
+    jobs = [job('StepStone.de', 'Senior Java Software Developer for Cloud', 'SAP'),
+            job('XING Jobs', 'Senior Java Software Developer Cloud', 'SAP')]
+    assert len(cluster_near_duplicates(jobs)[0]) == 1
+    # 0.84: above the general threshold, but without descriptions that is not enough
+    jobs = [job('StepStone.de', 'Software Developer Java EE', 'SAP'), job('XING Jobs', 'Software Developer Java', 'SAP')]
+    assert len(cluster_near_duplicates(jobs)[0]) == 2
+    summary = 'Java EE services for the SAP cloud platform, Spring and Kubernetes'
+    jobs = [job('Indeed.de', 'Software Developer Java EE', 'SAP', summary=summary),
+            job('Monster.de', 'Software Developer Java', 'SAP', summary=summary)]
+    assert len(cluster_near_duplicates(jobs)[0]) == 1
+
+
+def test_descriptions_must_overlap_when_both_exist():
+    jobs = [
+        job('Indeed.de', 'Java Developer', 'SAP', summary='Spring Boot microservices Kubernetes cloud platform'),
+        job('Monster.de', 'Java Developer', 'SAP', summary='Warehouse logistics forklift licence shifts'),
+    ]
+    assert len(cluster_near_duplicates(jobs)[0]) == 2
+
+
+def test_one_job_per_portal_in_a_cluster():
+    jobs = [job('StepStone.de', 'Java Developer', 'SAP', url='1'), job('StepStone.de', 'Java Developer', 'SAP', url='2')]
+    assert len(cluster_near_duplicates(jobs)[0]) == 2
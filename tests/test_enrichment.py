@@ -0,0 +1,63 @@
+"""
+Tests for skill, job level and posting date enrichment
+"""
+from datetime import datetime
+
+from enrichment import enrich_jobs, extract_job_level, extract_skills, parse_posted_date
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+def test_skills_are_found_by_synonym_in_order_of_appearance():
+    assert extract_skills('Erfahrung mit Golang, K8s und Postgres') == ['Go', 'Kubernetes', 'PostgreSQL']
+
+
+def test_lower_case_words_are_not_case_sensitive_skills():
+    assert extract_skills('Wir go ahead mit Google') == []
+    assert extract_skills('C++ und C# Entwicklung') == ['C++', 'C#']
+
+
+def test_german_adjective_forms_of_a_skill_are_found():
+    assert extract_skills('Agiles Team, agiler Entwicklungsprozess') == ['Agile']
+    assert extract_skills('Erfahrung mit agilen Methoden') == ['Agile']
+    assert extract_skills('Agilität') == []
+
+
+def test_job_level_precedence_and_german_compounds():
+    assert extract_job_level('Senior Java Developer') == 'Senior Level'
+    assert extract_job_level('Junior Lead Developer') == 'Entry Level'
+    assert extract_job_level('Praktikantin Marketing') == 'Entry Level'
+    assert extract_job_level('Abteilungsleiter IT') == 'Management'
+    assert extract_job_level('Python Developer', 'Für berufserfahrene Kollegen') == 'Mid Level'
+    assert extract_job_level('Python Developer') == 'Not Specified'
+
+
+def test_relative_and_absolute_dates_are_normalized():
+    assert parse_posted_date('vor 3 Tagen', NOW) == '2026-10-14'
+    assert parse_posted_date('vor einer Woche', NOW) == '2026-10-10'
+    assert parse_posted_date('Gestern', NOW) == '2026-10-16'
+    assert parse_posted_date('Heute', NOW) == '2026-10-17'
+    assert parse_posted_date('2h', NOW) == '2026-10-17'
+    assert parse_posted_date('12.05.26', NOW) == '2026-05-12'
+    assert parse_posted_date('2026-10-01', NOW) == '2026-10-01'
+
+
+def test_unrecognised_dates_are_kept_and_empty_ones_dropped():
+    assert parse_posted_date('  Neu  ', NOW) == 'neu'
+    assert parse_posted_date('', NOW) is None
+
+
+def test_enrich_jobs_fills_only_missing_values():
+    scraped = {'title': 'Senior Developer', 'summary': 'Python und AWS', 'skills': ['Go'], 'job_level': 'Mid Level',
+               'posted_date': 'vor 3 Tagen'}
+    bare = {'title': 'Junior Developer', 'summary': 'Python und AWS', 'posted_date': 'Heute'}
+    placeholder = {'title': 'Senior Python Developer', 'summary': 'See full details on StepStone', 'skills': None}
+
+    assert enrich_jobs([scraped, bare, placeholder]) == [scraped, bare, placeholder]
+
+    assert scraped == {'title': 'Senior Developer', 'summary': 'Python und AWS', 'skills': ['Go'],
+                       'job_level': 'Mid Level', 'posted_date': 'vor 3 Tagen'}
+    assert bare['skills'] == ['Python', 'AWS'] and bare['job_level'] == 'Entry Level'
+    assert bare['posted_date'] == 'Heute'
+    # Nothing is taken from the placeholder summary, the title still gives the level
+    assert placeholder['skills'] == [] and placeholder['job_level'] == 'Senior Level'
@@ -0,0 +1,68 @@
+"""
+Tests for the persistent HTTP response cache
+"""
+import os
+import time
+
+from http_cache import ResponseCache, normalize_url
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b'<html>page</html>', headers=None, url='https://portal.test/jobs?page=1'):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+
+def make_cache(tmp_path, **kwargs):
+    return ResponseCache(path=str(tmp_path / 'http_cache.sqlite3'), ttls={'default': 60}, **kwargs)
+
+
+def test_normalize_url_sorts_query_and_merges_params():
+    assert normalize_url('https://Portal.TEST/jobs?b=2&a=1') == normalize_url('https://portal.test/jobs', {'a': 1, 'b': 2})
+
+
+def test_fresh_page_is_served_from_cache(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.update('P', 'https://portal.test/jobs', {'page': 1}, FakeResponse())
+
+    cached, validators = cache.lookup('P', 'https://portal.test/jobs', {'page': 1})
+    assert cached.content == b'<html>page</html>' and cached.from_cache
+    assert validators == {}
+
+
+def test_only_successful_responses_are_stored(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.update('P', 'https://portal.test/jobs', None, FakeResponse(status_code=500))
+    assert cache.lookup('P', 'https://portal.test/jobs') == (None, {})
+
+
+def test_expired_page_is_revalidated_with_its_etag(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    headers = {'ETag': '"v1"', 'Last-Modified': 'Mon, 12 Oct 2026 08:00:00 GMT'}
+    cache.update('P', 'https://portal.test/jobs', None, FakeResponse(headers=headers))
+
+    later = time.time() + 120
+    monkeypatch.setattr(time, 'time', lambda: later)
+    cached, validators = cache.lookup('P', 'https://portal.test/jobs')
+    assert cached is None
+    assert validators == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 12 Oct 2026 08:00:00 GMT'}
+
+    # 304 Not Modified: the stored page is returned and fresh again
+    response = cache.update('P', 'https://portal.test/jobs', None, FakeResponse(status_code=304, content=b''))
+    assert response.content == b'<html>page</html>'
+    cached, _ = cache.lookup('P', 'https://portal.test/jobs')
+    assert cached is not None
+
+
+def test_least_recently_used_pages_are_evicted(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=2000)
+    pages = [os.urandom(800) for _ in range(4)]  # random bytes do not compress
+    for i, content in enumerate(pages):
+        cache.update('P', f'https://portal.test/jobs/{i}', None, FakeResponse(content=content))
+        time.sleep(0.01)
+
+    assert cache.lookup('P', 'https://portal.test/jobs/0')[0] is None
+    assert cache.lookup('P', 'https://portal.test/jobs/3')[0] is not None
+    assert cache._total_bytes == cache._stored_bytes(cache._connection()) <= 2000
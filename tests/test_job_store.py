@@ -0,0 +1,101 @@
+"""
+Tests for the persistent job store and its full-text search
+"""
+import pytest
+
+import job_store
+from job_store import JobStore, job_fingerprint, job_key
+from scrapers import JobScraper, StepStoneScraper, scrape_all_portals
+from test_prefetch import FakeSession
+from test_streams import NoLimiter
+
+
+def job(title, company='ACME', summary='', url=None, **fields):
+    return dict({'skills': []}, portal='StepStone.de', title=title, company=company, location='Berlin', summary=summary,
+                url=url or f"https://acme.test/{title.replace(' ', '-').lower()}", **fields)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(path=str(tmp_path / 'jobs.sqlite3'))
+
+
+def test_job_key_uses_the_indeed_job_id_and_falls_back_to_a_hash():
+    assert job_key({'portal': 'Indeed.de', 'url': 'https://de.indeed.com/viewjob?jk=abc&from=serp'}) == 'Indeed.de:jk:abc'
+    without_url = {'portal': 'X', 'title': 'Dev', 'company': 'ACME', 'location': 'Berlin'}
+    assert job_key(without_url) == job_key(dict(without_url, title=' dev '))
+
+
+def test_upsert_counts_new_and_changed_jobs(store):
+    developer = job('Python Developer')
+    assert store.upsert_jobs([developer, job('Java Developer')]) == (2, 0)
+    assert store.upsert_jobs([developer]) == (0, 0)
+    assert store.upsert_jobs([dict(developer, salary='60.000 €')]) == (0, 1)
+    assert store.count() == 2
+    assert store.fingerprints([job_key(developer)]) == {job_key(developer): job_fingerprint(dict(developer, salary='60.000 €'))}
+
+
+def test_query_filters_by_skill_and_date(store):
+    store.upsert_jobs([job('Python Developer', skills=['Python'], posted_date='2026-10-10'),
+                       job('Java Developer', skills=['Java'], posted_date='2026-09-01')])
+    assert [found['title'] for found in store.query(skills=['Python'])] == ['Python Developer']
+    assert [found['title'] for found in store.query(posted_since='2026-10-01')] == ['Python Developer']
+
+
+def test_full_text_search_matches_german_word_forms(store):
+    store.upsert_jobs([
+        job('Softwareentwickler Python (m/w/d)'),
+        job('Python Entwicklerin', summary='Backend mit Django'),
+        job('Buchhalter', summary='Kenntnisse in Python von Vorteil'),
+        job('Vertrieb Außendienst'),
+    ])
+
+    found = [result['title'] for result in store.search('Entwicklern Python')]
+    assert found[0] == 'Python Entwicklerin'
+    assert set(found) == {'Python Entwicklerin', 'Softwareentwickler Python (m/w/d)', 'Buchhalter'}
+    assert store.search('(m/w/d)') == []
+
+
+def test_updated_jobs_are_reindexed(store):
+    developer = job('Java Developer')
+    store.upsert_jobs([developer])
+    store.upsert_jobs([dict(developer, title='Kotlin Developer')])
+    assert store.search_keys('Java') == {}
+    assert list(store.search_keys('Kotlin')) == [job_key(developer)]
+
+
+def test_search_keys_within_given_keys_and_limit(store):
+    jobs = [job(f'Python Developer {i}', summary='Python ' * (i + 1)) for i in range(600)]
+    store.upsert_jobs(jobs)
+    keys = [job_key(found) for found in jobs]
+
+    assert len(store.search_keys('Python')) == 600
+    within = store.search_keys('Python', keys=keys[::2])
+    assert set(within) == set(keys[::2])
+    scores = list(within.values())
+    assert scores == sorted(scores, reverse=True)
+    assert list(store.search_keys('Python', limit=5, keys=keys[::2])) == list(within)[:5]
+    assert store.search_keys('Python', keys=[]) == {}
+
+
+def last_seen(store):
+    return dict(store._connection().execute('SELECT job_key, last_seen FROM jobs').fetchall())
+
+
+def test_incremental_crawl_marks_skipped_jobs_as_seen(store, monkeypatch):
+    monkeypatch.setattr(JobScraper, '_session', FakeSession())
+    monkeypatch.setattr(StepStoneScraper, 'rate_limiter', NoLimiter())
+    monkeypatch.setattr(StepStoneScraper, 'response_cache', None)
+
+    monkeypatch.setattr(job_store.time, 'time', lambda: 1000.0)
+    jobs, _ = scrape_all_portals('developer', 'Berlin', selected_portals=['StepStone.de'], max_pages=3,
+                                 store=store, incremental=True)
+    assert len(jobs) == 3 and set(last_seen(store).values()) == {1000.0}
+
+    # The second crawl skips the unchanged jobs but still records seeing them
+    monkeypatch.setattr(job_store.time, 'time', lambda: 2000.0)
+    jobs, debug_info = scrape_all_portals('developer', 'Berlin', selected_portals=['StepStone.de'], max_pages=3,
+                                          store=store, incremental=True)
+    assert jobs == [] and debug_info['StepStone.de']['jobs_skipped'] == 3
+    assert set(last_seen(store).values()) == {2000.0}
+    assert store.touch(['unknown']) == 0
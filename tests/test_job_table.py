@@ -0,0 +1,81 @@
+"""
+Tests for the columnar job table and its facet index
+"""
+from datetime import date, timedelta
+
+import numpy as np
+
+from job_table import JobTable, result_hash
+
+TODAY = date.today()
+
+
+def job(title, company, portal='StepStone.de', skills=(), posted=None, salary='', level=None):
+    return {'title': title, 'company': company, 'location': 'Berlin', 'portal': portal, 'skills': list(skills),
+            'posted_date': posted, 'salary': salary, 'job_level': level, 'url': f'https://jobs.test/{title}'}
+
+
+JOBS = [
+    job('Python Developer', 'ACME', skills=['Python', 'Docker'], posted=TODAY.isoformat(), salary='60k'),
+    job('Java Developer', 'Initech', portal='XING Jobs', skills=['Java'], posted=(TODAY - timedelta(days=3)).isoformat()),
+    job('Data Engineer', 'ACME', skills=['Python', 'SQL'], posted='vor kurzem', level='Senior Level'),
+    job('Tester', 'N/A', portal='XING Jobs', posted=(TODAY - timedelta(days=60)).isoformat()),
+]
+
+
+def test_result_hash_depends_on_content_only():
+    assert result_hash(JOBS) == result_hash([dict(item) for item in JOBS])
+    assert result_hash(JOBS) != result_hash(JOBS[:2])
+
+
+def test_options_skip_unknown_companies():
+    table = JobTable(JOBS)
+    assert table.options('company') == ['ACME', 'Initech']
+    assert table.options('skills') == ['Docker', 'Java', 'Python', 'SQL']
+    assert table.options('job_level') == ['Not Specified', 'Senior Level']
+
+
+def test_mask_combines_filters():
+    table = JobTable(JOBS)
+    assert table.mask(companies=['ACME'], skills=['Python']).tolist() == [True, False, True, False]
+    assert table.mask(portals=['XING Jobs'], posted_within_days=7).tolist() == [False, True, False, False]
+    assert table.mask(has_salary=True).tolist() == [True, False, False, False]
+    within = np.array([False, True, True, True])
+    assert table.mask(companies=['ACME'], within=within).tolist() == [False, False, True, False]
+
+
+def test_facet_counts_ignore_the_facets_own_selection():
+    table = JobTable(JOBS)
+    counts = table.facet_counts('company', companies=['Initech'], skills=['Python'])
+    assert counts == {'ACME': 2, 'Initech': 0, 'N/A': 0}
+    assert table.facet_counts('skills', portals=['StepStone.de']) == {'Docker': 1, 'Java': 0, 'Python': 2, 'SQL': 1}
+
+
+def test_select_orders_by_score_and_keeps_ties_stable():
+    table = JobTable(JOBS)
+    scores = np.array([1.0, 3.0, 1.0, np.nan])
+    selected = table.select(np.array([True, True, True, False]), scores)
+    assert [item['title'] for item in selected] == ['Java Developer', 'Python Developer', 'Data Engineer']
+    assert table.relevance({table.keys[2]: 5.0})[2] == 5.0
+    assert np.isnan(table.relevance({})).all()
+
+
+def test_text_relevance_matches_jobs_the_store_does_not_know():
+    table = JobTable(JOBS)
+    # Only the Java developer is in the store; the Python developer is matched in memory
+    relevance = table.text_relevance('Entwickler Developer', {table.keys[1]: 7.5})
+    assert relevance[1] == 7.5
+    assert relevance[0] == 0.5
+    assert np.isnan(relevance[2]) and np.isnan(relevance[3])
+    assert table.text_relevance('ACME')[[0, 2]].tolist() == [1.0, 1.0]
+    assert np.isnan(table.text_relevance('')).all()
+
+
+def test_posted_labels_follow_the_current_day():
+    table = JobTable(JOBS)
+    assert table.display(TODAY)['posted'].tolist() == ['Today', '3 days ago', 'vor kurzem', JOBS[3]['posted_date']]
+
+    tomorrow = table.display(TODAY + timedelta(days=1))
+    assert tomorrow['posted'].tolist()[:2] == ['Yesterday', '4 days ago']
+    assert table.display(TODAY + timedelta(days=1)) is tomorrow
+    assert tomorrow['title'].tolist() == [item['title'] for item in JOBS]
@@ -0,0 +1,21 @@
+"""
+Tests for the selector backends
+"""
+import pytest
+
+from enrichment import extract_skills
+from parsing import Sel, first_text, get_backend
+
+CARD = '<div class="card"><ul class="summary"><li>Python, Django und AWS</li><li>Agiles Team</li></ul></div>'
+
+
+@pytest.mark.parametrize('backend', ['bs4', 'lxml'])
+def test_summary_text_keeps_words_of_separate_elements_apart(backend):
+    dom = get_backend(backend)
+    root = dom.parse(CARD)
+    summary = first_text(dom, root, [Sel('ul', 'summary')], separator=' ')
+
+    assert summary == 'Python, Django und AWS Agiles Team'
+    assert extract_skills(summary) == ['Python', 'Django', 'AWS', 'Agile']
+    # Titles and other short fields keep the original joining
+    assert first_text(dom, root, [Sel('ul', 'summary')]) == 'Python, Django und AWSAgiles Team'
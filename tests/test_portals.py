@@ -0,0 +1,78 @@
+"""
+Tests for the portal specs and the card extraction of the scrapers
+"""
+import json
+import os
+
+import pytest
+
+from scrapers import (ArbeitsagenturScraper, IndeedDeScraper, LinkedInScraper, MonsterDeScraper, StepStoneScraper,
+                      XingJobsScraper)
+
+BACKENDS = ['bs4', 'lxml']
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+# Fixture page -> scraper; baseline_jobs.json holds what the original
+# hand-written scrapers returned for each page (skills sorted, as their
+# order was arbitrary)
+PORTAL_FIXTURES = {
+    'indeed': IndeedDeScraper,
+    'stepstone': StepStoneScraper,
+    'xing': XingJobsScraper,
+    'monster': MonsterDeScraper,
+    'arbeitsagentur': ArbeitsagenturScraper,
+    'linkedin': LinkedInScraper,
+}
+
+
+def parse_cards(scraper_class, html, backend, location='Berlin'):
+    """Jobs of one result page, parsed with the given backend"""
+    scraper = scraper_class()
+    scraper.parser_backend = backend
+    scraper._start_run()
+    jobs = []
+    scraper._parse_page(scraper.dom.parse(html), scraper.first_page, location, jobs)
+    return jobs
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_stepstone_url_is_the_first_link_of_the_card(backend):
+    html = ('<article data-at="job-item"><a href="/cmp/acme">ACME Logo</a>'
+            '<h2><a href="/stellenangebote--dev.html">Developer</a></h2></article>')
+    [job] = parse_cards(StepStoneScraper, html, backend)
+    assert job['title'] == 'Developer'
+    assert job['url'] == 'https://www.stepstone.de/cmp/acme'
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_monster_url_of_a_plain_title_is_the_first_link_of_the_card(backend):
+    html = ('<div class="job-card"><a href="/firma/acme">ACME</a><h2>Developer <a href="/job/1">Details</a></h2>'
+            '</div>')
+    [job] = parse_cards(MonsterDeScraper, html, backend)
+    assert job['url'] == 'https://www.monster.de/firma/acme'
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_xing_skills_come_from_title_and_company_only(backend):
+    html = ('<div data-xds="JobTeaser"><h3><a href="/jobs/1">Python Developer</a></h3>'
+            '<span class="company">Docker GmbH</span></div>')
+    [job] = parse_cards(XingJobsScraper, html, backend, location='AWS Region')
+    assert job['url'] == 'https://www.xing.com/jobs/1'
+    assert job['location'] == 'AWS Region'
+    assert job['skills'] == ['Python', 'Docker']
+    assert job['summary'] == 'Full details available on XING'
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('page', sorted(PORTAL_FIXTURES))
+def test_specs_return_the_jobs_of_the_original_scrapers(page, backend):
+    with open(os.path.join(FIXTURES, 'baseline_jobs.json'), encoding='utf-8') as f:
+        expected = json.load(f)[page]
+    if page == 'linkedin':
+        # The original LinkedIn scraper did not read posting dates
+        for job, posted_date in zip(expected, ['2026-10-10', None, None]):
+            job['posted_date'] = posted_date
+    with open(os.path.join(FIXTURES, f'{page}.html'), 'rb') as f:
+        html = f.read()
+
+    jobs = parse_cards(PORTAL_FIXTURES[page], html, backend)
+    assert [dict(job, skills=sorted(job['skills'])) for job in jobs] == expected
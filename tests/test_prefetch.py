@@ -0,0 +1,119 @@
+"""
+Tests for the sliding-window page prefetch of the scrapers
+"""
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from rate_limit import RateLimiter, TokenBucket
+from scrapers import JobScraper, StepStoneScraper
+
+
+class SpacedLimiter:
+    """Rate limiter letting one request through every `interval` seconds"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, portal_name, url, cancel=None):
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic()) + self.interval
+            slot = self.next_slot
+        time.sleep(slot - time.monotonic())
+        return True
+
+
+class CountingBucket(TokenBucket):
+    """Token bucket counting the tokens taken and given back"""
+
+    def __init__(self, rate, burst=1):
+        super().__init__(rate, burst)
+        self.reserved = self.released = 0
+
+    def reserve(self):
+        self.reserved += 1
+        return super().reserve()
+
+    def release(self):
+        self.released += 1
+        super().release()
+
+
+class CountingLimiter(RateLimiter):
+    """RateLimiter with a single CountingBucket for every host"""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.bucket = CountingBucket(rate)
+
+    def _bucket(self, portal_name, url):
+        return self.bucket
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, url, content):
+        self.url = url
+        self.content = content
+        self.text = content.decode()
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves one page of StepStone cards, then empty pages"""
+
+    def __init__(self):
+        self.pages = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        page = int((params or {}).get('page') or parse_qs(urlsplit(url).query).get('page', ['1'])[0])
+        with self.lock:
+            self.pages.append(page)
+        cards = ''.join(
+            f'<article data-at="job-item"><h2><a href="/stellenangebote--{page}-{i}.html">Developer {page}-{i}</a></h2>'
+            f'<span data-at="job-item-company-name">Firma {i}</span></article>'
+            for i in range(3)
+        ) if page == 1 else ''
+        return FakeResponse(url, f'<html><body>{cards}</body></html>'.encode())
+
+
+def test_prefetch_stops_fetching_after_the_last_page(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(JobScraper, '_session', session)
+
+    class Scraper(StepStoneScraper):
+        rate_limiter = SpacedLimiter(0.1)
+        response_cache = None
+
+    jobs, _ = Scraper().scrape('developer', 'Berlin', max_pages=10, prefetch=3)
+    assert len(jobs) == 3
+
+    # Page 2 is empty: the prefetches of pages 3 and 4 were waiting for the
+    # rate limiter and must not be sent once the scrape has returned
+    time.sleep(0.6)
+    assert sorted(session.pages) == [1, 2]
+
+
+def test_cancelled_prefetches_give_back_their_rate_limit_tokens(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(JobScraper, '_session', session)
+    limiter = CountingLimiter(rate=10)
+
+    class Scraper(StepStoneScraper):
+        rate_limiter = limiter
+        response_cache = None
+
+    Scraper().scrape('developer', 'Berlin', max_pages=10, prefetch=3)
+    time.sleep(0.5)
+
+    # Only the two pages requested hold a token; the waiting prefetches of
+    # pages 3 and 4 returned theirs when the empty page 2 stopped the scrape
+    assert sorted(session.pages) == [1, 2]
+    assert limiter.bucket.reserved - limiter.bucket.released == 2
@@ -0,0 +1,64 @@
+"""
+Tests for the Quick Search pre-warming scheduler
+"""
+import threading
+import time
+
+import result_cache
+from http_cache import PORTAL_CACHE_TTLS
+from prewarm import DEFAULT_PORTALS, PREWARM_INTERVAL, QUICK_SEARCHES, Prewarmer
+from result_cache import RESULT_TTL, SearchResultCache
+
+
+class FakeQueue:
+    def __init__(self, expected: int):
+        self.submitted = []
+        self.done = threading.Event()
+        self.expected = expected
+        self.cache = SearchResultCache()
+
+    def submit(self, keywords, location, job_type, portals, max_pages, **options):
+        self.submitted.append((keywords, options))
+        if len(self.submitted) >= self.expected:
+            self.done.set()
+
+
+def test_default_interval_outlasts_the_response_cache():
+    for portal in DEFAULT_PORTALS:
+        assert PREWARM_INTERVAL > PORTAL_CACHE_TTLS.get(portal, PORTAL_CACHE_TTLS['default'])
+
+
+def test_searches_are_submitted_in_turn_as_refreshes():
+    queue = FakeQueue(expected=3)
+    prewarmer = Prewarmer(['a', 'b'], interval=0.02, search_queue=queue)
+    assert prewarmer.start()
+    assert queue.done.wait(5)
+    prewarmer.stop()
+
+    assert [keywords for keywords, _ in queue.submitted[:3]] == ['a', 'b', 'a']
+    assert all(options['refresh'] for _, options in queue.submitted)
+
+
+def test_zero_interval_disables_prewarming():
+    assert not Prewarmer(['a'], interval=0, search_queue=FakeQueue(expected=1)).start()
+
+
+def test_quick_searches_stay_fresh_until_the_next_round(monkeypatch):
+    queue = FakeQueue(expected=1)
+    prewarmer = Prewarmer(list(QUICK_SEARCHES.values()), search_queue=queue)
+    key = prewarmer.keys()[0]
+    queue.cache.set(key, [{'title': 'Software Engineer'}], {'StepStone.de': {}})
+    stored_at = time.time()
+
+    def refresh():
+        raise AssertionError('fresh entries are not refreshed')
+
+    assert prewarmer.start()
+    prewarmer._stopped.set()  # keep the schedule registered without submitting more searches
+    monkeypatch.setattr(result_cache.time, 'time', lambda: stored_at + PREWARM_INTERVAL - 1)
+    assert PREWARM_INTERVAL > RESULT_TTL
+    assert queue.cache.get_or_compute(key, refresh)[0] == [{'title': 'Software Engineer'}]
+
+    # Without the scheduler the regular TTL applies again
+    prewarmer.stop()
+    assert queue.cache.ttl_for(key) == RESULT_TTL
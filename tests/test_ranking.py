@@ -0,0 +1,64 @@
+"""
+Tests for relevance ranking and top-k selection
+"""
+from datetime import date, timedelta
+
+import numpy as np
+
+from job_table import JobTable
+from ranking import relevance_scores, top_k
+
+
+def full_sort(scores, mask, k):
+    rows = np.flatnonzero(mask)
+    return rows[np.argsort(-scores[rows], kind='stable')][:k]
+
+
+def test_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 5, size=200).astype(float)  # many ties
+    mask = rng.random(200) < 0.7
+    for k in (1, 10, 50, 139, 500):
+        assert top_k(scores, mask, k).tolist() == full_sort(scores, mask, k).tolist()
+
+
+def test_top_k_pages_do_not_overlap():
+    scores = np.array([1.0, 2.0, 2.0, 2.0, 1.0, 3.0, 2.0])
+    mask = np.ones(len(scores), dtype=bool)
+    first = top_k(scores, mask, 3).tolist()
+    second = top_k(scores, mask, 6).tolist()[3:]
+    assert first == [5, 1, 2]
+    assert not set(first) & set(second)
+
+
+def test_top_k_of_zero_is_empty():
+    scores = np.array([1.0, 2.0, 3.0])
+    mask = np.ones(3, dtype=bool)
+    assert top_k(scores, mask, 0).tolist() == []
+    assert top_k(scores, mask, -1).tolist() == []
+    assert top_k(scores, np.zeros(3, dtype=bool), 5).tolist() == []
+
+
+def test_relevance_prefers_title_matches_and_recent_postings():
+    today = date.today()
+    jobs = [
+        {'title': 'Buchhalter', 'summary': 'Python', 'posted_date': today.isoformat(), 'url': 'a'},
+        {'title': 'Python Entwicklerin', 'summary': '', 'posted_date': today.isoformat(), 'url': 'b'},
+        {'title': 'Python Entwickler', 'summary': '', 'posted_date': (today - timedelta(days=60)).isoformat(), 'url': 'c'},
+        {'title': 'Python Entwickler', 'summary': '', 'posted_date': 'vor kurzem', 'url': 'd'},
+    ]
+    scores = relevance_scores(JobTable(jobs), 'Python Entwickler')
+    assert scores[1] > scores[2] > scores[3] > scores[0]
+    assert relevance_scores(JobTable([]), 'Python').tolist() == []
+
+
+def test_partial_weights_override_only_their_signals():
+    today = date.today()
+    jobs = [
+        {'title': 'Python Entwickler', 'summary': '', 'posted_date': (today - timedelta(days=60)).isoformat(), 'url': 'a'},
+        {'title': 'Buchhalter', 'summary': '', 'posted_date': today.isoformat(), 'url': 'b'},
+    ]
+    table = JobTable(jobs)
+    assert relevance_scores(table, 'Python', {'recency': 0})[1] == 0
+    scores = relevance_scores(table, 'Python', {'recency': 10})
+    assert scores[1] > scores[0] > 0
@@ -0,0 +1,98 @@
+"""
+Tests for the per-host token bucket rate limiter
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import rate_limit
+from rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock and is recorded"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def asleep(self, seconds):
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', clock)
+    monkeypatch.setattr(rate_limit, 'asyncio', SimpleNamespace(sleep=clock.asleep))
+    return clock
+
+
+def test_bucket_allows_a_burst_then_spaces_requests(clock):
+    bucket = TokenBucket(rate=0.5, burst=3)
+    assert [bucket.reserve() for _ in range(5)] == [0.0, 0.0, 0.0, 2.0, 4.0]
+
+    # Tokens refill at `rate` but never beyond the burst
+    clock.now += 100
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 2.0]
+
+
+def test_acquire_sleeps_until_the_hosts_next_token(clock):
+    limiter = RateLimiter({'default': (0.5, 2), 'LinkedIn': (0.25, 1)})
+    for _ in range(4):
+        assert limiter.acquire('StepStone.de', 'https://www.stepstone.de/jobs?page=1')
+    assert clock.sleeps == [2.0, 2.0]
+
+    # Other hosts and portals have buckets of their own
+    limiter.acquire('StepStone.de', 'https://api.stepstone.de/jobs')
+    limiter.acquire('LinkedIn', 'https://www.linkedin.com/jobs')
+    limiter.acquire('LinkedIn', 'https://www.linkedin.com/jobs')
+    assert clock.sleeps == [2.0, 2.0, 4.0]
+
+
+def test_configure_applies_a_new_rate_immediately(clock):
+    limiter = RateLimiter({'default': (0.5, 1)})
+    limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs')
+    limiter.configure('Indeed.de', 10.0, 1)
+    limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs')
+    limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs')
+    assert clock.sleeps == [0.1]
+
+
+def test_cancelled_acquire_gives_its_token_back(clock):
+    class SetWhileWaiting(threading.Event):
+        def wait(self, timeout=None):
+            self.set()
+            return True
+
+    limiter = RateLimiter({'default': (0.5, 1)})
+    assert limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs')
+    assert not limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs', SetWhileWaiting())
+    cancelled = threading.Event()
+    cancelled.set()
+    assert not limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs', cancelled)
+
+    # Only the first request holds a token, so the next one waits for a single refill
+    assert limiter.acquire('Indeed.de', 'https://de.indeed.com/jobs')
+    assert clock.sleeps == [2.0]
+
+
+def test_async_acquire_shares_the_buckets(clock):
+    limiter = RateLimiter({'default': (1.0, 1)})
+
+    async def main():
+        await limiter.aacquire('XING Jobs', 'https://www.xing.com/jobs')
+        await limiter.aacquire('XING Jobs', 'https://www.xing.com/jobs')
+
+    asyncio.run(main())
+    limiter.acquire('XING Jobs', 'https://www.xing.com/jobs')
+    assert clock.sleeps == [1.0, 1.0]
@@ -0,0 +1,98 @@
+"""
+Tests for the search result cache and live searches
+"""
+import threading
+import time
+
+from result_cache import LiveSearch, SearchResultCache, search_key
+
+DEBUG_OK = {'StepStone.de': {'pages_scraped': 1, 'jobs_found': 1, 'error': ''}}
+JOBS = [{'title': 'Python Developer', 'company': 'ACME', 'url': 'https://acme.test/1'}]
+
+
+class FailingCache(SearchResultCache):
+    """Cache whose hits blow up when they are read"""
+
+    def get_or_compute(self, key, compute):
+        raise RuntimeError('cache backend gone')
+
+
+def test_search_key_ignores_case_and_whitespace():
+    assert search_key('Python  Developer', 'berlin') == search_key('python developer', ' Berlin ')
+    assert search_key('python', 'berlin', max_pages=1) != search_key('python', 'berlin', max_pages=2)
+
+
+def test_entries_are_bounded_and_persisted(tmp_path):
+    path = str(tmp_path / 'results.sqlite3')
+    cache = SearchResultCache(max_entries=2, path=path)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, JOBS, DEBUG_OK)
+    assert cache.get('a') is None
+    assert cache.get('c')[1] == JOBS
+
+    reopened = SearchResultCache(path=path)
+    assert reopened.get('b')[2] == DEBUG_OK
+
+
+def test_concurrent_misses_compute_once():
+    cache = SearchResultCache()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return JOBS, DEBUG_OK
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [(JOBS, DEBUG_OK)] * 4
+
+
+def test_stale_entry_is_returned_and_refreshed_in_background():
+    cache = SearchResultCache(ttl=0, stale_ttl=60)
+    cache.set('k', JOBS, DEBUG_OK)
+    refreshed = threading.Event()
+
+    def compute():
+        refreshed.set()
+        return [], DEBUG_OK
+
+    assert cache.get_or_compute('k', compute) == (JOBS, DEBUG_OK)
+    assert refreshed.wait(5)
+
+
+def test_failed_searches_are_not_cached():
+    cache = SearchResultCache()
+    cache.get_or_compute('k', lambda: ([], {'StepStone.de': {'error': 'timeout'}}))
+    assert cache.get('k') is None
+
+
+def test_live_search_is_served_from_the_cache():
+    cache = SearchResultCache()
+    search = LiveSearch('python', 'Berlin', cache=cache)
+    cache.set(search.key, JOBS, DEBUG_OK)
+
+    search.start()
+    assert not search.running
+    jobs, debug_summary, progress = search.snapshot()
+    assert jobs == JOBS and debug_summary == DEBUG_OK
+    assert progress == {'StepStone.de': {'pages': 1, 'jobs': 1, 'done': True}}
+
+
+def test_live_search_finishes_when_the_cache_fails():
+    cache = FailingCache()
+    search = LiveSearch('python', 'Berlin', cache=cache)
+    cache.set(search.key, JOBS, DEBUG_OK)
+
+    search.run()
+    assert search.wait(0)
+    assert search.error == 'cache backend gone'
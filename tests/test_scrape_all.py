@@ -0,0 +1,96 @@
+"""
+Tests for scraping several portals at once
+"""
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+from scrapers import PORTAL_SCRAPERS, JobScraper, scrape_all_portals
+from test_portals import FIXTURES
+from test_prefetch import FakeResponse
+from test_streams import NoLimiter
+
+# Host -> fixture page served as the first result page
+HOST_FIXTURES = {
+    'de.indeed.com': 'indeed',
+    'www.stepstone.de': 'stepstone',
+    'www.xing.com': 'xing',
+    'www.monster.de': 'monster',
+    'www.arbeitsagentur.de': 'arbeitsagentur',
+}
+# Host -> seconds a response takes; the first portals answer last
+HOST_DELAYS = {'de.indeed.com': 0.3, 'www.stepstone.de': 0.2, 'www.xing.com': 0.1}
+
+
+class FixtureSession:
+    """Serves the first request to every host from its page, later ones with an empty page"""
+
+    def __init__(self, pages=None):
+        self.pages = pages or {}
+        self.served = set()
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        host = urlsplit(url).netloc
+        with self.lock:
+            first = host not in self.served
+            self.served.add(host)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(HOST_DELAYS.get(host, 0) if first else 0)
+            return FakeResponse(url, self.page(host) if first else b'<html><body></body></html>')
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def page(self, host):
+        if host in self.pages:
+            return self.pages[host].encode()
+        with open(os.path.join(FIXTURES, f'{HOST_FIXTURES[host]}.html'), 'rb') as f:
+            return f.read()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = FixtureSession()
+    monkeypatch.setattr(JobScraper, '_session', session)
+    monkeypatch.setattr(JobScraper, 'rate_limiter', NoLimiter())
+    monkeypatch.setattr(JobScraper, 'response_cache', None)
+    return session
+
+
+def test_parallel_results_keep_the_portal_order(session):
+    portals = list(PORTAL_SCRAPERS)
+    jobs, debug_summary = scrape_all_portals('developer', 'Berlin', selected_portals=portals, max_pages=3,
+                                             max_workers=len(portals))
+    assert session.max_in_flight > 1
+
+    # Portals answering last still come first, as in a sequential run
+    assert list(debug_summary) == portals
+    assert [job['portal'] for job in jobs] == sorted((job['portal'] for job in jobs), key=portals.index)
+    assert [debug_summary[portal]['jobs_found'] for portal in portals] == [3, 3, 3, 3, 3]
+
+    session.served.clear()
+    session.max_in_flight = 0
+    sequential, _ = scrape_all_portals('developer', 'Berlin', selected_portals=portals, max_pages=3, max_workers=1)
+    assert session.max_in_flight == 1
+    assert jobs == sequential
+
+
+def test_parallel_results_are_deduplicated_across_portals(session):
+    card = '<article data-at="job-item"><h2><a href="/job-1">Python Developer</a></h2>' \
+           '<span data-at="job-item-company-name">ACME</span></article>'
+    teaser = '<div data-xds="JobTeaser"><h3><a href="/jobs/1">Python Developer</a></h3>' \
+             '<span class="company">ACME</span></div>'
+    session.pages = {'www.stepstone.de': f'<html><body>{card}</body></html>',
+                     'www.xing.com': f'<html><body>{teaser}</body></html>'}
+
+    jobs, debug_summary = scrape_all_portals('developer', 'Berlin', selected_portals=['StepStone.de', 'XING Jobs'],
+                                             max_pages=3, max_workers=2, dedup='global')
+    assert [job['portal'] for job in jobs] == ['StepStone.de']
+    assert debug_summary['XING Jobs']['duplicates_merged'] == 1
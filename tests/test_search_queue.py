@@ -0,0 +1,64 @@
+"""
+Tests for the persistent search queue
+"""
+import time
+
+from result_cache import SearchResultCache, search_key
+from search_queue import SearchQueue
+
+DEBUG_OK = {'StepStone.de': {'pages_scraped': 1, 'jobs_found': 1, 'error': ''}}
+JOBS = [{'title': 'Python Developer', 'company': 'ACME', 'url': 'https://acme.test/1'}]
+
+
+class FailingCache(SearchResultCache):
+    def get_or_compute(self, key, compute):
+        raise RuntimeError('cache backend gone')
+
+
+def wait_finished(queue: SearchQueue, search_id: str, timeout: float = 10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = queue.status(search_id)
+        if status['status'] in ('done', 'failed'):
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"search {search_id} still {status['status']}")
+
+
+def make_queue(tmp_path, cache):
+    return SearchQueue(path=str(tmp_path / 'queue.sqlite3'), workers=1, store=None, cache=cache)
+
+
+def test_cached_search_completes_with_its_results(tmp_path):
+    cache = SearchResultCache()
+    cache.set(search_key('python', 'Berlin', '', ['StepStone.de'], 1, 'portal'), JOBS, DEBUG_OK)
+    queue = make_queue(tmp_path, cache)
+    try:
+        search_id = queue.submit('python', 'Berlin', '', ['StepStone.de'], 1)
+        status = wait_finished(queue, search_id)
+    finally:
+        queue.stop()
+
+    assert status['status'] == 'done'
+    assert status['jobs'] == JOBS and status['debug_info'] == DEBUG_OK
+
+
+def test_identical_queued_searches_share_an_id(tmp_path):
+    queue = make_queue(tmp_path, SearchResultCache())
+    queue._start_workers = lambda: None  # keep both submissions queued
+    first = queue.submit('Python ', 'berlin', '', ['StepStone.de'], 1)
+    assert queue.submit('python', 'Berlin', '', ['StepStone.de'], 1) == first
+    assert queue.submit('java', 'Berlin', '', ['StepStone.de'], 1) != first
+
+
+def test_search_failing_in_the_cache_is_marked_failed(tmp_path):
+    cache = FailingCache()
+    cache.set(search_key('python', 'Berlin', '', ['StepStone.de'], 1, 'portal'), JOBS, DEBUG_OK)
+    queue = make_queue(tmp_path, cache)
+    try:
+        status = wait_finished(queue, queue.submit('python', 'Berlin', '', ['StepStone.de'], 1))
+    finally:
+        queue.stop()
+
+    assert status['status'] == 'failed'
+    assert status['error'] == 'cache backend gone'
@@ -0,0 +1,78 @@
+"""
+Tests for the pooled HTTP session shared by the scrapers
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from scrapers import MAX_RETRIES, POOL_CONNECTIONS, POOL_MAXSIZE, JobScraper, create_session
+
+
+def test_session_mounts_a_pooled_retry_adapter():
+    session = create_session()
+    for prefix in ('https://', 'http://'):
+        adapter = session.get_adapter(prefix + 'www.stepstone.de')
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == POOL_CONNECTIONS
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+
+    retry = session.get_adapter('https://www.stepstone.de').max_retries
+    assert retry.total == MAX_RETRIES
+    assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+    assert retry.allowed_methods == frozenset(['GET', 'HEAD'])
+    assert retry.respect_retry_after_header and not retry.raise_on_status
+
+
+def test_configure_session_replaces_the_shared_session(monkeypatch):
+    monkeypatch.setattr(JobScraper, '_session', None)
+    shared = JobScraper.get_session()
+    assert JobScraper.get_session() is shared
+
+    JobScraper.configure_session(pool_maxsize=20, max_retries=5)
+    session = JobScraper.get_session()
+    assert session is not shared
+    assert session.get_adapter('https://de.indeed.com')._pool_maxsize == 20
+    assert session.get_adapter('https://de.indeed.com').max_retries.total == 5
+
+
+@pytest.fixture
+def server():
+    """Local server answering 503 (Retry-After: 0) to the first `failures` requests, then 200"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.hits += 1
+            failed = server.hits <= server.failures
+            self.send_response(503 if failed else 200)
+            if failed:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.hits = server.failures = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_unavailable_responses_are_retried(server):
+    server.failures = 2
+    url = f'http://127.0.0.1:{server.server_port}/jobs'
+    response = create_session(max_retries=3).get(url, timeout=5)
+    assert response.status_code == 200
+    assert server.hits == 3
+
+
+def test_last_response_is_returned_once_retries_are_exhausted(server):
+    server.failures = 10
+    url = f'http://127.0.0.1:{server.server_port}/jobs'
+    response = create_session(max_retries=1).get(url, timeout=5)
+    assert response.status_code == 503
+    assert server.hits == 2
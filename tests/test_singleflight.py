@@ -0,0 +1,169 @@
+"""
+Tests for coalescing identical concurrent calls and iterations
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight, StreamFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 42
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do('k', fn)))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(flight.do('k', fn)))
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert calls == [1]
+    assert sorted(results) == [(42, False), (42, True)]
+    assert flight.do('k', lambda: 7) == (7, False)  # not a cache
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do('k', lambda: int('x'))
+
+
+def test_cancelled_async_leader_does_not_cancel_the_waiters():
+    flight = SingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'result'
+
+    async def main():
+        leader = asyncio.ensure_future(flight.ado('k', fn))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.ado('k', fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(main()) == ('result', True)
+    assert calls == [1]
+
+
+def counting_source(produced, count=5):
+    def source():
+        for i in range(count):
+            produced.append(i)
+            yield i
+    return source
+
+
+def test_late_iteration_replays_and_follows_the_running_one():
+    flight = StreamFlight()
+    produced = []
+    first = flight.iterate('k', counting_source(produced))
+    assert [next(first), next(first)] == [0, 1]
+
+    second = flight.iterate('k', counting_source(produced))
+    assert list(second) == [0, 1, 2, 3, 4]
+    assert list(first) == [2, 3, 4]
+    assert produced == [0, 1, 2, 3, 4]
+
+
+def test_first_reader_stopping_early_does_not_truncate_the_others():
+    flight = StreamFlight()
+    produced = []
+    first = flight.iterate('k', counting_source(produced))
+    second = flight.iterate('k', counting_source(produced))
+    assert next(first) == 0
+    assert next(second) == 0
+    first.close()
+
+    assert list(second) == [1, 2, 3, 4]
+    assert produced == [0, 1, 2, 3, 4]
+
+
+def test_source_is_closed_when_every_reader_left():
+    flight = StreamFlight()
+    closed = []
+
+    def source():
+        try:
+            yield from range(10)
+        finally:
+            closed.append(True)
+
+    iteration = flight.iterate('k', source)
+    next(iteration)
+    iteration.close()
+    assert closed == [True]
+    assert list(flight.iterate('k', lambda: iter([1]))) == [1]  # key forgotten
+
+
+def test_threads_share_an_iteration():
+    flight = StreamFlight()
+    produced = []
+    gate = threading.Event()
+
+    def source():
+        for i in range(20):
+            gate.wait(5)
+            produced.append(i)
+            yield i
+
+    results = [None, None]
+
+    def read(slot):
+        results[slot] = list(flight.iterate('k', source))
+
+    threads = [threading.Thread(target=read, args=(slot,)) for slot in range(2)]
+    for thread in threads:
+        thread.start()
+    # Release the source once both readers have joined (on their first next())
+    deadline = time.monotonic() + 5
+    while (flight._streams.get('k') is None or flight._streams['k'].readers < 2) and time.monotonic() < deadline:
+        time.sleep(0.001)
+    gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [list(range(20))] * 2
+    assert produced == list(range(20))
+
+
+def test_async_iteration_survives_a_cancelled_reader():
+    flight = StreamFlight()
+    produced = []
+
+    async def source():
+        for i in range(5):
+            await asyncio.sleep(0.01)
+            produced.append(i)
+            yield i
+
+    async def read():
+        return [item async for item in flight.aiterate('k', source)]
+
+    async def main():
+        first = asyncio.ensure_future(read())
+        await asyncio.sleep(0.025)
+        second = asyncio.ensure_future(read())
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+    assert produced == [0, 1, 2, 3, 4]
@@ -0,0 +1,57 @@
+"""
+Tests for streaming searches over several portals
+"""
+import threading
+import time
+
+import scrapers
+from scrapers import JobScraper, StepStoneScraper, stream_all_portals
+from test_prefetch import FakeSession
+
+
+class NoLimiter:
+    def acquire(self, portal_name, url, cancel=None):
+        return True
+
+
+class GatedSession(FakeSession):
+    """FakeSession holding every request until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def get(self, url, params=None, **kwargs):
+        self.release.wait(5)
+        return super().get(url, params, **kwargs)
+
+
+def test_identical_concurrent_streams_share_the_portal_scrape(monkeypatch):
+    session = GatedSession()
+    monkeypatch.setattr(JobScraper, '_session', session)
+
+    class Scraper(StepStoneScraper):
+        rate_limiter = NoLimiter()
+        response_cache = None
+
+    monkeypatch.setitem(scrapers.PORTAL_SCRAPERS, 'StepStone.de', Scraper)
+
+    results = [None, None]
+
+    def search(slot):
+        events = list(stream_all_portals('developer', 'Berlin', '', ['StepStone.de'], max_pages=5))
+        results[slot] = [job for event in events if event['event'] == 'page' for job in event['jobs']], events[-1]
+
+    threads = [threading.Thread(target=search, args=(slot,)) for slot in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    session.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    (first_jobs, first_done), (second_jobs, second_done) = results
+    assert len(first_jobs) == 3 and first_jobs == second_jobs
+    assert first_done['debug_info'] == second_done['debug_info']
+    assert first_done['debug_info']['StepStone.de'] is not second_done['debug_info']['StepStone.de']
+    assert sorted(session.pages) == [1, 2]
@@ -0,0 +1,31 @@
+"""
+Tests for tokenizing and German stemming
+"""
+from text_search import TermIndex, fts_query, german_stem, tokenize
+
+
+def test_inflections_share_a_stem():
+    stems = {german_stem(word) for word in ('entwickler', 'entwicklers', 'entwicklern', 'entwicklerin', 'entwicklerinnen')}
+    assert len(stems) == 1
+    assert german_stem('ingenieurin') == german_stem('ingenieur')
+    assert german_stem('führung') == german_stem('fuhrung')
+
+
+def test_tokenize_drops_gender_tags_and_keeps_technical_terms():
+    assert tokenize('Python Entwickler (m/w/d)') == tokenize('python entwicklerin')
+    assert tokenize('C++ und C#')[0] == 'c++'
+    assert tokenize('C++ und C#')[-1] == 'c#'
+    assert tokenize('') == []
+
+
+def test_fts_query_quotes_and_deduplicates_terms():
+    assert fts_query('Entwickler Entwicklern') == '"entwickl"'
+    assert fts_query('say "hi') == '"say" OR "hi"'
+    assert fts_query('(m/w/d)') == ''
+
+
+def test_term_index_counts_query_terms_per_text():
+    index = TermIndex(['Python Entwickler', 'Java Entwicklerin', '', 'Python Python'])
+    assert len(index) == 4
+    assert index.count_matches(tokenize('Python Entwickler')).tolist() == [2, 1, 0, 1]
+    assert index.count_matches(['unbekannt']).tolist() == [0, 0, 0, 0]
@@ -0,0 +1,104 @@
+"""
+Tokenizing and German stemming for the full-text job index and ranking
+"""
+import re
+from functools import lru_cache
+from typing import Iterable, List
+
+import numpy as np
+
+from dedup import GENDER_TAG_RE
+
+WORD_RE = re.compile(r'\w+(?:[+#]+|\.\w+)*')
+UMLAUTS = str.maketrans({'ä': 'a', 'ö': 'o', 'ü': 'u', 'ß': 'ss'})
+
+_GE_PREFIX_RE = re.compile(r'^ge(.{4,})')
+# Feminine job titles: Entwicklerin(nen), Ingenieurin(nen)
+_FEMININE_RE = re.compile(r'(?<=er|ur)in(?:nen)?$')
+_DOUBLE_RE = re.compile(r'(.)\1')
+_DOUBLE_MARK_RE = re.compile(r'(.)\*')
+
+
+@lru_cache(maxsize=100000)
+def german_stem(word: str) -> str:
+    """
+    Stem of a lower-case word (CISTEM, Weissweiler & Fraser 2017)
+
+    Umlauts are folded (ä -> a), so "Führung" and "Fuhrung" share a stem, as
+    do "Entwickler", "Entwicklern" and "Entwicklers". English words are
+    stemmed too, which is harmless as long as queries use the same function.
+    Unlike plain CISTEM, feminine job titles ("Entwicklerin") are reduced to
+    the stem of the masculine form.
+    """
+    word = _FEMININE_RE.sub('', word.translate(UMLAUTS))
+    word = _GE_PREFIX_RE.sub(r'\1', word)
+    word = word.replace('sch', '$').replace('ei', '%').replace('ie', '&')
+    word = _DOUBLE_RE.sub(r'\1*', word)
+
+    while len(word) > 3:
+        if len(word) > 5 and word[-2:] in ('em', 'er', 'nd'):
+            word = word[:-2]
+        elif word[-1] in 'tesn':
+            word = word[:-1]
+        else:
+            break
+
+    word = _DOUBLE_MARK_RE.sub(r'\1\1', word)
+    return word.replace('&', 'ie').replace('%', 'ei').replace('$', 'sch')
+
+
+def tokenize(text: str) -> List[str]:
+    """Stemmed lower-case terms of a text, without gender tags like "(m/w/d)" """
+    text = GENDER_TAG_RE.sub(' ', text or '').lower()
+    return [german_stem(word) for word in WORD_RE.findall(text)]
+
+
+def index_text(text: str) -> str:
+    """Text as stored in the full-text index: its stemmed terms separated by spaces"""
+    return ' '.join(tokenize(text))
+
+
+def fts_query(text: str) -> str:
+    """
+    FTS5 MATCH expression for a user query, '' if it has no terms
+
+    Terms are quoted (so user input cannot form FTS5 syntax) and combined
+    with OR; BM25 ranks jobs matching more of them first.
+    """
+    terms = []
+    for term in tokenize(text):
+        quoted = '"' + term.replace('"', '""') + '"'
+        if quoted not in terms:
+            terms.append(quoted)
+    return ' OR '.join(terms)
+
+
+class TermIndex:
+    """
+    Stemmed terms of many texts as flat (row, term id) arrays
+
+    Each term is recorded once per text, so counting the query terms a text
+    contains is one isin() and one bincount() over all texts.
+    """
+
+    def __init__(self, texts: Iterable[str]):
+        self.vocabulary = {}
+        rows, terms = [], []
+        size = 0
+        for row, text in enumerate(texts):
+            size = row + 1
+            for term in set(tokenize(text)):
+                rows.append(row)
+                terms.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+        self.size = size
+        self.rows = np.array(rows, dtype=np.int64)
+        self.terms = np.array(terms, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def count_matches(self, terms: Iterable[str]) -> np.ndarray:
+        """Number of the given (stemmed) terms occurring in every text"""
+        ids = [self.vocabulary[term] for term in set(terms) if term in self.vocabulary]
+        hits = np.isin(self.terms, ids)
+        return np.bincount(self.rows[hits], minlength=self.size)